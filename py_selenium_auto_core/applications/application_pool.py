@@ -0,0 +1,254 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from selenium.common import TimeoutException
+
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.configurations.application_pool_configuration import ApplicationPoolConfiguration
+from py_selenium_auto_core.logging.logger import Logger
+
+
+class _PooledApplication:
+    def __init__(self, application: Application):
+        self.application = application
+        self.leases = 0
+        self.baseline_memory: Optional[float] = None
+
+
+class ApplicationPool:
+    """Keeps started applications and leases them, so application startup is not on the critical path of tests.
+    Released application is reset (cookies, storages, about:blank) and recycled when it is worn out.
+    """
+
+    _reset_storage_script = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+    _used_memory_script = (
+        "return window.performance && window.performance.memory ? window.performance.memory.usedJSHeapSize : null;"
+    )
+
+    def __init__(
+        self,
+        application_factory: Callable[[], Application],
+        configuration: ApplicationPoolConfiguration,
+    ):
+        """ApplicationPool constructor
+
+        Args:
+            application_factory: Starts a new application
+            configuration: Configuration of the pool
+        """
+        self._application_factory = application_factory
+        self._configuration = configuration
+        self._idle: List[_PooledApplication] = []
+        self._leased: Dict[int, _PooledApplication] = {}
+        self._starting = 0
+        self._condition = threading.Condition()
+        self._is_closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of started applications in the pool including leased ones"""
+        with self._condition:
+            return len(self._idle) + len(self._leased)
+
+    @property
+    def idle_count(self) -> int:
+        """Number of started applications ready to be leased"""
+        with self._condition:
+            return len(self._idle)
+
+    def prestart(self, count: int = None) -> None:
+        """Starts applications in parallel until the pool has the requested number of them
+
+        Args:
+            count: Number of applications to keep started. Default: size of the pool from the configuration
+        """
+        count = min(self._configuration.size if count is None else count, self._configuration.size)
+        with self._condition:
+            missing_count = max(count - len(self._idle) - len(self._leased) - self._starting, 0)
+            self._starting += missing_count
+        if missing_count == 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing_count) as executor:
+            futures = [executor.submit(self._start) for _ in range(missing_count)]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        for future in futures:
+            if future.exception() is None:
+                self._add_idle(future.result())
+        if errors:
+            raise errors[0]
+
+    def lease(self, timeout: float = None) -> Application:
+        """Leases healthy started application. Starts a new one if there is no idle application and the pool is not full
+
+        Args:
+            timeout: Time to wait for released application if the pool is full.
+                Default: ApplicationPoolConfiguration.lease_timeout
+
+        Returns:
+            Leased application
+
+        Exception:
+            TimeoutException: Thrown if no application has been released in time
+        """
+        timeout = self._configuration.lease_timeout if timeout is None else timeout
+        end_time = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._is_closed:
+                    raise RuntimeError("Application pool is closed")
+                if self._idle:
+                    pooled_application = self._idle.pop()
+                    is_started_by_lease = False
+                elif len(self._idle) + len(self._leased) + self._starting < self._configuration.size:
+                    self._starting += 1
+                    pooled_application = None
+                    is_started_by_lease = True
+                else:
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        raise TimeoutException(f"No application has been released to the pool in {timeout} seconds")
+                    continue
+            if is_started_by_lease:
+                pooled_application = self._start()
+                with self._condition:
+                    self._starting -= 1
+            elif self._configuration.is_health_check_enabled and not self._is_healthy(pooled_application.application):
+                Logger.debug("Idle application of the pool is not responding, it will be replaced")
+                self._dispose(pooled_application)
+                continue
+            return self._mark_leased(pooled_application)
+
+    def release(self, application: Application) -> None:
+        """Returns leased application to the pool. The application is reset or recycled if it is worn out
+
+        Args:
+            application: Leased application
+        """
+        with self._condition:
+            pooled_application = self._leased.pop(id(application), None)
+        if pooled_application is None:
+            raise ValueError("Application has not been leased from this pool")
+        is_reusable = False
+        try:
+            is_reusable = not (
+                self._is_closed
+                or self._is_worn_out(pooled_application)
+                or not self._reset(application)
+                or self._is_memory_grown(pooled_application)
+            )
+        finally:
+            # the application has left the leased ones, so waiting leases are notified whatever happens
+            if is_reusable:
+                self._add_idle(pooled_application, is_starting=False)
+            else:
+                self._dispose(pooled_application)
+
+    @contextmanager
+    def leased(self, timeout: float = None) -> Iterator[Application]:
+        """Leases the application for the duration of the scope
+
+        Args:
+            timeout: Time to wait for released application if the pool is full
+        """
+        application = self.lease(timeout)
+        try:
+            yield application
+        finally:
+            self.release(application)
+
+    def close(self) -> None:
+        """Quits idle applications. Leased applications are quit on release"""
+        with self._condition:
+            self._is_closed = True
+            idle_applications, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled_application in idle_applications:
+            self._dispose(pooled_application, notify=False)
+
+    def _start(self) -> _PooledApplication:
+        try:
+            return _PooledApplication(self._application_factory())
+        except Exception:
+            with self._condition:
+                self._starting -= 1
+                self._condition.notify()
+            raise
+
+    def _add_idle(self, pooled_application: _PooledApplication, is_starting: bool = True) -> None:
+        with self._condition:
+            if is_starting:
+                self._starting -= 1
+            self._idle.append(pooled_application)
+            self._condition.notify()
+
+    def _mark_leased(self, pooled_application: _PooledApplication) -> Application:
+        pooled_application.leases += 1
+        with self._condition:
+            self._leased[id(pooled_application.application)] = pooled_application
+        return pooled_application.application
+
+    def _is_worn_out(self, pooled_application: _PooledApplication) -> bool:
+        max_leases = self._configuration.max_leases
+        if max_leases and pooled_application.leases >= max_leases:
+            Logger.debug(f"Application of the pool has been leased {pooled_application.leases} times, recycling it")
+            return True
+        return False
+
+    def _is_memory_grown(self, pooled_application: _PooledApplication) -> bool:
+        """Memory is measured on the blank page after reset, so it does not depend on the page left by the test.
+        The first measurement is the baseline of the application
+        """
+        max_memory_growth = self._configuration.max_memory_growth
+        if not max_memory_growth:
+            return False
+        used_memory = self._get_used_memory(pooled_application.application)
+        if used_memory is None:
+            return False
+        if pooled_application.baseline_memory is None:
+            pooled_application.baseline_memory = used_memory
+            return False
+        if used_memory - pooled_application.baseline_memory > max_memory_growth:
+            Logger.debug(f"Memory of the application of the pool has grown to {used_memory} MB, recycling it")
+            return True
+        return False
+
+    def _reset(self, application: Application) -> bool:
+        """Clears storages and cookies and opens blank page. Storages are cleared first as they belong to the page"""
+        try:
+            driver = application.driver
+            driver.execute_script(self._reset_storage_script)
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            # dead driver raises connection errors of urllib3 instead of WebDriverException
+            Logger.debug("Failed to reset the application of the pool, recycling it", exc_info=e)
+            return False
+
+    def _dispose(self, pooled_application: _PooledApplication, notify: bool = True) -> None:
+        try:
+            pooled_application.application.driver.quit()
+        except Exception as e:
+            Logger.debug("Failed to quit the application of the pool", exc_info=e)
+        finally:
+            if notify:
+                with self._condition:
+                    self._condition.notify()
+
+    @staticmethod
+    def _is_healthy(application: Application) -> bool:
+        try:
+            return application.is_started and application.driver.current_url is not None
+        except Exception:
+            return False
+
+    def _get_used_memory(self, application: Application) -> Optional[float]:
+        """Gets used JS heap in megabytes if the browser reports it"""
+        try:
+            used_memory = application.driver.execute_script(self._used_memory_script)
+        except Exception:
+            return None
+        return None if used_memory is None else used_memory / 1024 / 1024
@@ -1,24 +1,102 @@
 import abc
-from typing import Callable, TypeVar
+import threading
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar
 
 from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.applications.prewarmed_application import PrewarmedApplication
+from py_selenium_auto_core.applications.services_scope import ServicesScope
 from py_selenium_auto_core.applications.startup import ServiceProvider, Startup
 
 _TServProv = TypeVar("_TServProv", bound=ServiceProvider, covariant=True)
 _TApp = TypeVar("_TApp", bound=Application, covariant=True)
 
 
+class _ProcessStorage:
+    """Stores the values as attributes of CoreServices class"""
+
+    def __init__(self, owner: type):
+        self._owner = owner
+
+    def get(self, name: str) -> Any:
+        return getattr(self._owner, name)
+
+    def set(self, name: str, value: Any):
+        setattr(self._owner, name, value)
+
+
+class _ThreadStorage:
+    """Stores the values separately for each thread"""
+
+    def __init__(self, owner: type):
+        self._local = threading.local()
+
+    def get(self, name: str) -> Any:
+        return getattr(self._local, name, None)
+
+    def set(self, name: str, value: Any):
+        setattr(self._local, name, value)
+
+
+class _ContextStorage:
+    """Stores the values separately for each context (asyncio task or thread)"""
+
+    def __init__(self, owner: type):
+        self._variables = {
+            name: ContextVar(f"{owner.__qualname__}.{name}", default=None)
+            for name in ("_app_container", "_service_provider_container")
+        }
+
+    def get(self, name: str) -> Any:
+        return self._variables[name].get()
+
+    def set(self, name: str, value: Any):
+        self._variables[name].set(value)
+
+
 class CoreServices(abc.ABC):
     _app_container: _TApp = None
     _service_provider_container: _TServProv = None
+    _services_scope: ServicesScope = ServicesScope.Process
+    _storage_types = {
+        ServicesScope.Process: _ProcessStorage,
+        ServicesScope.Thread: _ThreadStorage,
+        ServicesScope.Context: _ContextStorage,
+    }
+    _lock = threading.RLock()
+
+    @classmethod
+    def _set_services_scope(cls, scope: ServicesScope):
+        """Sets the scope of the application and the service provider.
+        Thread and Context scopes allow to run several applications in parallel within one process.
+
+        Args:
+            scope: Scope of the application and the service provider
+        """
+        cls._services_scope = scope
+
+    @classmethod
+    def _get_storage(cls):
+        """Gets the storage of the class for the current scope. Each subclass has its own storage"""
+        storage_type = cls._storage_types[cls._services_scope]
+        storage = cls.__dict__.get("_services_storage")
+        if not isinstance(storage, storage_type):
+            with cls._lock:
+                storage = cls.__dict__.get("_services_storage")
+                if not isinstance(storage, storage_type):
+                    storage = storage_type(cls)
+                    cls._services_storage = storage
+        return storage
 
     @classmethod
     def _is_application_started(cls) -> bool:
-        return cls._app_container is not None and cls._app_container.is_started
+        application = cls._get_storage().get("_app_container")
+        return application is not None and application.is_started
 
     @classmethod
     def _set_service_provider(cls, service_provider: _TServProv):
-        cls._service_provider_container = service_provider
+        cls._get_storage().set("_service_provider_container", service_provider)
 
     @classmethod
     def _get_service_provider(
@@ -26,12 +104,15 @@ class CoreServices(abc.ABC):
         application_provider: Callable[[_TServProv], _TApp],
         service_provider: Callable[[], _TServProv] = None,
     ) -> _TServProv:
-        if cls._service_provider_container is None:
-            if service_provider is not None:
-                cls._service_provider_container = service_provider()
-            elif cls._service_provider_container is None:
-                cls._service_provider_container = Startup.configure_services(application_provider)
-        return cls._service_provider_container
+        storage = cls._get_storage()
+        if storage.get("_service_provider_container") is None:
+            with cls.__get_lock():
+                if storage.get("_service_provider_container") is None:
+                    if service_provider is not None:
+                        storage.set("_service_provider_container", service_provider())
+                    else:
+                        storage.set("_service_provider_container", Startup.configure_services(application_provider))
+        return storage.get("_service_provider_container")
 
     @classmethod
     def _get_application(
@@ -39,15 +120,56 @@ class CoreServices(abc.ABC):
         application_provider: Callable[[_TServProv], _TApp],
         service_provider: Callable[[], _TServProv] = None,
     ) -> _TApp:
+        storage = cls._get_storage()
         if not cls._is_application_started():
-            cls._app_container = application_provider(
-                cls._get_service_provider(
+            # Application is shared in Process scope, so concurrent calls should not start several applications
+            with cls.__get_lock():
+                if not cls._is_application_started():
+                    storage.set(
+                        "_app_container",
+                        application_provider(
+                            cls._get_service_provider(
+                                lambda service: cls._get_application(application_provider, service_provider),
+                                service_provider,
+                            )
+                        ),
+                    )
+        return storage.get("_app_container")
+
+    @classmethod
+    def _prewarm_application(
+        cls,
+        application_provider: Callable[[_TServProv], _TApp],
+        service_provider: Callable[[], _TServProv] = None,
+    ) -> _TApp:
+        """Configures services and starts the application on a background thread.
+        The application is returned by _get_application at once, its first use waits for the start.
+
+        Args:
+            application_provider: Starts the application using configured service provider
+            service_provider: Configures service provider
+
+        Returns:
+            Application being started or already started one
+        """
+        storage = cls._get_storage()
+        with cls.__get_lock():
+            if not cls._is_application_started():
+                configured_service_provider = cls._get_service_provider(
                     lambda service: cls._get_application(application_provider, service_provider),
                     service_provider,
                 )
-            )
-        return cls._app_container
+                storage.set(
+                    "_app_container",
+                    PrewarmedApplication.start(lambda: application_provider(configured_service_provider)),
+                )
+        return storage.get("_app_container")
 
     @classmethod
     def _set_application(cls, application: _TApp):
-        cls._app_container = application
+        cls._get_storage().set("_app_container", application)
+
+    @classmethod
+    def __get_lock(cls):
+        """Gets the lock for creation of shared values. Values of other scopes are not shared, so they need no lock"""
+        return cls._lock if cls._services_scope == ServicesScope.Process else nullcontext()
@@ -0,0 +1,85 @@
+import contextvars
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from py_selenium_auto_core.applications.application import Application
+
+
+class PrewarmedApplication(Application):
+    """Handle of the application being started in background.
+    First access to the driver waits for the start and raises the exception of the start if it has failed.
+    """
+
+    def __init__(self, future: "Future[Application]"):
+        """PrewarmedApplication constructor
+
+        Args:
+            future: Future of the started application
+        """
+        self._future = future
+        self._is_failure_raised = False
+
+    @classmethod
+    def start(cls, application_factory: Callable[[], Application]) -> "PrewarmedApplication":
+        """Starts the application on a background thread
+
+        Args:
+            application_factory: Starts the application
+
+        Returns:
+            Handle of the application being started
+        """
+        future: "Future[Application]" = Future()
+        future.set_running_or_notify_cancel()
+        context = contextvars.copy_context()
+
+        def _start():
+            try:
+                future.set_result(context.run(application_factory))
+            except BaseException as e:
+                future.set_exception(e)
+
+        # Daemon thread does not delay the exit of the process if the application is never used
+        threading.Thread(target=_start, name="prewarm-application", daemon=True).start()
+        return cls(future)
+
+    @property
+    def application(self) -> Application:
+        """Gets started application waiting for the start if needed"""
+        try:
+            return self._future.result()
+        except BaseException:
+            self._is_failure_raised = True
+            raise
+
+    @property
+    def is_ready(self) -> bool:
+        """Defines if the start is over (successfully or not)"""
+        return self._future.done()
+
+    @property
+    def driver(self) -> WebDriver:
+        return self.application.driver
+
+    @property
+    def is_started(self) -> bool:
+        """Application being started is treated as started, so it is not started once again.
+        Failed application is treated as started until the failure is raised on the first use of the application
+        """
+        if not self._future.done():
+            return True
+        if self._future.exception() is not None:
+            return not self._is_failure_raised
+        return self._future.result().is_started
+
+    def set_implicit_wait_timeout(self, timeout: float):
+        self.application.set_implicit_wait_timeout(timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        # Members of the started application (e.g. quit) are available through the handle
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.application, name)
@@ -0,0 +1,12 @@
+import enum
+
+
+class ServicesScope(enum.Enum):
+    """Possible scopes of the application and the service provider stored by CoreServices"""
+
+    Process = enum.auto()
+    """Single application and service provider are shared by the whole process"""
+    Thread = enum.auto()
+    """Each thread has its own application and service provider"""
+    Context = enum.auto()
+    """Each context (e.g. asyncio task or thread) has its own application and service provider"""
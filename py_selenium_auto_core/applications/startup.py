@@ -6,9 +6,15 @@ from dependency_injector import containers
 from dependency_injector.providers import Singleton, Factory, Self
 
 from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.applications.application_pool import ApplicationPool
+from py_selenium_auto_core.applications.prewarmed_application import PrewarmedApplication
+from py_selenium_auto_core.configurations.application_pool_configuration import ApplicationPoolConfiguration
 from py_selenium_auto_core.configurations.element_cache_configuration import (
     ElementCacheConfiguration,
 )
+from py_selenium_auto_core.configurations.element_search_configuration import (
+    ElementSearchConfiguration,
+)
 from py_selenium_auto_core.configurations.logger_configuration import (
     LoggerConfiguration,
 )
@@ -16,9 +22,13 @@ from py_selenium_auto_core.configurations.retry_configuration import RetryConfig
 from py_selenium_auto_core.configurations.timeout_configuration import (
     TimeoutConfiguration,
 )
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.elements.async_element_state_provider import AsyncElementStateProvider
+from py_selenium_auto_core.elements.element_cache_registry import ElementCacheRegistry
 from py_selenium_auto_core.elements.element_factory import ElementFactory
 from py_selenium_auto_core.localization.localization_manager import LocalizationManager
 from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.locator.compiled_locator_cache import CompiledLocatorCache
 from py_selenium_auto_core.logging.logger import Logger
 from py_selenium_auto_core.utilities.action_retrier import ActionRetrier
 from py_selenium_auto_core.utilities.root_path_helper import RootPathHelper
@@ -29,7 +39,9 @@ from py_selenium_auto_core.utilities.environment_configuration import (
 from py_selenium_auto_core.utilities.file_reader import FileReader
 from py_selenium_auto_core.elements.element_finder import ElementFinder
 from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
 from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+from py_selenium_auto_core.waitings.implicit_wait_tracker import ImplicitWaitTracker
 
 
 class ServiceProvider(containers.DeclarativeContainer):
@@ -44,6 +56,15 @@ class ServiceProvider(containers.DeclarativeContainer):
         ElementCacheConfiguration,
         settings_file,
     )
+    element_search_configuration: Singleton[ElementSearchConfiguration] = Singleton(
+        ElementSearchConfiguration,
+        settings_file,
+    )
+    application_pool_configuration: Singleton[ApplicationPoolConfiguration] = Singleton(
+        ApplicationPoolConfiguration,
+        settings_file,
+    )
+    application_pool: Singleton[Optional[ApplicationPool]] = Singleton(lambda: None)
     logger_configuration: Singleton[LoggerConfiguration] = Singleton(LoggerConfiguration, settings_file)
     timeout_configuration: Singleton[TimeoutConfiguration] = Singleton(TimeoutConfiguration, settings_file)
     retry_configuration: Singleton[RetryConfiguration] = Singleton(RetryConfiguration, settings_file)
@@ -56,10 +77,46 @@ class ServiceProvider(containers.DeclarativeContainer):
     )
     action_retrier: Singleton[ActionRetrier] = Singleton(ActionRetrier, retry_configuration)
     element_action_retrier: Singleton[ElementActionRetrier] = Singleton(ElementActionRetrier, retry_configuration)
+    implicit_wait_tracker: Singleton[ImplicitWaitTracker] = Singleton(ImplicitWaitTracker, timeout_configuration)
+    element_cache_registry: Singleton[ElementCacheRegistry] = Singleton(
+        ElementCacheRegistry,
+        element_cache_configuration,
+    )
     conditional_wait: Factory[ConditionalWait] = Factory(ConditionalWait, timeout_configuration, __self__)
-    element_finder: Factory[ElementFinder] = Factory(ElementFinder, localized_logger, conditional_wait)
+    compiled_locator_cache: Singleton[CompiledLocatorCache] = Singleton(
+        CompiledLocatorCache,
+        element_search_configuration,
+    )
+    element_finder: Factory[ElementFinder] = Factory(
+        ElementFinder,
+        localized_logger,
+        conditional_wait,
+        element_search_configuration,
+    )
     element_factory: Factory[ElementFactory] = Factory(
-        ElementFactory, conditional_wait, element_finder, localization_manager
+        ElementFactory,
+        conditional_wait,
+        element_finder,
+        localization_manager,
+        localized_logger,
+        element_search_configuration,
+        compiled_locator_cache,
+    )
+    async_conditional_wait: Factory[AsyncConditionalWait] = Factory(
+        AsyncConditionalWait,
+        timeout_configuration,
+        __self__,
+    )
+    async_element_finder: Factory[AsyncElementFinder] = Factory(
+        AsyncElementFinder,
+        localized_logger,
+        async_conditional_wait,
+        element_search_configuration,
+    )
+    async_element_state_provider: Factory[AsyncElementStateProvider] = Factory(
+        AsyncElementStateProvider,
+        conditional_wait=async_conditional_wait,
+        element_finder=async_element_finder,
     )
 
 
@@ -99,6 +156,49 @@ class Startup:
 
         return service_provider
 
+    @classmethod
+    def prewarm(
+        cls,
+        service_provider: _T | ServiceProvider,
+        application_factory: Callable[[_T | ServiceProvider], Application],
+    ) -> PrewarmedApplication:
+        """Starts the application on a background thread right after services are configured.
+        Configured application provider is replaced, so the service provider returns the application being started
+
+        Args:
+            service_provider: Configured ServiceProvider
+            application_factory: Starts the application using the service provider
+
+        Returns:
+            Handle of the application being started. The first access to its driver waits for the start
+        """
+        application = PrewarmedApplication.start(lambda: application_factory(service_provider))
+        service_provider.application.override(Factory(lambda: application))
+        return application
+
+    @classmethod
+    def configure_application_pool(
+        cls,
+        service_provider: _T | ServiceProvider,
+        application_factory: Callable[[_T | ServiceProvider], Application],
+    ) -> ApplicationPool:
+        """Creates the pool of applications configured by applicationPool settings.
+        The pool is returned by the application_pool provider of the service provider
+
+        Args:
+            service_provider: Configured ServiceProvider
+            application_factory: Starts a new application using the service provider
+
+        Returns:
+            Pool of applications. Applications are started by prestart or on lease
+        """
+        application_pool = ApplicationPool(
+            lambda: application_factory(service_provider),
+            service_provider.application_pool_configuration(),
+        )
+        service_provider.application_pool.override(Singleton(lambda: application_pool))
+        return application_pool
+
     @classmethod
     def get_settings(cls, calling_root_path: str = None, executing_root_path: str = None) -> JsonSettingsFile:
         """Provides a JsonSettingsFile with settings. Value is set in configure_services
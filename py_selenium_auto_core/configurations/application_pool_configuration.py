@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from py_selenium_auto_core.configurations.base_configurations import BaseConfiguration
+from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+
+
+class ApplicationPoolConfiguration(BaseConfiguration):
+    """Provides configuration of the pool of started applications"""
+
+    def __init__(self, settings: dict | JsonSettingsFile):
+        """Instantiates class using JsonSettingsFile or dict with general settings
+
+        Args:
+            settings: Settings file
+        """
+        super().__init__(settings, "applicationPool")
+
+    @property
+    def size(self) -> int:
+        """Max number of started applications in the pool"""
+        return self._node.get_as_int("size", 1)
+
+    @property
+    def max_leases(self) -> int:
+        """Number of leases after which the application is recycled. Not limited if 0"""
+        return self._node.get_as_int("maxLeases", 0)
+
+    @property
+    def max_memory_growth(self) -> float:
+        """Growth of JS heap of the application (in megabytes) after which it is recycled. Not limited if 0"""
+        return self._node.get_as_float("maxMemoryGrowth", 0)
+
+    @property
+    def is_health_check_enabled(self) -> bool:
+        """Defines if liveness of the idle application is checked before it is leased"""
+        return self._node.get_as_bool("healthCheck", True)
+
+    @property
+    def lease_timeout(self) -> float:
+        """Max time (in seconds) to wait for an application to be released when the pool is exhausted"""
+        return self._node.get_as_float("leaseTimeout", 300)
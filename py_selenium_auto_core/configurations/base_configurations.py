@@ -13,7 +13,7 @@ class BaseConfiguration(abc.ABC):
             settings: Settings file
             node_name: Key for getting information from Json
         """
-        node: dict = self._dict_to_json_settings(settings).get(node_name)
+        node: dict = self._dict_to_json_settings(settings).get(node_name) or {}
         self._node: JsonSettingsFile = JsonSettingsFile(node)
 
     @classmethod
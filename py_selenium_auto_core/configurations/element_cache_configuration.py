@@ -17,4 +17,16 @@ class ElementCacheConfiguration(BaseConfiguration):
 
     @property
     def is_enabled(self) -> bool:
-        return self._node.get_as_bool("elementCache")
+        return self._node.get_as_bool("isEnabled", False)
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of cached elements kept for each session, 0 means the number is not limited"""
+        return self._node.get_as_int("maxSize", 1000)
+
+    @property
+    def freshness_window(self) -> float:
+        """Time in seconds cached elements of the current document are used without checking them.
+        The document is checked by a single script call per window, 0 means each cached element is checked on use
+        """
+        return self._node.get_as_float("freshnessWindow", 0)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from py_selenium_auto_core.configurations.base_configurations import BaseConfiguration
+from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+
+
+class ElementSearchConfiguration(BaseConfiguration):
+    """Provides element's search configuration"""
+
+    def __init__(self, settings: dict | JsonSettingsFile):
+        """Instantiates class using JsonSettingsFile or dict with general settings
+
+        Args:
+            settings: Settings file
+        """
+        super().__init__(settings, "elementSearch")
+
+    @property
+    def is_batch_state_evaluation_enabled(self) -> bool:
+        """Defines if states of found elements are evaluated in the browser by a single script call"""
+        return self._node.get_as_bool("batchStateEvaluation", True)
+
+    @property
+    def is_compiled_search_enabled(self) -> bool:
+        """Defines if the search by locator in built-in state is performed in the browser by a single script call"""
+        return self._node.get_as_bool("compiledSearch", False)
+
+    @property
+    def is_event_driven_waits_enabled(self) -> bool:
+        """Defines if waits for built-in element states react on DOM mutations in the browser instead of polling"""
+        return self._node.get_as_bool("eventDrivenWaits", False)
+
+    @property
+    def is_scoped_child_search_enabled(self) -> bool:
+        """Defines if child elements are searched within their parent element instead of the absolute XPath"""
+        return self._node.get_as_bool("scopedChildSearch", False)
+
+    @property
+    def is_css_locators_enabled(self) -> bool:
+        """Defines if locators are expressed by CSS selectors when it is possible (simple XPaths, child locators)"""
+        return self._node.get_as_bool("cssLocators", False)
+
+    @property
+    def compiled_locator_cache_size(self) -> int:
+        """Maximum number of generated child and index locators kept by ElementFactory, 0 disables the cache"""
+        return self._node.get_as_int("compiledLocatorCacheSize", 4096)
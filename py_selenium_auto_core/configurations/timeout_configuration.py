@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from py_selenium_auto_core.configurations.base_configurations import BaseConfiguration
 from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+from py_selenium_auto_core.waitings.polling_strategy import (
+    ExponentialBackoffPollingStrategy,
+    FixedPollingStrategy,
+    PollingStrategy,
+)
 
 
 class TimeoutConfiguration(BaseConfiguration):
@@ -17,8 +22,16 @@ class TimeoutConfiguration(BaseConfiguration):
 
     @property
     def implicit(self) -> float:
+        """Implicit wait timeout. Always 0 in explicit waits only mode"""
+        if self.is_explicit_waits_only:
+            return 0
         return self._node.get_as_float("timeoutImplicit")
 
+    @property
+    def is_explicit_waits_only(self) -> bool:
+        """Defines if implicit wait is pinned to 0 for the whole session, so waits do not toggle it"""
+        return self._node.get_as_bool("explicitWaitsOnly", False)
+
     @property
     def condition(self) -> float:
         return self._node.get_as_float("timeoutCondition")
@@ -30,3 +43,27 @@ class TimeoutConfiguration(BaseConfiguration):
     @property
     def command(self) -> float:
         return self._node.get_as_float("timeout_command")
+
+    @property
+    def polling_strategy(self) -> PollingStrategy:
+        """Strategy of intervals between checks of the condition. Interval is fixed to polling_interval by default
+
+        Settings ("pollingStrategy" node):
+            type: "fixed" or "exponentialBackoff"
+            initialInterval: Interval before the second check (exponentialBackoff). Default: 0.05
+            multiplier: Factor applied to the interval after each check (exponentialBackoff). Default: 2
+            maxInterval: Cap of the interval (exponentialBackoff). Default: polling_interval
+            jitter: Max random deviation of the interval as a fraction of it (exponentialBackoff). Default: 0
+        """
+        node = JsonSettingsFile(self._node.get("pollingStrategy") or {})
+        strategy_type = node.get("type", "fixed")
+        if strategy_type == "fixed":
+            return FixedPollingStrategy(self.polling_interval)
+        if strategy_type == "exponentialBackoff":
+            return ExponentialBackoffPollingStrategy(
+                initial_interval=node.get_as_float("initialInterval", 0.05),
+                multiplier=node.get_as_float("multiplier", 2),
+                max_interval=node.get_as_float("maxInterval", self.polling_interval),
+                jitter=node.get_as_float("jitter", 0),
+            )
+        raise ValueError(f"Polling strategy '{strategy_type}' is not supported")
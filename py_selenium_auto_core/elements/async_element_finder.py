@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, Callable, List
+
+from selenium.common import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.configurations.element_search_configuration import ElementSearchConfiguration
+from py_selenium_auto_core.elements.constants.desired_state import DesiredState
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.element_finder import _BaseElementFinder
+from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
+
+
+class AsyncElementFinder(_BaseElementFinder):
+    """Provides ability to find elements in desired ElementState within asyncio event loop.
+    Each poll of the search is run in the executor, waits between polls do not block the loop
+    """
+
+    def __init__(
+        self,
+        logger: LocalizedLogger,
+        conditional_wait: AsyncConditionalWait,
+        element_search_configuration: ElementSearchConfiguration = None,
+    ):
+        super().__init__(logger, conditional_wait, element_search_configuration)
+        self._conditional_wait: AsyncConditionalWait = conditional_wait
+
+    @classmethod
+    def of(cls, element_finder: _BaseElementFinder, conditional_wait: AsyncConditionalWait) -> AsyncElementFinder:
+        """Creates asynchronous finder with the same configuration as the given finder
+
+        Args:
+            element_finder: Finder to take logger and search configuration from
+            conditional_wait: Asynchronous wait used by the search
+        """
+        return cls(element_finder._logger, conditional_wait, element_finder._search_configuration)
+
+    async def find_element(
+        self,
+        locator: Locator,
+        state: ElementState | Callable[[WebElement], bool] = ElementState.ExistsInAnyState,
+        state_name: str = "desired",
+        timeout: float = None,
+        name: str = None,
+    ) -> WebElement:
+        """Finds element
+
+        Args:
+            locator: Element locator
+            state: Desired ElementState or predicate to define element state
+            state_name: Predicate to define element state
+            timeout: Timeout for search
+            name: Element name to be used for logging and exception message
+
+        Returns:
+            Found element
+
+        Exception:
+            NoSuchElementException: Thrown if element was not found in time in desired state
+        """
+        if isinstance(state, ElementState):
+            desired_state = self._resolve_state(state)
+        elif isinstance(state, Callable):
+            desired_state = DesiredState(state, state_name)
+        else:
+            raise ValueError("Incorrect type of state")
+
+        desired_state.is_catching_timeout_exception = False
+        desired_state.is_throwing_no_such_element_exception = True
+        found_elements = await self._find_elements(
+            locator=locator,
+            state=desired_state,
+            timeout=timeout,
+            name=name,
+            is_first_match_enough=True,
+        )
+        return found_elements[0]
+
+    async def find_elements(
+        self,
+        locator: Locator,
+        state: ElementState | DesiredState | Callable[[Any], bool] = ElementState.ExistsInAnyState,
+        timeout: float = None,
+        name: str = None,
+        is_first_match_enough: bool = False,
+    ) -> List[WebElement]:
+        """Finds elements
+
+        Args:
+            locator: Elements locator
+            state: Desired ElementState or predicate to define element state
+            timeout: Timeout for search
+            name: Element name to be used for logging and exception message
+            is_first_match_enough: Stops the search on the first element in desired state
+
+        Returns:
+            List of found elements
+        """
+        if isinstance(state, ElementState):
+            desired_state = self._resolve_state(state)
+            desired_state.is_catching_timeout_exception = True
+        elif isinstance(state, Callable):
+            desired_state = DesiredState(state, "desired")
+            desired_state.is_catching_timeout_exception = True
+        elif isinstance(state, DesiredState):
+            desired_state = state
+        else:
+            raise ValueError("Incorrect type of state")
+        return await self._find_elements(locator, desired_state, timeout, name, is_first_match_enough)
+
+    async def count_elements(
+        self,
+        locator: Locator,
+        state: ElementState | DesiredState | Callable[[WebElement], bool] = ElementState.ExistsInAnyState,
+    ) -> int:
+        """Counts elements in desired state by a single search without waiting
+
+        Args:
+            locator: Elements locator
+            state: Desired ElementState or predicate to define element state
+
+        Returns:
+            Count of elements in desired state
+        """
+        desired_state = self._resolve_count_state(state)
+        search_locator = self._get_search_locator(locator)
+        try:
+            result = await self._conditional_wait.wait_for_driver(
+                lambda driver: (self._count_elements_once_again_if_stale(driver, search_locator, desired_state),),
+                timeout=0,
+            )
+        except TimeoutException:
+            # Elements kept becoming stale, so none of them is counted the same way as find_elements does
+            return 0
+        return result[0]
+
+    async def wait_for_state_by_events(
+        self,
+        locator: Locator,
+        state: DesiredState,
+        is_expected: bool = True,
+        timeout: float = None,
+    ) -> None:
+        """Waits in the browser until any element is in desired state reacting on DOM mutations instead of polling
+
+        Args:
+            locator: Elements locator
+            state: Desired state of elements with script condition
+            is_expected: Waits for any element in desired state if true and for absence of such elements otherwise
+            timeout: Timeout for waiting
+
+        Exception:
+            TimeoutException: Thrown if elements have not reached desired state in time
+            WebDriverException: Thrown if the driver does not support asynchronous scripts
+        """
+        if is_expected:
+            message = f"No elements with locator '{locator.by}: {locator.value}' were found in {state.state_name} state"
+        else:
+            message = f"Elements with locator '{locator.by}: {locator.value}' are still in {state.state_name} state"
+        search_locator = self._get_search_locator(locator)
+        await self._conditional_wait.wait_for_async_script(
+            script=self._compiled_search.get_wait_script(state),
+            args=[search_locator.by, search_locator.value, is_expected],
+            timeout=timeout,
+            message=message,
+        )
+
+    async def _find_elements(
+        self,
+        locator: Locator,
+        state: DesiredState,
+        timeout: float,
+        name: str,
+        is_first_match_enough: bool = False,
+    ) -> List[WebElement]:
+        found_elements_count = [0]
+        result_elements: List[WebElement] = []
+        search_locator = self._get_search_locator(locator)
+        search = self._resolve_search(search_locator, state)
+
+        try:
+
+            def predicate(driver: WebDriver) -> bool:
+                found_elements_count[0], result_elements[:] = search(
+                    driver, search_locator, state, is_first_match_enough
+                )
+                return len(result_elements) > 0
+
+            await self._conditional_wait.wait_for_driver(predicate, timeout)
+        except TimeoutException as e:
+            self._handle_timeout_exception(e, state, locator, found_elements_count[0], name)
+        return result_elements
@@ -0,0 +1,253 @@
+from typing import Awaitable, Callable
+
+from selenium.common import TimeoutException, WebDriverException
+
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.elements.constants.desired_state import DesiredState
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.element_state_provider import _BaseElementStateProvider
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
+
+
+class AsyncElementStateProvider(_BaseElementStateProvider):
+    """Asynchronous counterpart of ElementStateProvider to be used within asyncio event loop"""
+
+    def __init__(
+        self,
+        locator: Locator,
+        conditional_wait: AsyncConditionalWait,
+        element_finder: AsyncElementFinder,
+        log_element_state: Callable[[str, str], None],
+    ):
+        super().__init__(locator, conditional_wait, element_finder, log_element_state)
+        self._conditional_wait: AsyncConditionalWait = conditional_wait
+        self._element_finder: AsyncElementFinder = element_finder
+
+    async def is_displayed(self) -> bool:
+        """Gets element's displayed state: true if displayed and false otherwise"""
+        return await self.wait_for_displayed(0)
+
+    async def is_exist(self) -> bool:
+        """Gets element's exist state: true if element exists in DOM (without visibility check) and false otherwise"""
+        return await self.wait_for_exist(0)
+
+    async def is_enabled(self) -> bool:
+        """Gets element's Enabled state, which means element is Enabled and does not have "disabled" class:
+        true if enabled, false otherwise.
+        """
+        return await self.wait_for_enabled(0)
+
+    async def is_clickable(self) -> bool:
+        """Gets element's clickable state, which means element is displayed and enabled:
+        true if element is clickable, false otherwise
+        """
+        return await self.__is_element_clickable(0, True)
+
+    async def wait_for_displayed(self, timeout: float = None) -> bool:
+        """Waits for element is displayed on the page
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element displayed after waiting, false otherwise
+        """
+
+        async def _predicate():
+            return await self.__is_any_element_found(timeout, ElementState.Displayed)
+
+        return await self.__do_and_log_wait_for_state(_predicate, "displayed", timeout)
+
+    async def wait_for_not_displayed(self, timeout: float = None) -> bool:
+        """Waits for element is not displayed on the page
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element does not display after waiting, false otherwise
+        """
+
+        async def _is_not_displayed():
+            return not await self.is_displayed()
+
+        async def _predicate():
+            return await self.__wait_for_state(
+                self._element_finder.resolve_state(ElementState.Displayed),
+                False,
+                timeout,
+                lambda poll_timeout: self._conditional_wait.wait_for_condition(_is_not_displayed, poll_timeout),
+            )
+
+        return await self.__do_and_log_wait_for_state(_predicate, "not.displayed", timeout)
+
+    async def wait_for_exist(self, timeout: float = None) -> bool:
+        """Waits for element exists in DOM (without visibility check)
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element exist after waiting, false otherwise
+        """
+
+        async def _predicate():
+            return await self.__is_any_element_found(timeout, ElementState.ExistsInAnyState)
+
+        return await self.__do_and_log_wait_for_state(_predicate, "exist", timeout)
+
+    async def wait_for_not_exist(self, timeout: float = None) -> bool:
+        """Waits for element does not exist in DOM (without visibility check)
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element does not exist after waiting, false otherwise
+        """
+
+        async def _is_not_exist():
+            return not await self.is_exist()
+
+        async def _predicate():
+            return await self.__wait_for_state(
+                self._element_finder.resolve_state(ElementState.ExistsInAnyState),
+                False,
+                timeout,
+                lambda poll_timeout: self._conditional_wait.wait_for_condition(_is_not_exist, poll_timeout),
+            )
+
+        return await self.__do_and_log_wait_for_state(_predicate, "not.exist", timeout)
+
+    async def wait_for_enabled(self, timeout: float = None) -> bool:
+        """Waits for element is enabled state which means element is Enabled and does not have "disabled" class
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if enabled, false otherwise
+
+        Exception:
+            NoSuchElementException: Throws when timeout exceeded and element not found
+        """
+
+        async def _predicate():
+            return await self.__is_element_in_desired_condition(timeout, self._get_enabled_state(True))
+
+        return await self.__do_and_log_wait_for_state(_predicate, "enabled", timeout)
+
+    async def wait_for_not_enabled(self, timeout: float = None) -> bool:
+        """Waits for element is not enabled state which means element is not Enabled or does have "disabled" class
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if not enabled, false otherwise
+
+        Exception:
+            NoSuchElementException: Throws when timeout exceeded and element not found
+        """
+
+        async def _predicate():
+            return await self.__is_element_in_desired_condition(timeout, self._get_enabled_state(False))
+
+        return await self.__do_and_log_wait_for_state(_predicate, "not.enabled", timeout)
+
+    async def wait_for_clickable(self, timeout: float = None):
+        """Waits for element to become clickable which means element is displayed and enabled
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Exception:
+            TimeoutException: Throws when timeout exceeded and element is not clickable
+        """
+        try:
+            self._log_wait_for_state("clickable")
+            await self.__is_element_clickable(timeout, False)
+        except Exception:
+            self._log_wait_for_state("clickable", is_failed=True)
+            raise
+
+    async def wait_for_count(
+        self,
+        predicate: Callable[[int], bool],
+        timeout: float = None,
+        state: ElementState = ElementState.ExistsInAnyState,
+    ) -> bool:
+        """Waits for the count of elements found by the locator to satisfy the predicate
+
+        Args:
+            predicate: Condition for the count, e.g. lambda count: count == 20
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+            state: State of elements to count
+
+        Returns:
+            True if the count satisfied the predicate, false otherwise
+        """
+
+        async def _predicate():
+            return predicate(await self._element_finder.count_elements(self._locator, state))
+
+        return await self.__do_and_log_wait_for_state(_predicate, "count", timeout, is_single_check=True)
+
+    async def __is_element_clickable(self, timeout: float, catch_exception: bool) -> bool:
+        return await self.__is_element_in_desired_condition(timeout, self._get_clickable_state(catch_exception))
+
+    async def __is_element_in_desired_condition(self, timeout: float, element_state: DesiredState) -> bool:
+        async def _poll(poll_timeout: float) -> bool:
+            return any(
+                await self._element_finder.find_elements(
+                    self._locator, element_state, poll_timeout, is_first_match_enough=True
+                )
+            )
+
+        return await self.__wait_for_state(element_state, True, timeout, _poll)
+
+    async def __is_any_element_found(self, timeout: float, state: ElementState) -> bool:
+        async def _poll(poll_timeout: float) -> bool:
+            return any(
+                await self._element_finder.find_elements(self._locator, state, poll_timeout, is_first_match_enough=True)
+            )
+
+        return await self.__wait_for_state(self._element_finder.resolve_state(state), True, timeout, _poll)
+
+    async def __wait_for_state(
+        self,
+        state: DesiredState,
+        is_expected: bool,
+        timeout: float,
+        poll: Callable[[float], Awaitable[bool]],
+    ) -> bool:
+        """Waits for the state reacting on DOM mutations in the browser when it is possible, otherwise polls it"""
+        if not self._is_waiting_by_events(state, timeout):
+            return await poll(timeout)
+        try:
+            await self._element_finder.wait_for_state_by_events(self._locator, state, is_expected, timeout)
+            return True
+        except TimeoutException as e:
+            try:
+                return await poll(0)
+            except TimeoutException:
+                raise e
+        except WebDriverException:
+            return await poll(timeout)
+
+    async def __do_and_log_wait_for_state(
+        self,
+        function: Callable[[], Awaitable[bool]],
+        msg_key: str,
+        timeout: float = None,
+        is_single_check: bool = False,
+    ) -> bool:
+        if self._is_checked_once(timeout, is_single_check):
+            return await function()
+
+        self._log_wait_for_state(msg_key)
+        result = await self._conditional_wait.wait_for_condition(function, timeout)
+        if not result:
+            self._log_wait_for_state(msg_key, is_failed=True)
+        return result
@@ -1,11 +1,19 @@
-from typing import Callable
+from typing import Callable, List, Type
 
+from selenium.common import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.elements.constants.element_state import ElementState
 from py_selenium_auto_core.elements.element_cache_handler import ElementCacheHandler
 from py_selenium_auto_core.locator.locator import Locator
 from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
 
 
 class CachedElementStateProvider:
+    """Provides ability to define state of the cached element. States are checked on the cached reference,
+    the element is found again only when the reference is stale
+    """
+
     def __init__(
         self,
         locator: Locator,
@@ -17,3 +25,162 @@ class CachedElementStateProvider:
         self._conditional_wait = conditional_wait
         self._element_cache_handler = element_cache_handler
         self._log_element_state = log_element_state
+
+    def is_displayed(self) -> bool:
+        """Gets element's displayed state: true if displayed and false otherwise"""
+        return self.__try_invoke_function(lambda element: element.is_displayed())
+
+    def is_exist(self) -> bool:
+        """Gets element's exist state: true if element exists in DOM (without visibility check) and false otherwise"""
+        return self.__try_invoke_function(self.__is_element_attached)
+
+    def is_enabled(self) -> bool:
+        """Gets element's Enabled state, which means element is Enabled and does not have "disabled" class:
+        true if enabled, false otherwise.
+
+        Exception:
+            NoSuchElementException: Throws when element not found
+        """
+        return self.__try_invoke_function(
+            lambda element: self.__is_element_enabled(element), [StaleElementReferenceException]
+        )
+
+    def is_clickable(self) -> bool:
+        """Gets element's clickable state, which means element is displayed and enabled:
+        true if element is clickable, false otherwise
+        """
+        return self.__try_invoke_function(lambda element: element.is_displayed() and element.is_enabled())
+
+    def wait_for_displayed(self, timeout: float = None) -> bool:
+        """Waits for element is displayed on the page
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element displayed after waiting, false otherwise
+        """
+        return self.__wait_for_condition(lambda: self.is_displayed(), "displayed", timeout)
+
+    def wait_for_not_displayed(self, timeout: float = None) -> bool:
+        """Waits for element is not displayed on the page
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element does not display after waiting, false otherwise
+        """
+        return self.__wait_for_condition(lambda: not self.is_displayed(), "not.displayed", timeout)
+
+    def wait_for_exist(self, timeout: float = None) -> bool:
+        """Waits for element exists in DOM (without visibility check)
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element exist after waiting, false otherwise
+        """
+        return self.__wait_for_condition(lambda: self.is_exist(), "exist", timeout)
+
+    def wait_for_not_exist(self, timeout: float = None) -> bool:
+        """Waits for element does not exist in DOM (without visibility check)
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if element does not exist after waiting, false otherwise
+        """
+        return self.__wait_for_condition(lambda: not self.is_exist(), "not.exist", timeout)
+
+    def wait_for_enabled(self, timeout: float = None) -> bool:
+        """Waits for element is enabled state which means element is Enabled and does not have "disabled" class
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if enabled, false otherwise
+
+        Exception:
+            NoSuchElementException: Throws when element not found
+        """
+        return self.__wait_for_condition(lambda: self.is_enabled(), "enabled", timeout)
+
+    def wait_for_not_enabled(self, timeout: float = None) -> bool:
+        """Waits for element is not enabled state which means element is not Enabled or does have "disabled" class
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Returns:
+            True if not enabled, false otherwise
+
+        Exception:
+            NoSuchElementException: Throws when element not found
+        """
+        return self.__wait_for_condition(lambda: not self.is_enabled(), "not.enabled", timeout)
+
+    def wait_for_clickable(self, timeout: float = None):
+        """Waits for element to become clickable which means element is displayed and enabled
+
+        Args:
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+
+        Exception:
+            TimeoutException: Throws when timeout exceeded and element is not clickable
+        """
+        condition_key = "loc.el.state.clickable"
+        try:
+            self._log_element_state("loc.wait.for.state", condition_key)
+            self._conditional_wait.wait_for_true(lambda: self.is_clickable(), timeout)
+        except TimeoutException:
+            self._log_element_state("loc.wait.for.state.failed", condition_key)
+            raise
+
+    def __try_invoke_function(
+        self,
+        function: Callable[[WebElement], bool],
+        handled_exceptions: List[Type[Exception]] = None,
+    ) -> bool:
+        """Checks the cached element. The element is found again without waiting only if the reference is stale"""
+        handled_exceptions = handled_exceptions or [StaleElementReferenceException, NoSuchElementException]
+        try:
+            return self.__invoke_on_element(function)
+        except Exception as e:
+            if any(isinstance(e, exception) for exception in handled_exceptions):
+                return False
+            raise
+
+    def __invoke_on_element(self, function: Callable[[WebElement], bool]) -> bool:
+        """Kept reference is checked by the function itself without probing it first, staleness is the failure signal"""
+        cached_element = self._element_cache_handler.cached_element
+        if cached_element is not None:
+            try:
+                return function(cached_element)
+            except StaleElementReferenceException:
+                self._element_cache_handler.mark_stale()
+        return function(self._element_cache_handler.get_element(0, ElementState.ExistsInAnyState))
+
+    def __wait_for_condition(self, condition: Callable[[], bool], state_key: str, timeout: float = None) -> bool:
+        if timeout == 0:
+            return condition()
+
+        condition_key = f"loc.el.state.{state_key}"
+        self._log_element_state("loc.wait.for.state", condition_key)
+        result = self._conditional_wait.wait_for_condition(condition, timeout)
+        if not result:
+            self._log_element_state("loc.wait.for.state.failed", condition_key)
+        return result
+
+    @staticmethod
+    def __is_element_attached(element: WebElement) -> bool:
+        # any call on the reference raises StaleElementReferenceException if the element is removed from the document
+        element.is_enabled()
+        return True
+
+    @staticmethod
+    def __is_element_enabled(element: WebElement) -> bool:
+        return element.is_enabled() and "disabled" not in element.get_attribute("class")
@@ -0,0 +1,93 @@
+from typing import List, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.elements.constants.desired_state import DesiredState
+from py_selenium_auto_core.elements.element_state_evaluator import build_state_script
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.locator.scoped_locator import ScopedLocator
+from py_selenium_auto_core.utilities.java_script import JavaScript
+
+
+class CompiledElementSearch:
+    """Finds elements by locator and filters them by built-in state in the browser,
+    so each search costs a single execute_script call
+    """
+
+    _supported_locators = (
+        By.XPATH,
+        By.CSS_SELECTOR,
+        By.ID,
+        By.NAME,
+        By.CLASS_NAME,
+        By.TAG_NAME,
+    )
+
+    def is_supported(self, locator: Locator, state: DesiredState) -> bool:
+        """Checks that the search by locator in desired state can be compiled into a script
+
+        Args:
+            locator: Elements locator
+            state: Desired state of elements
+
+        Returns:
+            True if locator strategy is supported and state has script condition, false otherwise
+        """
+        # scoped locators are searched within the parent element by the driver
+        return (
+            locator.by in self._supported_locators
+            and state.script_condition is not None
+            and not isinstance(locator, ScopedLocator)
+        )
+
+    def find(
+        self,
+        driver: WebDriver,
+        locator: Locator,
+        state: DesiredState,
+        is_first_match_enough: bool = False,
+    ) -> Tuple[int, List[WebElement]]:
+        """Finds elements in desired state
+
+        Args:
+            driver: Instance of driver
+            locator: Elements locator
+            state: Desired state of elements with script condition
+            is_first_match_enough: Stops the search on the first element in desired state
+
+        Returns:
+            Count of elements found by locator and list of elements in desired state
+        """
+        script = build_state_script(JavaScript.FindElementsInState, state.script_condition)
+        found_count, elements = driver.execute_script(script, locator.by, locator.value, is_first_match_enough)
+        return int(found_count), list(elements)
+
+    def count(self, driver: WebDriver, locator: Locator, state: DesiredState) -> int:
+        """Counts elements in desired state without transferring references to them
+
+        Args:
+            driver: Instance of driver
+            locator: Elements locator
+            state: Desired state of elements with script condition
+
+        Returns:
+            Count of elements in desired state
+        """
+        script = build_state_script(JavaScript.CountElementsInState, state.script_condition)
+        return int(driver.execute_script(script, locator.by, locator.value))
+
+    @staticmethod
+    def get_wait_script(state: DesiredState) -> str:
+        """Gets asynchronous script that waits for elements in desired state reacting on DOM mutations.
+        Script arguments: locator strategy, locator value, whether any element is expected to be in the state
+        (true) or no element is expected (false) and duration of the run in milliseconds
+
+        Args:
+            state: Desired state of elements with script condition
+
+        Returns:
+            Text of the script
+        """
+        return build_state_script(JavaScript.WaitForElementsState, state.script_condition)
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from selenium.webdriver.remote.webelement import WebElement
 
@@ -6,8 +6,22 @@ from selenium.webdriver.remote.webelement import WebElement
 class DesiredState:
     """Defines desired state for element with ability to handle exceptions"""
 
-    def __init__(self, function_condition: Callable[[WebElement], bool], state_name: str):
+    def __init__(
+        self,
+        function_condition: Callable[[WebElement], bool],
+        state_name: str,
+        script_condition: Optional[str] = None,
+    ):
+        """DesiredState constructor
+
+        Args:
+            function_condition: Predicate to define element state
+            state_name: Name of the state to be used for logging and exception message
+            script_condition: JavaScript equivalent of function_condition (see ElementStateScript).
+                Allows to evaluate the state of all found elements in the browser by a single command
+        """
         self.element_state_condition: Callable[[WebElement], bool] = function_condition
         self.state_name: str = state_name
+        self.script_condition: Optional[str] = script_condition
         self.is_catching_timeout_exception: bool = False
         self.is_throwing_no_such_element_exception: bool = False
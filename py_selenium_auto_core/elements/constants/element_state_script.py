@@ -0,0 +1,10 @@
+class ElementStateScript:
+    """JavaScript conditions of built-in element states.
+    Condition is evaluated in the browser for the 'element' variable
+    """
+
+    Displayed = "isDisplayed(element)"
+    ExistsInAnyState = "true"
+    Enabled = "isEnabled(element) && hasNoDisabledClass(element)"
+    NotEnabled = "!(isEnabled(element) && hasNoDisabledClass(element))"
+    Clickable = "isDisplayed(element) && isEnabled(element)"
@@ -1,7 +1,7 @@
 import abc
-from typing import Any, Callable, Optional, TYPE_CHECKING, Type, TypeVar, List
+from typing import Any, Callable, List, Optional, TYPE_CHECKING, Type, TypeVar
 
-from selenium.common import WebDriverException, NoSuchElementException
+from selenium.common import WebDriverException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
 
 from py_selenium_auto_core.applications.application import Application
@@ -11,17 +11,23 @@ from py_selenium_auto_core.configurations.element_cache_configuration import (
 from py_selenium_auto_core.configurations.logger_configuration import (
     LoggerConfiguration,
 )
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.elements.async_element_state_provider import AsyncElementStateProvider
+from py_selenium_auto_core.elements.cached_element_state_provider import CachedElementStateProvider
 from py_selenium_auto_core.elements.constants.element_state import ElementState
 from py_selenium_auto_core.elements.constants.elements_count import ElementsCount
 from py_selenium_auto_core.elements.element_cache_handler import ElementCacheHandler
+from py_selenium_auto_core.elements.element_cache_registry import ElementCacheRegistry
 
 from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.elements.element_list import ElementList
 from py_selenium_auto_core.elements.element_state_provider import ElementStateProvider
 from py_selenium_auto_core.localization.localization_manager import LocalizationManager
 from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
 from py_selenium_auto_core.locator.locator import Locator
 from py_selenium_auto_core.logging.logger import Logger
 from py_selenium_auto_core.utilities.action_retrier import ActionRetrier
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
 from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
 
 if TYPE_CHECKING:
@@ -31,7 +37,12 @@ T = TypeVar("T", bound="CoreElement", covariant=True)
 
 
 class CoreElement(abc.ABC):
-    """Describes behavior of any UI element"""
+    """Describes behavior of any UI element.
+    State of the element is kept in slots, so subclasses that declare __slots__ (e.g. __slots__ = ()) have no
+    instance __dict__. Subclasses without __slots__ keep working as usual
+    """
+
+    __slots__ = ("locator", "name", "_element_state", "_element_cache_handler", "__weakref__")
 
     def __init__(self, locator: Locator, name: str, element_state: ElementState):
         """CoreElement constructor
@@ -50,9 +61,16 @@ class CoreElement(abc.ABC):
     def state(self):
         """Gets element state"""
         if self.cache_configuration.is_enabled:
-            raise NotImplementedError
+            return CachedElementStateProvider(self.locator, self.conditional_wait, self.cache, self.log_element_state)
         return ElementStateProvider(self.locator, self.conditional_wait, self.finder, self.log_element_state)
 
+    @property
+    def async_state(self) -> AsyncElementStateProvider:
+        """Gets element state to be awaited within asyncio event loop"""
+        return AsyncElementStateProvider(
+            self.locator, self.async_conditional_wait, self.async_element_finder, self.log_element_state
+        )
+
     @property
     def visual(self):
         """Gets element visual state"""
@@ -61,10 +79,35 @@ class CoreElement(abc.ABC):
     @property
     def cache(self) -> ElementCacheHandler:
         """Gets element cache handler"""
+        if self.__is_cache_registry_used:
+            return self.element_cache_registry.get_handler(
+                self.application, self.locator, self.name, self._element_state, self.finder
+            )
         if self._element_cache_handler is None:
             self._element_cache_handler = ElementCacheHandler(self.locator, self.name, self._element_state, self.finder)
         return self._element_cache_handler
 
+    @property
+    def element_cache_registry(self) -> Optional[ElementCacheRegistry]:
+        """Gets registry of cached elements shared within the session.
+        Element keeps its own cache handler if there is no registry
+        """
+        return None
+
+    @property
+    def async_conditional_wait(self) -> AsyncConditionalWait:
+        """Gets wait for conditions within asyncio event loop used by async_state.
+        It is built from the configuration of conditional_wait by default
+        """
+        return AsyncConditionalWait.of(self.conditional_wait)
+
+    @property
+    def async_element_finder(self) -> AsyncElementFinder:
+        """Gets finder of elements within asyncio event loop used by async_state.
+        It is built from the configuration of finder by default
+        """
+        return AsyncElementFinder.of(self.finder, self.async_conditional_wait)
+
     @property
     @abc.abstractmethod
     def action_retrier(self) -> ActionRetrier:
@@ -158,6 +201,9 @@ class CoreElement(abc.ABC):
                     Locator(By.XPATH, "div") or Locator(By.XPATH, "div[@id]")
                     Locator(By.CLASS_NAME, "class_name")
                     Locator(By.TAG_NAME, "tag_name")
+                Any locator strategy (e.g. Locator(By.CSS_SELECTOR, "div > span")) is supported
+                if scopedChildSearch is enabled, or if cssLocators is enabled and the parent locator can be
+                expressed by CSS selector
             name: Child element name
             state: Child element state
 
@@ -173,7 +219,7 @@ class CoreElement(abc.ABC):
         name: str = None,
         expected_count: ElementsCount = ElementsCount.Any,
         state: ElementState = ElementState.Displayed,
-    ) -> List[T]:
+    ) -> ElementList[T]:
         """Finds list of child elements by their locator relative to parent element
 
         Args:
@@ -185,12 +231,15 @@ class CoreElement(abc.ABC):
                     Locator(By.XPATH, "div") or Locator(By.XPATH, "div[@id]")
                     Locator(By.CLASS_NAME, "class_name")
                     Locator(By.TAG_NAME, "tag_name")
+                Any locator strategy (e.g. Locator(By.CSS_SELECTOR, "div > span")) is supported
+                if scopedChildSearch is enabled, or if cssLocators is enabled and the parent locator can be
+                expressed by CSS selector
             name: Child elements name
             expected_count: Expected number of elements that have to be found (zero, more then zero, any)
             state: Child elements state
 
         Returns:
-            List of child elements
+            Lazy list of child elements
         """
         return self.factory.find_child_elements(element_type, self, child_locator, name, expected_count, state)
 
@@ -214,7 +263,7 @@ class CoreElement(abc.ABC):
             NoSuchElementException: Thrown when no elements found
         """
         try:
-            if self.cache_configuration.is_enabled:
+            if self.cache_configuration.is_enabled or self.__is_bound:
                 return self.cache.get_element(timeout)
             return self.finder.find_element(
                 locator=self.locator,
@@ -227,6 +276,34 @@ class CoreElement(abc.ABC):
                 self.log_page_source(e)
             raise e
 
+    def find_web_elements_within(self, by: str, value: str) -> List[WebElement]:
+        """Finds web elements within the subtree of the current element.
+        Cached reference of the current element is used if there is one, otherwise the element is found without waiting
+
+        Args:
+            by: Locator strategy of the elements
+            value: Locator of the elements relative to the current element
+
+        Returns:
+            Found web elements
+
+        Exception:
+            NoSuchElementException: Thrown when the current element is not found
+            StaleElementReferenceException: Thrown when the current element has become stale
+        """
+        is_cached = self.cache_configuration.is_enabled or self.__is_bound
+        if is_cached:
+            search_context = self.cache.get_element(0)
+        else:
+            search_context = self.finder.find_element(self.locator, self._element_state, timeout=0, name=self.name)
+        try:
+            return search_context.find_elements(by=by, value=value)
+        except StaleElementReferenceException:
+            # the reference is dropped, so the next search finds the current element again
+            if is_cached:
+                self.cache.invalidate()
+            raise
+
     def log_page_source(self, exception: WebDriverException):
         try:
             self.logger.debug(f"Page source:{self.application.driver.page_source}", exc_info=exception)
@@ -248,7 +325,29 @@ class CoreElement(abc.ABC):
         self.do_with_retry(lambda: self.get_element().send_keys(value))
 
     def do_with_retry(self, function) -> Any:
-        return self.action_retrier.do_with_retry(function)
+        def _function():
+            try:
+                return function()
+            except StaleElementReferenceException:
+                # Cached reference is not valid anymore, so the element is found by its locator
+                if self.cache_configuration.is_enabled or self.__is_bound:
+                    self.cache.invalidate()
+                raise
+
+        # element is found again by the next attempt, so there is no need to wait before the first retry
+        return self.action_retrier.do_with_retry(
+            _function, recover=lambda e: isinstance(e, StaleElementReferenceException)
+        )
+
+    @property
+    def __is_bound(self) -> bool:
+        if self.__is_cache_registry_used:
+            return self.cache.is_bound
+        return self._element_cache_handler is not None and self._element_cache_handler.is_bound
+
+    @property
+    def __is_cache_registry_used(self) -> bool:
+        return self.cache_configuration.is_enabled and self.element_cache_registry is not None
 
     def log_element_action(self, message_key: str, *args):
         self.localized_logger.info_element_action(self.element_type, self.name, message_key, *args)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from selenium.webdriver.remote.webelement import WebElement
 
@@ -10,17 +10,75 @@ from py_selenium_auto_core.locator.locator import Locator
 class ElementCacheHandler:
     """Allows to use cached element"""
 
-    def __init__(self, locator: Locator, name: str, state: ElementState, finder: ElementFinder):
+    __slots__ = (
+        "_locator",
+        "_name",
+        "_state",
+        "_element_finder",
+        "_on_stale",
+        "_is_document_current",
+        "_element",
+        "_is_bound",
+    )
+
+    def __init__(
+        self,
+        locator: Locator,
+        name: str,
+        state: ElementState,
+        finder: ElementFinder,
+        on_stale: Callable[[], None] = None,
+        is_document_current: Callable[[], bool] = None,
+    ):
         self._locator = locator
         self._name = name
         self._state = state
         self._element_finder = finder
+        self._on_stale = on_stale
+        self._is_document_current = is_document_current
         self._element: Optional[WebElement] = None
+        self._is_bound = False
+
+    @property
+    def is_cached(self) -> bool:
+        """Determines if the handler keeps a reference to found element"""
+        return self._element is not None
+
+    @property
+    def cached_element(self) -> Optional[WebElement]:
+        """Gets kept reference without checks, None if there is no one"""
+        return self._element
 
     @property
     def is_stale(self) -> bool:
         """Determines is the element stale"""
-        return self._element is not None and self.is_refresh_needed()
+        return self._element is not None and self.__is_element_not_in_state()
+
+    @property
+    def is_bound(self) -> bool:
+        """Determines if the handler keeps a trusted reference to already found element"""
+        return self._is_bound
+
+    def bind(self, element: WebElement) -> None:
+        """Keeps a trusted reference to already found element.
+        It is returned without checks until it is invalidated, e.g. when an action on it fails as stale
+
+        Args:
+            element: Found element
+        """
+        self._element = element
+        self._is_bound = True
+
+    def invalidate(self) -> None:
+        """Drops the reference, so the element is found by locator next time"""
+        self._element = None
+        self._is_bound = False
+
+    def mark_stale(self) -> None:
+        """Drops the reference that has become stale, so the element is found by locator next time"""
+        self.invalidate()
+        if self._on_stale is not None:
+            self._on_stale()
 
     def is_refresh_needed(self, custom_sate: ElementState = None) -> bool:
         """Determines is the cached element refresh needed
@@ -30,12 +88,24 @@ class ElementCacheHandler:
         """
         if self._element is None:
             return True
+        if custom_sate is None and (self._is_bound or self.__is_trusted()):
+            return False
+        # trust check could drop the reference if the document has changed
+        return self._element is None or self.__is_element_not_in_state(custom_sate)
+
+    def __is_trusted(self) -> bool:
+        """Element found in the current document is used without checking, its staleness is detected by the action"""
+        return self._is_document_current is not None and self._is_document_current()
+
+    def __is_element_not_in_state(self, custom_sate: ElementState = None) -> bool:
         try:
             is_displayed = self._element.is_displayed()
             # refresh is needed only if the property is not match to expected element state
             return (self._state if custom_sate is None else custom_sate) == self._state.Displayed and not is_displayed
         except Exception:
             # refresh is needed if the property is not available
+            if self._on_stale is not None:
+                self._on_stale()
             return True
 
     def get_element(self, timeout: float = None, custom_sate: ElementState = None) -> WebElement:
@@ -55,4 +125,5 @@ class ElementCacheHandler:
                 timeout=timeout,
                 name=self._name,
             )
+            self._is_bound = False
         return self._element
@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from selenium.common import WebDriverException
+
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.configurations.element_cache_configuration import ElementCacheConfiguration
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.element_cache_handler import ElementCacheHandler
+from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.logging.logger import Logger
+from py_selenium_auto_core.utilities.java_script import JavaScript
+
+_CacheKey = Tuple[Locator, ElementState]
+
+
+class ElementCacheStatistics:
+    """Counters of the element cache of the session"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __repr__(self):
+        return (
+            f"ElementCacheStatistics(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, invalidations={self.invalidations})"
+        )
+
+
+class _SessionCache:
+    def __init__(self, url: Optional[str]):
+        self.handlers: "OrderedDict[_CacheKey, ElementCacheHandler]" = OrderedDict()
+        self.statistics = ElementCacheStatistics()
+        self.url = url
+        self.generation: Optional[str] = None
+        self.generation_checked_at = 0.0
+
+
+class ElementCacheRegistry:
+    """Shares cache handlers of elements with the same locator and state within the session of each application.
+    Least recently used handlers are evicted when the cache is full, so the number of kept references is bounded.
+    All references of the session are dropped when the document changes.
+    Each document is marked by a generation token, so within the freshness window cached elements are used
+    without checking and the document is checked by a single script call per window.
+    The lock of the registry guards only the cached state. Driver calls are made outside of it and their results
+    are applied only if the state has not been updated meanwhile, so sessions do not wait for each other.
+    """
+
+    def __init__(self, element_cache_configuration: ElementCacheConfiguration):
+        """ElementCacheRegistry constructor
+
+        Args:
+            element_cache_configuration: Element cache configuration
+        """
+        self._configuration = element_cache_configuration
+        self._sessions: "WeakKeyDictionary[Application, _SessionCache]" = WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    def get_handler(
+        self,
+        application: Application,
+        locator: Locator,
+        name: str,
+        state: ElementState,
+        finder: ElementFinder,
+    ) -> ElementCacheHandler:
+        """Gets cache handler of the element shared within the session
+
+        Args:
+            application: Application the element belongs to
+            locator: Element locator
+            name: Element name, used for logging of the search if the handler is created
+            state: Element state
+            finder: Element finder, used for the search if the handler is created
+
+        Returns:
+            Cache handler of the element
+        """
+        key = (locator, state)
+        session = self.__get_session(application)
+        with self._lock:
+            handler = session.handlers.get(key)
+            if handler is not None:
+                session.handlers.move_to_end(key)
+                if handler.is_cached:
+                    session.statistics.hits += 1
+                    return handler
+            else:
+                handler = ElementCacheHandler(
+                    locator,
+                    name,
+                    state,
+                    finder,
+                    on_stale=lambda: self.__on_stale(application),
+                    is_document_current=lambda: self.__is_document_current(application),
+                )
+                session.handlers[key] = handler
+                self.__evict(session)
+            session.statistics.misses += 1
+            return handler
+
+    def get_statistics(self, application: Application) -> ElementCacheStatistics:
+        """Gets counters of the element cache of the session
+
+        Args:
+            application: Application of the session
+        """
+        return self.__get_session(application).statistics
+
+    def invalidate(self, application: Application) -> None:
+        """Drops all cached references of the session, e.g. after navigation to another page
+
+        Args:
+            application: Application of the session
+        """
+        with self._lock:
+            session = self._sessions.get(application)
+            if session is not None:
+                self.__invalidate(session)
+
+    def __is_document_current(self, application: Application) -> bool:
+        freshness_window = self._configuration.freshness_window
+        if not freshness_window:
+            return False
+        with self._lock:
+            session = self._sessions.get(application)
+            if session is None:
+                return False
+            if session.generation is not None and time.monotonic() - session.generation_checked_at < freshness_window:
+                return True
+            known_generation = session.generation
+        generation = self.__get_generation(application)
+        with self._lock:
+            if session.generation != known_generation:
+                # document has been checked by another thread meanwhile, its result is the latest one
+                return generation is not None and generation == session.generation
+            is_current = generation is not None and generation == known_generation
+            if not is_current and known_generation is not None:
+                Logger.debug("Document generation has changed, cached elements are dropped")
+                self.__invalidate(session)
+            session.generation = generation
+            session.generation_checked_at = time.monotonic()
+            return is_current
+
+    def __get_session(self, application: Application) -> _SessionCache:
+        with self._lock:
+            session = self._sessions.get(application)
+        if session is None:
+            url = self.__get_url(application)
+            with self._lock:
+                session = self._sessions.setdefault(application, _SessionCache(url))
+        return session
+
+    def __evict(self, session: _SessionCache) -> None:
+        max_size = self._configuration.max_size
+        while max_size and len(session.handlers) > max_size:
+            _, handler = session.handlers.popitem(last=False)
+            # element may still keep the handler, so the reference is dropped to free it
+            handler.invalidate()
+            session.statistics.evictions += 1
+
+    def __on_stale(self, application: Application) -> None:
+        """Stale reference is a sign of navigation, so the document is checked only when a reference goes stale"""
+        with self._lock:
+            session = self._sessions.get(application)
+            if session is None:
+                return
+            known_url = session.url
+        url = self.__get_url(application)
+        with self._lock:
+            if session.url != known_url:
+                # navigation has been handled by another thread meanwhile
+                return
+            if url != session.url:
+                Logger.debug(f"Document has changed to '{url}', cached elements are dropped")
+                self.__invalidate(session)
+                session.url = url
+
+    @staticmethod
+    def __invalidate(session: _SessionCache) -> None:
+        for handler in session.handlers.values():
+            handler.invalidate()
+        session.statistics.invalidations += 1
+
+    @staticmethod
+    def __get_generation(application: Application) -> Optional[str]:
+        try:
+            return application.driver.execute_script(JavaScript.GetDocumentGeneration.script)
+        except WebDriverException:
+            return None
+
+    @staticmethod
+    def __get_url(application: Application) -> Optional[str]:
+        try:
+            return application.driver.current_url
+        except WebDriverException:
+            return None
@@ -1,14 +1,20 @@
-from typing import Type, List, TypeVar, Dict
+from typing import Callable, Dict, List, Type, TypeVar
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
+from py_selenium_auto_core.configurations.element_search_configuration import ElementSearchConfiguration
 from py_selenium_auto_core.elements.constants.element_state import ElementState
 from py_selenium_auto_core.elements.constants.elements_count import ElementsCount
 from py_selenium_auto_core.elements.core_element import CoreElement
 from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.elements.element_list import ElementList
 from py_selenium_auto_core.localization.localization_manager import LocalizationManager
+from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.locator.compiled_locator_cache import CompiledLocatorCache
 from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.locator.locator_compiler import LocatorCompiler
+from py_selenium_auto_core.locator.scoped_locator import ScopedLocator
 from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
 
 T = TypeVar("T", bound=CoreElement, covariant=True)
@@ -17,23 +23,24 @@ T = TypeVar("T", bound=CoreElement, covariant=True)
 class ElementFactory:
     """Factory that creates elements"""
 
-    _supported_locators: Dict[By, "str"] = {
-        By.ID: "//*[@id='{0}']",
-        By.CLASS_NAME: "//*[contains(@class,'{0}')]",
-        By.NAME: "//*[@name='{0}']",
-        By.TAG_NAME: "//{0}",
-        By.XPATH: "{0}",
-    }
+    _supported_locators: Dict[By, "str"] = dict(Locator.xpath_templates)
 
     def __init__(
         self,
         conditional_wait: ConditionalWait,
         element_finder: ElementFinder,
         localization_manager: LocalizationManager,
+        localized_logger: LocalizedLogger = None,
+        element_search_configuration: ElementSearchConfiguration = None,
+        compiled_locator_cache: CompiledLocatorCache = None,
     ):
         self._conditional_wait = conditional_wait
         self._element_finder = element_finder
         self._localization_manager = localization_manager
+        self._localized_logger = localized_logger
+        self._search_configuration = element_search_configuration or ElementSearchConfiguration({})
+        self._locator_compiler = LocatorCompiler()
+        self._compiled_locator_cache = compiled_locator_cache or CompiledLocatorCache(self._search_configuration)
 
     def find_child_element(
         self,
@@ -55,6 +62,9 @@ class ElementFactory:
                     Locator(By.XPATH, "div") or Locator(By.XPATH, "div[@id]")
                     Locator(By.CLASS_NAME, "class_name")
                     Locator(By.TAG_NAME, "tag_name")
+                Any locator strategy (e.g. Locator(By.CSS_SELECTOR, "div > span")) is supported
+                if scopedChildSearch is enabled, or if cssLocators is enabled and the parent locator can be
+                expressed by CSS selector
             name: Child element name
             state: Child element state
 
@@ -62,7 +72,7 @@ class ElementFactory:
             Instance of child element
         """
         return element_type(
-            self._generate_child_locator(parent_element.locator, child_locator),
+            self._resolve_child_locator(parent_element, child_locator),
             name or f"Child element of {parent_element.name}",
             state,
         )
@@ -75,7 +85,7 @@ class ElementFactory:
         name: str = None,
         expected_count: ElementsCount = ElementsCount.Any,
         state: ElementState = ElementState.Displayed,
-    ) -> List[T]:
+    ) -> ElementList[T]:
         """Finds list of child elements by their locator relative to parent element
 
         Args:
@@ -88,19 +98,23 @@ class ElementFactory:
                     Locator(By.XPATH, "div") or Locator(By.XPATH, "div[@id]")
                     Locator(By.CLASS_NAME, "class_name")
                     Locator(By.TAG_NAME, "tag_name")
+                Any locator strategy (e.g. Locator(By.CSS_SELECTOR, "div > span")) is supported
+                if scopedChildSearch is enabled, or if cssLocators is enabled and the parent locator can be
+                expressed by CSS selector
             name: Child elements name
             expected_count: Expected number of elements that have to be found (zero, more then zero, any)
             state: Child elements state
 
         Returns:
-            List of child elements
+            Lazy list of child elements
         """
-        return self.find_elements(
+        return self._find_elements(
             element_type,
-            self._generate_child_locator(parent_element.locator, child_locator),
+            self._resolve_child_locator(parent_element, child_locator),
             name or f"Child element of {parent_element.name}",
             expected_count,
             state,
+            lambda: self._get_child_index_base_locator(parent_element, child_locator),
         )
 
     def find_elements(
@@ -110,7 +124,7 @@ class ElementFactory:
         name: str = None,
         expected_count: ElementsCount = ElementsCount.Any,
         state: ElementState = ElementState.Displayed,
-    ) -> List[T]:
+    ) -> ElementList[T]:
         """Finds list of elements by base locator
 
         Args:
@@ -121,12 +135,30 @@ class ElementFactory:
             state: Elements state
 
         Returns:
-            List of child elements
+            Lazy list of child elements
         """
+        return self._find_elements(element_type, locator, name, expected_count, state)
+
+    def _find_elements(
+        self,
+        element_type: Type[T],
+        locator: Locator,
+        name: str,
+        expected_count: ElementsCount,
+        state: ElementState,
+        get_index_base_locator: Callable[[], Locator] = None,
+    ) -> ElementList[T]:
         timeout = 0
+        # Elements found by the successful poll are reused, so the search is not repeated
+        web_elements: List[WebElement] = []
+
+        def _find_elements() -> List[WebElement]:
+            web_elements[:] = self._element_finder.find_elements(locator, state, timeout, name)
+            return web_elements
+
         if expected_count == ElementsCount.Zero:
             self._conditional_wait.wait_for_true(
-                function=lambda: not any(self._element_finder.find_elements(locator, state, timeout, name)),
+                function=lambda: self._element_finder.count_elements(locator, state) == 0,
                 message=self._localization_manager.get_localized_message(
                     "loc.elements.with.name.found.but.should.not",
                     name,
@@ -136,7 +168,7 @@ class ElementFactory:
             )
         elif expected_count == ElementsCount.MoreThenZero:
             self._conditional_wait.wait_for_true(
-                function=lambda: any(self._element_finder.find_elements(locator, state, timeout, name)),
+                function=lambda: any(_find_elements()),
                 message=self._localization_manager.get_localized_message(
                     "loc.no.elements.with.name.found.by.locator",
                     name,
@@ -145,19 +177,75 @@ class ElementFactory:
             )
         elif expected_count == ElementsCount.Any:
             self._conditional_wait.wait_for_condition(
-                function=lambda: self._element_finder.find_elements(locator, state, timeout, name) is not None,
+                function=lambda: _find_elements() is not None,
             )
         else:
             raise ValueError(f"No such expected value: {expected_count}")
 
-        web_elements = self._element_finder.find_elements(locator, state, 0, name)
-        elements = []
         name = "element" if name is None else name
-        for index, web_element in enumerate(web_elements, 1):
-            elements.append(
-                element_type(self._generate_xpath_locator(locator, web_element, index), f"{name} + {index}", state)
+
+        # base of index locators is resolved by the first created element, as lists are often only counted or read
+        index_base_locators: List[Locator] = []
+
+        def _get_index_base_locator() -> Locator:
+            if not index_base_locators:
+                is_composed = locator.by == By.CSS_SELECTOR and get_index_base_locator is not None
+                index_base_locators.append(get_index_base_locator() if is_composed else locator)
+            return index_base_locators[0]
+
+        def _create_element(index: int, web_element: WebElement) -> T:
+            element = element_type(
+                self._generate_index_locator(_get_index_base_locator(), web_element, index + 1),
+                f"{name} + {index + 1}",
+                state,
             )
-        return elements
+            # Index locator is used only when the found element becomes stale
+            element.cache.bind(web_element)
+            return element
+
+        return ElementList(list(web_elements), _create_element, name=name, logger=self._localized_logger)
+
+    def wait_for_count(
+        self,
+        locator: Locator,
+        predicate: Callable[[int], bool],
+        timeout: float = None,
+        state: ElementState = ElementState.ExistsInAnyState,
+        name: str = None,
+    ) -> int:
+        """Waits for the count of elements to satisfy the predicate.
+        Each poll counts elements in the browser when it is possible, so references to elements are not transferred
+
+        Args:
+            locator: Elements locator
+            predicate: Condition for the count, e.g. lambda count: count == 20
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+            state: State of elements to count
+            name: Elements name
+
+        Returns:
+            Count of elements which satisfied the predicate
+
+        Exception:
+            TimeoutException: Thrown if the count has not satisfied the predicate in time
+        """
+        counts: List[int] = []
+
+        def _is_count_matched() -> bool:
+            counts[:] = [self._element_finder.count_elements(locator, state)]
+            return predicate(counts[0])
+
+        self._conditional_wait.wait_for_true(
+            function=_is_count_matched,
+            timeout=timeout,
+            message=self._localization_manager.get_localized_message(
+                "loc.elements.count.not.matched",
+                name,
+                locator.to_string(),
+                state.name,
+            ),
+        )
+        return counts[0]
 
     @classmethod
     def get_custom_element(
@@ -189,12 +277,56 @@ class ElementFactory:
         if not self._is_locator_supported(locator):
             raise ValueError(f"Locator '{locator.by}' is not supported to generate XPath")
 
-        loc = self._supported_locators[locator.by].format(locator.value)
+        template = self._supported_locators[locator.by]
+        if template == Locator.xpath_templates.get(locator.by):
+            # XPath form of the locator is computed once
+            loc = locator.to_xpath().value
+        else:
+            loc = template.format(locator.value)
 
         if index is not None:
             return Locator(By.XPATH, f"({loc})[{index}]")
         return Locator(By.XPATH, loc)
 
+    def _generate_index_locator(self, locator: Locator, web_element: WebElement, index: int) -> Locator:
+        """Generates locator of the element found by the locator at the index"""
+        if isinstance(locator, ScopedLocator):
+            return locator.with_index(index)
+        return self._compiled_locator_cache.get(
+            (type(self), "index", locator, index),
+            lambda: self._generate_xpath_locator(locator, web_element, index),
+        )
+
+    def _resolve_child_locator(self, parent_element: CoreElement, child_locator: Locator) -> Locator:
+        """Child is searched within its parent in scoped mode, otherwise by CSS selector composed of the parent and
+        child locators if it is enabled and possible, otherwise by absolute XPath from the document root
+        """
+        if self._search_configuration.is_scoped_child_search_enabled:
+            return ScopedLocator(parent_element, child_locator)
+        is_css_locators_enabled = self._search_configuration.is_css_locators_enabled
+        return self._compiled_locator_cache.get(
+            (type(self), "css" if is_css_locators_enabled else "xpath", parent_element.locator, child_locator),
+            lambda: self._compile_child_locator(parent_element.locator, child_locator, is_css_locators_enabled),
+        )
+
+    def _compile_child_locator(self, parent_locator: Locator, child_locator: Locator, is_css: bool) -> Locator:
+        if is_css:
+            css_locator = self._locator_compiler.compose_child(parent_locator, child_locator)
+            if css_locator is not None:
+                return css_locator
+        return self._generate_child_locator(parent_locator, child_locator)
+
+    def _get_child_index_base_locator(self, parent_element: CoreElement, child_locator: Locator) -> Locator:
+        """CSS selector cannot address the n-th match, so child elements are addressed by the XPath of the child.
+        Children that cannot be expressed by XPath are addressed by their index within the parent
+        """
+        if not self._is_locator_supported(parent_element.locator) or not self._is_locator_supported(child_locator):
+            return ScopedLocator(parent_element, child_locator)
+        return self._compiled_locator_cache.get(
+            (type(self), "xpath", parent_element.locator, child_locator),
+            lambda: self._generate_child_locator(parent_element.locator, child_locator),
+        )
+
     def _generate_child_locator(self, parent_locator: Locator, child_locator: Locator):
         """Generates absolute child locator for target element"""
 
@@ -1,24 +1,225 @@
 from __future__ import annotations
 
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Tuple
 
-from selenium.common import TimeoutException, NoSuchElementException
+from selenium.common import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
+from py_selenium_auto_core.configurations.element_search_configuration import ElementSearchConfiguration
 from py_selenium_auto_core.elements.constants.desired_state import DesiredState
 from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.constants.element_state_script import ElementStateScript
+from py_selenium_auto_core.elements.compiled_element_search import CompiledElementSearch
+from py_selenium_auto_core.elements.element_state_evaluator import ElementStateEvaluator
 from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
 from py_selenium_auto_core.locator.locator import Locator
-from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+from py_selenium_auto_core.locator.locator_compiler import LocatorCompiler
+from py_selenium_auto_core.locator.scoped_locator import ScopedLocator
+from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait, _BaseConditionalWait
 
 
-class ElementFinder:
-    """Provides ability to find elements in desired ElementState"""
+class _BaseElementFinder:
+    """Search strategies and state resolution shared by synchronous and asynchronous element finders"""
 
-    def __init__(self, logger: LocalizedLogger, conditional_wait: ConditionalWait):
+    def __init__(
+        self,
+        logger: LocalizedLogger,
+        conditional_wait: _BaseConditionalWait,
+        element_search_configuration: ElementSearchConfiguration = None,
+    ):
         self._conditional_wait = conditional_wait
         self._logger = logger
+        self._search_configuration = element_search_configuration or ElementSearchConfiguration({})
+        self._state_evaluator = ElementStateEvaluator(self._search_configuration.is_batch_state_evaluation_enabled)
+        self._compiled_search = CompiledElementSearch()
+        self._locator_compiler = LocatorCompiler()
+
+    def is_event_driven_wait_supported(self, locator: Locator, state: DesiredState) -> bool:
+        """Checks that the wait for elements in desired state could react on DOM mutations in the browser
+
+        Args:
+            locator: Elements locator
+            state: Desired state of elements
+
+        Returns:
+            True if event driven waits are enabled and the search could be compiled into a script, false otherwise
+        """
+        return self._search_configuration.is_event_driven_waits_enabled and self._compiled_search.is_supported(
+            locator, state
+        )
+
+    def resolve_state(self, state: ElementState) -> DesiredState:
+        """Converts ElementState to DesiredState
+
+        Args:
+            state: Built-in element state
+
+        Returns:
+            Desired state with function and script conditions
+        """
+        return self._resolve_state(state)
+
+    def _resolve_state(self, state: ElementState) -> DesiredState:
+        if state == ElementState.Displayed:
+
+            def element_state_condition(element: WebElement) -> bool:
+                return element.is_displayed()
+
+            script_condition = ElementStateScript.Displayed
+        elif state == ElementState.ExistsInAnyState:
+
+            def element_state_condition(element: WebElement) -> bool:
+                return True
+
+            script_condition = ElementStateScript.ExistsInAnyState
+        else:
+            raise ValueError(f"{state} state is not recognized")
+        return DesiredState(
+            function_condition=element_state_condition,
+            state_name=state.name,
+            script_condition=script_condition,
+        )
+
+    def _resolve_count_state(self, state: ElementState | DesiredState | Callable[[WebElement], bool]) -> DesiredState:
+        if isinstance(state, ElementState):
+            return self._resolve_state(state)
+        elif isinstance(state, DesiredState):
+            return state
+        elif isinstance(state, Callable):
+            return DesiredState(state, "desired")
+        raise ValueError("Incorrect type of state")
+
+    def _count_elements(self, driver: WebDriver, locator: Locator, state: DesiredState) -> int:
+        if self._compiled_search.is_supported(locator, state):
+            try:
+                return self._compiled_search.count(driver, locator, state)
+            except StaleElementReferenceException:
+                raise
+            except WebDriverException:
+                # Scripts are not supported by the driver or the locator is invalid, so let the driver report it
+                pass
+        return len(self._search_with_driver(driver, locator, state, False)[1])
+
+    def _count_elements_once_again_if_stale(self, driver: WebDriver, locator: Locator, state: DesiredState) -> int:
+        try:
+            return self._count_elements(driver, locator, state)
+        except StaleElementReferenceException:
+            # Elements have been changed during the count, so the current ones are counted by a new search
+            return self._count_elements(driver, locator, state)
+
+    def _get_search_locator(self, locator: Locator) -> Locator:
+        """Gets locator sent to the browser, messages keep the original locator"""
+        if self._search_configuration.is_css_locators_enabled:
+            return self._locator_compiler.optimize(locator)
+        return locator
+
+    def _resolve_search(
+        self,
+        locator: Locator,
+        state: DesiredState,
+    ) -> Callable[[WebDriver, Locator, DesiredState, bool], Tuple[int, List[WebElement]]]:
+        if self._search_configuration.is_compiled_search_enabled and self._compiled_search.is_supported(locator, state):
+            return self._search_in_browser
+        return self._search_with_driver
+
+    def _search_with_driver(
+        self,
+        driver: WebDriver,
+        locator: Locator,
+        state: DesiredState,
+        is_first_match_enough: bool,
+    ) -> Tuple[int, List[WebElement]]:
+        if isinstance(locator, ScopedLocator):
+            found_elements = self._distinct(locator.find_elements())
+        else:
+            found_elements = self._distinct(driver.find_elements(by=locator.by, value=locator.value))
+        return len(found_elements), self._state_evaluator.filter(driver, found_elements, state, is_first_match_enough)
+
+    def _search_in_browser(
+        self,
+        driver: WebDriver,
+        locator: Locator,
+        state: DesiredState,
+        is_first_match_enough: bool,
+    ) -> Tuple[int, List[WebElement]]:
+        try:
+            return self._compiled_search.find(driver, locator, state, is_first_match_enough)
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            # Scripts are not supported by the driver or the locator is invalid, so let the driver report it
+            return self._search_with_driver(driver, locator, state, is_first_match_enough)
+
+    @staticmethod
+    def _distinct(elements: List[WebElement]) -> List[WebElement]:
+        """Removes duplicates by WebElement id keeping the original order"""
+        unique_ids = set()
+        unique_elements = []
+        for element in elements:
+            if element.id not in unique_ids:
+                unique_ids.add(element.id)
+                unique_elements.append(element)
+        return unique_elements
+
+    def _handle_timeout_exception(
+        self,
+        exception: TimeoutException,
+        desired_state: DesiredState,
+        locator: Locator,
+        found_elements_count: int,
+        name=None,
+    ) -> None:
+        if name is None or name == "":
+            message = (
+                f"No elements with locator '{locator.by}: {locator.value}'"
+                f" were found in {desired_state.state_name} state"
+            )
+        else:
+            message = (
+                f"Element [{name}] was not found by locator"
+                f" '{locator.by}: {locator.value}' in {desired_state.state_name} state"
+            )
+
+        if desired_state.is_catching_timeout_exception:
+            if found_elements_count == 0:
+                if desired_state.is_throwing_no_such_element_exception:
+                    raise NoSuchElementException(message)
+                self._logger.debug(
+                    "loc.no.elements.found.in.state",
+                    None,
+                    locator.to_string(),
+                    desired_state.state_name,
+                )
+            else:
+                self._logger.debug(
+                    "loc.elements.were.found.but.not.in.state",
+                    None,
+                    locator.to_string(),
+                    desired_state.state_name,
+                )
+        else:
+            if desired_state.is_throwing_no_such_element_exception and found_elements_count == 0:
+                raise NoSuchElementException(f"{message}: {exception.msg}")
+            raise TimeoutException(f"{exception.msg}: {message}")
+
+
+class ElementFinder(_BaseElementFinder):
+    """Provides ability to find elements in desired ElementState"""
+
+    def __init__(
+        self,
+        logger: LocalizedLogger,
+        conditional_wait: ConditionalWait,
+        element_search_configuration: ElementSearchConfiguration = None,
+    ):
+        super().__init__(logger, conditional_wait, element_search_configuration)
+        self._conditional_wait: ConditionalWait = conditional_wait
 
     def find_element(
         self,
@@ -44,22 +245,22 @@ class ElementFinder:
             NoSuchElementException: Thrown if element was not found in time in desired state
         """
         if isinstance(state, ElementState):
-            # Convert ElementState to DesiredState and call this method again (Move to Callable section)
+            # Keep the script condition of the built-in state, so it could be evaluated in the browser
             desired_state = self._resolve_state(state)
-            return self.find_element(
-                locator=locator,
-                state=desired_state.element_state_condition,
-                state_name=desired_state.state_name,
-                timeout=timeout,
-                name=name,
-            )
         elif isinstance(state, Callable):
             desired_state = DesiredState(state, state_name)
-            desired_state.is_catching_timeout_exception = False
-            desired_state.is_throwing_no_such_element_exception = True
-            return self._find_elements(locator=locator, state=desired_state, timeout=timeout, name=name)[0]
+        else:
+            raise ValueError("Incorrect type of state")
 
-        raise ValueError("Incorrect type of state")
+        desired_state.is_catching_timeout_exception = False
+        desired_state.is_throwing_no_such_element_exception = True
+        return self._find_elements(
+            locator=locator,
+            state=desired_state,
+            timeout=timeout,
+            name=name,
+            is_first_match_enough=True,
+        )[0]
 
     def find_elements(
         self,
@@ -67,6 +268,7 @@ class ElementFinder:
         state: ElementState | DesiredState | Callable[[Any], bool] = ElementState.ExistsInAnyState,
         timeout: float = None,
         name: str = None,
+        is_first_match_enough: bool = False,
     ) -> List[WebElement]:
         """Finds elements
 
@@ -75,6 +277,8 @@ class ElementFinder:
             state: Desired ElementState or predicate to define element state
             timeout: Timeout for search
             name: Element name to be used for logging and exception message
+            is_first_match_enough: Stops the search on the first element in desired state.
+                Useful when the caller only checks whether any element is found
 
         Returns:
             List of found elements
@@ -83,84 +287,97 @@ class ElementFinder:
             # Convert ElementState to DesiredState and call this method again (Move to DesiredState section)
             desired_state = self._resolve_state(state)
             desired_state.is_catching_timeout_exception = True
-            return self.find_elements(locator, desired_state, timeout, name)
+            return self.find_elements(locator, desired_state, timeout, name, is_first_match_enough)
         elif isinstance(state, Callable):
             # Convert Callable to DesiredState and call this method again (Move to DesiredState section)
             desired_state = DesiredState(state, "desired")
             desired_state.is_catching_timeout_exception = True
-            return self.find_elements(locator, desired_state, timeout, name)
+            return self.find_elements(locator, desired_state, timeout, name, is_first_match_enough)
         elif isinstance(state, DesiredState):
-            return self._find_elements(locator, state, timeout, name)
+            return self._find_elements(locator, state, timeout, name, is_first_match_enough)
         raise ValueError("Incorrect type of state")
 
-    def _resolve_state(self, state: ElementState) -> DesiredState:
-        if state == ElementState.Displayed:
+    def count_elements(
+        self,
+        locator: Locator,
+        state: ElementState | DesiredState | Callable[[WebElement], bool] = ElementState.ExistsInAnyState,
+    ) -> int:
+        """Counts elements in desired state by a single search without waiting.
+        Built-in states are counted in the browser, so references to elements are not transferred
 
-            def element_state_condition(element: WebElement) -> bool:
-                return element.is_displayed()
+        Args:
+            locator: Elements locator
+            state: Desired ElementState or predicate to define element state
 
-        elif state == ElementState.ExistsInAnyState:
+        Returns:
+            Count of elements in desired state
+        """
+        desired_state = self._resolve_count_state(state)
+        search_locator = self._get_search_locator(locator)
+        try:
+            # Count is wrapped into a tuple as zero count is a valid result of a single check
+            return self._conditional_wait.wait_for_driver(
+                lambda driver: (self._count_elements_once_again_if_stale(driver, search_locator, desired_state),),
+                timeout=0,
+            )[0]
+        except TimeoutException:
+            # Elements kept becoming stale, so none of them is counted the same way as find_elements does
+            return 0
 
-            def element_state_condition(element: WebElement) -> bool:
-                return True
+    def wait_for_state_by_events(
+        self,
+        locator: Locator,
+        state: DesiredState,
+        is_expected: bool = True,
+        timeout: float = None,
+    ) -> None:
+        """Waits in the browser until any element is in desired state reacting on DOM mutations instead of polling
+
+        Args:
+            locator: Elements locator
+            state: Desired state of elements with script condition
+            is_expected: Waits for any element in desired state if true and for absence of such elements otherwise
+            timeout: Timeout for waiting
 
+        Exception:
+            TimeoutException: Thrown if elements have not reached desired state in time
+            WebDriverException: Thrown if the driver does not support asynchronous scripts
+        """
+        if is_expected:
+            message = f"No elements with locator '{locator.by}: {locator.value}' were found in {state.state_name} state"
         else:
-            raise ValueError(f"{state} state is not recognized")
-        return DesiredState(function_condition=element_state_condition, state_name=state.name)
+            message = f"Elements with locator '{locator.by}: {locator.value}' are still in {state.state_name} state"
+        search_locator = self._get_search_locator(locator)
+        self._conditional_wait.wait_for_async_script(
+            script=self._compiled_search.get_wait_script(state),
+            args=[search_locator.by, search_locator.value, is_expected],
+            timeout=timeout,
+            message=message,
+        )
 
-    def _find_elements(self, locator: Locator, state: DesiredState, timeout, name) -> List[WebElement]:
-        found_elements: List[WebElement] = []
+    def _find_elements(
+        self,
+        locator: Locator,
+        state: DesiredState,
+        timeout: float,
+        name: str,
+        is_first_match_enough: bool = False,
+    ) -> List[WebElement]:
+        found_elements_count = [0]
         result_elements: List[WebElement] = []
+        search_locator = self._get_search_locator(locator)
+        search = self._resolve_search(search_locator, state)
 
         try:
 
             def predicate(driver: WebDriver) -> bool:
-                found_elements.extend(driver.find_elements(by=locator.by, value=locator.value))
-                result_elements.extend([el for el in found_elements if state.element_state_condition(el)])
-                return any(result_elements)
+                # Every poll works with a fresh candidate set, so elements from previous polls are not re-checked
+                found_elements_count[0], result_elements[:] = search(
+                    driver, search_locator, state, is_first_match_enough
+                )
+                return len(result_elements) > 0
 
             self._conditional_wait.wait_for_driver(predicate, timeout)
         except TimeoutException as e:
-            self._handle_timeout_exception(e, state, locator, found_elements, name)
+            self._handle_timeout_exception(e, state, locator, found_elements_count[0], name)
         return result_elements
-
-    def _handle_timeout_exception(
-        self,
-        exception: TimeoutException,
-        desired_state: DesiredState,
-        locator: Locator,
-        found_elements: list,
-        name=None,
-    ) -> None:
-        if name is None or name == "":
-            message = (
-                f"No elements with locator '{locator.by}: {locator.value}'"
-                f" were found in {desired_state.state_name} state"
-            )
-        else:
-            message = (
-                f"Element [{name}] was not found by locator"
-                f" '{locator.by}: {locator.value}' in {desired_state.state_name} state"
-            )
-
-        if desired_state.is_catching_timeout_exception:
-            if not any(found_elements):
-                if desired_state.is_throwing_no_such_element_exception:
-                    raise NoSuchElementException(message)
-                self._logger.debug(
-                    "loc.no.elements.found.in.state",
-                    None,
-                    locator.to_string(),
-                    desired_state.state_name,
-                )
-            else:
-                self._logger.debug(
-                    "loc.elements.were.found.but.not.in.state",
-                    None,
-                    locator.to_string(),
-                    desired_state.state_name,
-                )
-        else:
-            if desired_state.is_throwing_no_such_element_exception and not any(found_elements):
-                raise NoSuchElementException(f"{message}: {exception.msg}")
-            raise TimeoutException(f"{exception.msg}: {message}")
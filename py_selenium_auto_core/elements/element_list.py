@@ -0,0 +1,161 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar, overload
+
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.utilities.java_script import JavaScript, get_selenium_atom
+
+T = TypeVar("T")
+
+
+class ElementList(Sequence[T], Generic[T]):
+    """List of found elements. Elements are created only when they are indexed or iterated,
+    slicing returns a view of the same list without calls to the driver.
+    Bulk readers (texts, attributes, rects, properties) read the whole list by a single execute_script call.
+    The list is read-only, it is equal to lists and tuples with the same elements and concatenation returns list
+    """
+
+    def __init__(
+        self,
+        web_elements: List[WebElement],
+        create_element: Callable[[int, WebElement], T],
+        indices: Optional[range] = None,
+        elements: Optional[Dict[int, T]] = None,
+        name: str = "element",
+        logger: Optional[LocalizedLogger] = None,
+    ):
+        """ElementList constructor
+
+        Args:
+            web_elements: Elements found by the search
+            create_element: Creates element by its index in the search result and its WebElement
+            indices: Indices of the search result included into the list. All indices by default
+            elements: Already created elements by their indices in the search result
+            name: Elements name used for logging
+            logger: Logger of bulk reads. Reads are not logged if None
+        """
+        self._web_elements = web_elements
+        self._create_element = create_element
+        self._indices = range(len(web_elements)) if indices is None else indices
+        self._elements = {} if elements is None else elements
+        self._name = name
+        self._logger = logger
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ElementList[T]":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ElementList(
+                self._web_elements,
+                self._create_element,
+                self._indices[index],
+                self._elements,
+                self._name,
+                self._logger,
+            )
+        result_index = self._indices[index]
+        if result_index not in self._elements:
+            self._elements[result_index] = self._create_element(result_index, self._web_elements[result_index])
+        return self._elements[result_index]
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ElementList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(element == other_element for element, other_element in zip(self, other))
+
+    __hash__ = None
+
+    def __add__(self, other: Sequence[T]) -> List[T]:
+        if not isinstance(other, (ElementList, list, tuple)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other: Sequence[T]) -> List[T]:
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"ElementList(size={len(self)})"
+
+    def texts(self) -> List[str]:
+        """Gets visible texts of all elements of the list by a single script call.
+        Text of hidden element is empty as it is for WebElement.text, text of displayed element is its trimmed
+        innerText, which could differ from WebElement.text in whitespaces and CSS text-transform,
+        as Selenium does not ship its getText atom to the client
+        """
+        self.__log("loc.elements.get.texts", len(self), self._name)
+        return self.__read("text", [], lambda element: element.text)
+
+    def attributes(self, name: str) -> List[Optional[str]]:
+        """Gets values of the attribute of all elements of the list by a single script call
+
+        Args:
+            name: Attribute name. Values are the same as WebElement.get_attribute returns
+                (e.g. absolute URL for href, "true" or None for boolean attributes)
+        """
+        self.__log("loc.elements.get.attributes", name, len(self), self._name)
+        return self.__read("attribute", [name], lambda element: element.get_attribute(name))
+
+    def rects(self) -> List[Dict[str, float]]:
+        """Gets positions and sizes (x, y, width, height) of all elements of the list by a single script call"""
+        self.__log("loc.elements.get.rects", len(self), self._name)
+        return self.__read("rect", [], lambda element: element.get_element().rect)
+
+    def properties(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Gets values of the properties of all elements of the list by a single script call
+
+        Args:
+            names: Property names
+
+        Returns:
+            Dictionary of property values by their names for each element
+        """
+        self.__log("loc.elements.get.properties", ", ".join(names), len(self), self._name)
+        return self.__read(
+            "properties",
+            list(names),
+            lambda element: {name: element.get_element().get_property(name) for name in names},
+        )
+
+    def __read(self, kind: str, names: List[str], read_element: Callable[[T], Any]) -> List[Any]:
+        web_elements = [self._web_elements[index] for index in self._indices]
+        if not web_elements:
+            return []
+        try:
+            values = web_elements[0].parent.execute_script(
+                _build_read_script(), web_elements, kind, names
+            )
+            if isinstance(values, list) and len(values) == len(web_elements):
+                return values
+        except WebDriverException:
+            # Some of elements are stale or scripts are not supported, so elements are read one by one with retries
+            pass
+        return [read_element(element) for element in self]
+
+    def __log(self, message_key: str, *args):
+        if self._logger is not None:
+            self._logger.info(message_key, *args)
+
+
+@lru_cache(maxsize=None)
+def _build_read_script() -> str:
+    return (
+        JavaScript.ReadElementsProperties.script.replace("__IS_DISPLAYED_ATOM__", get_selenium_atom("isDisplayed.js"))
+        .replace("__GET_ATTRIBUTE_ATOM__", get_selenium_atom("getAttribute.js"))
+    )
@@ -0,0 +1,98 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from selenium.common import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.elements.constants.desired_state import DesiredState
+from py_selenium_auto_core.elements.constants.element_state_script import ElementStateScript
+from py_selenium_auto_core.utilities.java_script import JavaScript, get_selenium_atom
+
+
+class ElementStateEvaluator:
+    """Evaluates state of found elements.
+    States with script condition are evaluated for the whole list of elements by a single execute_script call,
+    other states are evaluated element by element
+    """
+
+    def __init__(self, is_batch_evaluation_enabled: bool = True):
+        """ElementStateEvaluator constructor
+
+        Args:
+            is_batch_evaluation_enabled: Allows to evaluate states with script condition in the browser
+        """
+        self._is_batch_evaluation_enabled = is_batch_evaluation_enabled
+
+    def filter(
+        self,
+        driver: WebDriver,
+        elements: List[WebElement],
+        state: DesiredState,
+        is_first_match_enough: bool = False,
+    ) -> List[WebElement]:
+        """Filters elements by desired state
+
+        Args:
+            driver: Instance of driver used to evaluate script condition
+            elements: Candidate elements
+            state: Desired state of elements
+            is_first_match_enough: Stops the evaluation on the first element in desired state
+
+        Returns:
+            Elements in desired state
+        """
+        if not elements:
+            return []
+        if state.script_condition == ElementStateScript.ExistsInAnyState:
+            return elements[:1] if is_first_match_enough else list(elements)
+
+        states = self._evaluate_in_browser(driver, elements, state) if self._is_batch_evaluation_enabled else None
+        result_elements = []
+        for index, element in enumerate(elements):
+            is_in_state = states[index] if states is not None else state.element_state_condition(element)
+            if is_in_state:
+                result_elements.append(element)
+                if is_first_match_enough:
+                    break
+        return result_elements
+
+    def _evaluate_in_browser(
+        self,
+        driver: WebDriver,
+        elements: List[WebElement],
+        state: DesiredState,
+    ) -> Optional[List[bool]]:
+        if state.script_condition is None:
+            return None
+        try:
+            script = build_state_script(JavaScript.EvaluateElementsState, state.script_condition)
+            states = driver.execute_script(script, elements)
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            # Scripts are not supported by the driver (e.g. native context), evaluate element by element
+            return None
+        if not isinstance(states, list) or len(states) != len(elements):
+            return None
+        return states
+
+
+@lru_cache(maxsize=None)
+def build_state_script(script: JavaScript, script_condition: str) -> str:
+    """Builds the script that evaluates script condition of the state (see ElementStateScript)
+
+    Args:
+        script: Script with '__CONDITION__' placeholder for the condition
+        script_condition: JavaScript condition evaluated for the 'element' variable
+
+    Returns:
+        Text of the script with element state helpers
+    """
+    return "\n".join(
+        [
+            JavaScript.ElementStateHelpers.script.replace("__IS_DISPLAYED_ATOM__", get_selenium_atom("isDisplayed.js")),
+            JavaScript.QueryElements.script,
+            script.script.replace("__CONDITION__", script_condition),
+        ]
+    )
@@ -1,15 +1,73 @@
 from typing import Callable
 
+from selenium.common import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 
 from py_selenium_auto_core.elements.constants.desired_state import DesiredState
 from py_selenium_auto_core.elements.constants.element_state import ElementState
-from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.elements.constants.element_state_script import ElementStateScript
+from py_selenium_auto_core.elements.element_finder import ElementFinder, _BaseElementFinder
 from py_selenium_auto_core.locator.locator import Locator
-from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait, _BaseConditionalWait
 
 
-class ElementStateProvider:
+class _BaseElementStateProvider:
+    """Desired states, wait modes and logging shared by synchronous and asynchronous element state providers"""
+
+    def __init__(
+        self,
+        locator: Locator,
+        conditional_wait: _BaseConditionalWait,
+        element_finder: _BaseElementFinder,
+        log_element_state: Callable[[str, str], None],
+    ):
+        self._locator = locator
+        self._conditional_wait = conditional_wait
+        self._element_finder = element_finder
+        self._log_element_state = log_element_state
+
+    @staticmethod
+    def _get_clickable_state(catch_exception: bool) -> DesiredState:
+        desired_state = DesiredState(
+            lambda element: element.is_displayed() and element.is_enabled(),
+            "CLICKABLE",
+            ElementStateScript.Clickable,
+        )
+        desired_state.is_catching_timeout_exception = catch_exception
+        return desired_state
+
+    @classmethod
+    def _get_enabled_state(cls, is_enabled: bool) -> DesiredState:
+        if is_enabled:
+            desired_state = DesiredState(cls._is_element_enabled, "ENABLED", ElementStateScript.Enabled)
+        else:
+            desired_state = DesiredState(
+                lambda element: not cls._is_element_enabled(element), "NOT ENABLED", ElementStateScript.NotEnabled
+            )
+        desired_state.is_catching_timeout_exception = True
+        desired_state.is_throwing_no_such_element_exception = True
+        return desired_state
+
+    @staticmethod
+    def _is_element_enabled(element: WebElement) -> bool:
+        return element.is_enabled() and "disabled" not in element.get_attribute("class")
+
+    def _is_waiting_by_events(self, state: DesiredState, timeout: float) -> bool:
+        return timeout != 0 and self._element_finder.is_event_driven_wait_supported(self._locator, state)
+
+    @staticmethod
+    def _is_checked_once(timeout: float, is_single_check: bool) -> bool:
+        """Function that checks the state once is polled within the default timeout as well,
+        other functions wait for the state by themselves
+        """
+        return timeout == 0 or (timeout is None and not is_single_check)
+
+    def _log_wait_for_state(self, msg_key: str, is_failed: bool = False) -> None:
+        message_key = "loc.wait.for.state.failed" if is_failed else "loc.wait.for.state"
+        self._log_element_state(message_key, f"loc.el.state.{msg_key}")
+
+
+class ElementStateProvider(_BaseElementStateProvider):
     """Provides ability to define element's state (whether it is displayed, exist or not)
     Also provides respective positive and negative waiting methods
     """
@@ -21,10 +79,9 @@ class ElementStateProvider:
         element_finder: ElementFinder,
         log_element_state: Callable[[str, str], None],
     ):
-        self._locator = locator
-        self._conditional_wait = conditional_wait
-        self._element_finder = element_finder
-        self._log_element_state = log_element_state
+        super().__init__(locator, conditional_wait, element_finder, log_element_state)
+        self._conditional_wait: ConditionalWait = conditional_wait
+        self._element_finder: ElementFinder = element_finder
 
     def is_displayed(self) -> bool:
         """Gets element's displayed state: true if displayed and false otherwise"""
@@ -72,7 +129,14 @@ class ElementStateProvider:
         """
 
         def _predicate():
-            return self._conditional_wait.wait_for_condition(lambda: not self.is_displayed(), timeout)
+            return self.__wait_for_state(
+                self._element_finder.resolve_state(ElementState.Displayed),
+                False,
+                timeout,
+                lambda poll_timeout: self._conditional_wait.wait_for_condition(
+                    lambda: not self.is_displayed(), poll_timeout
+                ),
+            )
 
         return self.__do_and_log_wait_for_state(_predicate, "not.displayed", timeout)
 
@@ -102,7 +166,14 @@ class ElementStateProvider:
         """
 
         def _predicate():
-            return self._conditional_wait.wait_for_condition(lambda: not self.is_exist(), timeout)
+            return self.__wait_for_state(
+                self._element_finder.resolve_state(ElementState.ExistsInAnyState),
+                False,
+                timeout,
+                lambda poll_timeout: self._conditional_wait.wait_for_condition(
+                    lambda: not self.is_exist(), poll_timeout
+                ),
+            )
 
         return self.__do_and_log_wait_for_state(_predicate, "not.exist", timeout)
 
@@ -120,7 +191,7 @@ class ElementStateProvider:
         """
 
         def _predicate():
-            return self.__is_element_in_desired_state(lambda e: self.__is_element_enabled(e), "ENABLED", timeout)
+            return self.__is_element_in_desired_condition(timeout, self._get_enabled_state(True))
 
         return self.__do_and_log_wait_for_state(_predicate, "enabled", timeout)
 
@@ -138,9 +209,7 @@ class ElementStateProvider:
         """
 
         def _predicate():
-            return self.__is_element_in_desired_state(
-                lambda e: not self.__is_element_enabled(e), "NOT ENABLED", timeout
-            )
+            return self.__is_element_in_desired_condition(timeout, self._get_enabled_state(False))
 
         return self.__do_and_log_wait_for_state(_predicate, "not.enabled", timeout)
 
@@ -156,41 +225,102 @@ class ElementStateProvider:
         Exception:
             TimeoutException: Throws when timeout exceeded and element is not clickable
         """
-        condition_key = "loc.el.state.clickable"
         try:
-            self._log_element_state("loc.wait.for.state", condition_key)
+            self._log_wait_for_state("clickable")
             self.__is_element_clickable(timeout, False)
         except Exception:
-            self._log_element_state("loc.wait.for.state.failed", condition_key)
+            self._log_wait_for_state("clickable", is_failed=True)
             raise
 
+    def wait_for_count(
+        self,
+        predicate: Callable[[int], bool],
+        timeout: float = None,
+        state: ElementState = ElementState.ExistsInAnyState,
+    ) -> bool:
+        """Waits for the count of elements found by the locator to satisfy the predicate.
+        Elements are counted in the browser when it is possible, so references to elements are not transferred
+
+        Args:
+            predicate: Condition for the count, e.g. lambda count: count == 20
+            timeout: Timeout for waiting. Default: Configurations.TimeoutConfiguration.condition
+            state: State of elements to count
+
+        Returns:
+            True if the count satisfied the predicate, false otherwise
+        """
+
+        def _predicate():
+            return predicate(self._element_finder.count_elements(self._locator, state))
+
+        return self.__do_and_log_wait_for_state(_predicate, "count", timeout, is_single_check=True)
+
     def __is_element_clickable(self, timeout: float, catch_exception: bool) -> bool:
-        desired_state = DesiredState(lambda element: element.is_displayed() and element.is_enabled(), "CLICKABLE")
-        desired_state.is_catching_timeout_exception = catch_exception
-        return self.__is_element_in_desired_condition(timeout, desired_state)
+        return self.__is_element_in_desired_condition(timeout, self._get_clickable_state(catch_exception))
 
     def __is_element_in_desired_condition(self, timeout: float, element_state: DesiredState) -> bool:
-        return any(self._element_finder.find_elements(self._locator, element_state, timeout))
+        return self.__wait_for_state(
+            element_state,
+            True,
+            timeout,
+            lambda poll_timeout: any(
+                self._element_finder.find_elements(
+                    self._locator, element_state, poll_timeout, is_first_match_enough=True
+                )
+            ),
+        )
 
     def __is_any_element_found(self, timeout: float, state: ElementState) -> bool:
-        return any(self._element_finder.find_elements(self._locator, state, timeout))
-
-    def __is_element_enabled(self, element: WebElement) -> bool:
-        return element.is_enabled() and "disabled" not in element.get_attribute("class")
-
-    def __is_element_in_desired_state(self, function: Callable[[WebElement], bool], state: str, timeout: float) -> bool:
-        desired_state = DesiredState(function, state)
-        desired_state.is_catching_timeout_exception = True
-        desired_state.is_throwing_no_such_element_exception = True
-        return self.__is_element_in_desired_condition(timeout, desired_state)
+        return self.__wait_for_state(
+            self._element_finder.resolve_state(state),
+            True,
+            timeout,
+            lambda poll_timeout: any(
+                self._element_finder.find_elements(self._locator, state, poll_timeout, is_first_match_enough=True)
+            ),
+        )
+
+    def __wait_for_state(
+        self,
+        state: DesiredState,
+        is_expected: bool,
+        timeout: float,
+        poll: Callable[[float], bool],
+    ) -> bool:
+        """Waits for the state reacting on DOM mutations in the browser when it is possible, otherwise polls it
 
-    def __do_and_log_wait_for_state(self, function: Callable[[], bool], msg_key: str, timeout: float = None) -> bool:
-        if timeout is None or timeout == 0:
+        Args:
+            state: Desired state of element
+            is_expected: Waits for element in desired state if true and for its absence otherwise
+            timeout: Timeout for waiting
+            poll: Polling wait of the state with the given timeout
+        """
+        if not self._is_waiting_by_events(state, timeout):
+            return poll(timeout)
+        try:
+            self._element_finder.wait_for_state_by_events(self._locator, state, is_expected, timeout)
+            return True
+        except TimeoutException as e:
+            # The last check defines the result of timed out wait, so logging and exceptions are the same as for polling
+            try:
+                return poll(0)
+            except TimeoutException:
+                raise e
+        except WebDriverException:
+            return poll(timeout)
+
+    def __do_and_log_wait_for_state(
+        self,
+        function: Callable[[], bool],
+        msg_key: str,
+        timeout: float = None,
+        is_single_check: bool = False,
+    ) -> bool:
+        if self._is_checked_once(timeout, is_single_check):
             return function()
 
-        condition_key = f"loc.el.state.{msg_key}"
-        self._log_element_state("loc.wait.for.state", condition_key)
+        self._log_wait_for_state(msg_key)
         result = self._conditional_wait.wait_for_condition(function, timeout)
         if not result:
-            self._log_element_state("loc.wait.for.state.failed", condition_key)
+            self._log_wait_for_state(msg_key, is_failed=True)
         return result
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import abc
+import threading
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.configurations.element_cache_configuration import ElementCacheConfiguration
+from py_selenium_auto_core.configurations.logger_configuration import LoggerConfiguration
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.core_element import CoreElement
+from py_selenium_auto_core.elements.element_cache_registry import ElementCacheRegistry
+from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.localization.localization_manager import LocalizationManager
+from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.utilities.action_retrier import ActionRetrier
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
+from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+
+if TYPE_CHECKING:
+    from py_selenium_auto_core.applications.startup import ServiceProvider
+    from py_selenium_auto_core.elements.element_factory import ElementFactory
+
+
+class ElementServices:
+    """Collaborators of elements resolved once per service provider, so they are shared by all elements
+    of the session instead of being resolved (and created by factory providers) on every action
+    """
+
+    __slots__ = (
+        "action_retrier",
+        "async_conditional_wait",
+        "async_element_finder",
+        "cache_configuration",
+        "conditional_wait",
+        "element_cache_registry",
+        "factory",
+        "finder",
+        "localization_manager",
+        "localized_logger",
+        "logger_configuration",
+    )
+
+    _resolved: "WeakKeyDictionary[ServiceProvider, ElementServices]" = WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    def __init__(self, service_provider: ServiceProvider):
+        """ElementServices constructor
+
+        Args:
+            service_provider: Service provider of the session
+        """
+        self.action_retrier: ActionRetrier = service_provider.element_action_retrier()
+        self.async_conditional_wait: AsyncConditionalWait = service_provider.async_conditional_wait()
+        self.async_element_finder: AsyncElementFinder = service_provider.async_element_finder()
+        self.cache_configuration: ElementCacheConfiguration = service_provider.element_cache_configuration()
+        self.conditional_wait: ConditionalWait = service_provider.conditional_wait()
+        self.element_cache_registry: ElementCacheRegistry = service_provider.element_cache_registry()
+        self.factory: ElementFactory = service_provider.element_factory()
+        self.finder: ElementFinder = service_provider.element_finder()
+        self.localization_manager: LocalizationManager = service_provider.localization_manager()
+        self.localized_logger: LocalizedLogger = service_provider.localized_logger()
+        self.logger_configuration: LoggerConfiguration = service_provider.logger_configuration()
+
+    @classmethod
+    def of(cls, service_provider: ServiceProvider) -> ElementServices:
+        """Gets collaborators of elements resolved from the service provider
+
+        Args:
+            service_provider: Service provider of the session
+
+        Returns:
+            Collaborators shared by elements of the session
+        """
+        services = cls._resolved.get(service_provider)
+        if services is None:
+            with cls._lock:
+                services = cls._resolved.get(service_provider)
+                if services is None:
+                    services = cls(service_provider)
+                    cls._resolved[service_provider] = services
+        return services
+
+
+class ServiceBoundElement(CoreElement, abc.ABC):
+    """Element that takes its collaborators from the service provider of the session.
+    Collaborators are resolved once per service provider and bound to the element on its first action,
+    so actions do not go through the service provider. Subclasses only define service_provider.
+    """
+
+    __slots__ = ("_services", "_services_provider")
+
+    def __init__(self, locator: Locator, name: str, element_state: ElementState):
+        super().__init__(locator, name, element_state)
+        self._services: ElementServices | None = None
+        self._services_provider: ServiceProvider | None = None
+
+    @property
+    @abc.abstractmethod
+    def service_provider(self) -> ServiceProvider:
+        """Gets service provider of the session the element belongs to"""
+        raise NotImplementedError("Abstract")
+
+    @property
+    def services(self) -> ElementServices:
+        """Gets collaborators bound to the element. They are bound again if the service provider has been changed"""
+        service_provider = self.service_provider
+        if self._services is None or self._services_provider is not service_provider:
+            self._services = ElementServices.of(service_provider)
+            self._services_provider = service_provider
+        return self._services
+
+    @property
+    def action_retrier(self) -> ActionRetrier:
+        return self.services.action_retrier
+
+    @property
+    def async_conditional_wait(self) -> AsyncConditionalWait:
+        return self.services.async_conditional_wait
+
+    @property
+    def async_element_finder(self) -> AsyncElementFinder:
+        return self.services.async_element_finder
+
+    @property
+    def application(self) -> Application:
+        # application is not bound as it could be restarted within the session
+        return self.service_provider.application()
+
+    @property
+    def cache_configuration(self) -> ElementCacheConfiguration:
+        return self.services.cache_configuration
+
+    @property
+    def conditional_wait(self) -> ConditionalWait:
+        return self.services.conditional_wait
+
+    @property
+    def element_cache_registry(self) -> ElementCacheRegistry:
+        return self.services.element_cache_registry
+
+    @property
+    def factory(self) -> ElementFactory:
+        return self.services.factory
+
+    @property
+    def finder(self) -> ElementFinder:
+        return self.services.finder
+
+    @property
+    def localization_manager(self) -> LocalizationManager:
+        return self.services.localization_manager
+
+    @property
+    def localized_logger(self) -> LocalizedLogger:
+        return self.services.localized_logger
+
+    @property
+    def logger_configuration(self) -> LoggerConfiguration:
+        return self.services.logger_configuration
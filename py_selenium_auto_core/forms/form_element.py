@@ -0,0 +1,62 @@
+from typing import Generic, Optional, Type, TypeVar, overload
+
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.locator.locator import Locator
+
+T = TypeVar("T")
+
+
+class FormElement(Generic[T]):
+    """Declares element of a form on the class level.
+    Locator, name and state are kept once per form class, the element is created on the first access
+    and kept by the form instance, so elements that are not used by the test are not created at all.
+
+    Example:
+        class LoginForm(CoreForm):
+            user_name = FormElement(TextBox, Locator.by_id("user"), "User name")
+    """
+
+    __slots__ = ("element_type", "locator", "name", "state", "_attribute")
+
+    def __init__(
+        self,
+        element_type: Type[T],
+        locator: Locator,
+        name: str = None,
+        state: ElementState = ElementState.Displayed,
+    ):
+        """FormElement constructor
+
+        Args:
+            element_type: Type of the element to create
+            locator: Locator of the element
+            name: Name of the element. Name of the form attribute is used if it is not set
+            state: State of the element
+        """
+        self.element_type = element_type
+        self.locator = locator
+        self.name = name
+        self.state = state
+        self._attribute: Optional[str] = None
+
+    def __set_name__(self, owner: type, attribute: str):
+        self._attribute = attribute
+        if self.name is None:
+            self.name = attribute
+
+    @overload
+    def __get__(self, form: None, owner: type) -> "FormElement[T]":
+        ...
+
+    @overload
+    def __get__(self, form: object, owner: type) -> T:
+        ...
+
+    def __get__(self, form, owner):
+        if form is None:
+            return self
+        if self._attribute is None:
+            raise TypeError("FormElement has to be declared as an attribute of the form class")
+        # the element is stored under the attribute name, so next accesses do not reach the descriptor
+        element = self.element_type(self.locator, self.name, self.state)
+        return form.__dict__.setdefault(self._attribute, element)
@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from py_selenium_auto_core.configurations.element_search_configuration import ElementSearchConfiguration
+from py_selenium_auto_core.locator.locator import Locator
+
+
+class CompiledLocatorStatistics:
+    """Counters of the compiled locator cache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return f"CompiledLocatorStatistics(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class CompiledLocatorCache:
+    """Keeps locators generated from other locators (child, index locators), so repeated generation is a lookup.
+    Least recently used locators are evicted when the cache is full.
+    """
+
+    def __init__(self, element_search_configuration: ElementSearchConfiguration = None):
+        """CompiledLocatorCache constructor
+
+        Args:
+            element_search_configuration: Element search configuration with the size of the cache
+        """
+        self._max_size = (element_search_configuration or ElementSearchConfiguration({})).compiled_locator_cache_size
+        self._locators: "OrderedDict[Hashable, Locator]" = OrderedDict()
+        self._statistics = CompiledLocatorStatistics()
+        self._lock = threading.Lock()
+
+    @property
+    def statistics(self) -> CompiledLocatorStatistics:
+        """Gets counters of the cache"""
+        return self._statistics
+
+    def get(self, key: Hashable, compile_locator: Callable[[], Locator]) -> Locator:
+        """Gets compiled locator by the key, compiles it if it is not cached
+
+        Args:
+            key: Locators and parameters the locator is compiled from
+            compile_locator: Compiles the locator
+
+        Returns:
+            Compiled locator
+        """
+        with self._lock:
+            locator = self._locators.get(key)
+            if locator is not None:
+                self._locators.move_to_end(key)
+                self._statistics.hits += 1
+                return locator
+        # compilation could fail for unsupported locators, so it is done before the locator is cached
+        locator = compile_locator()
+        with self._lock:
+            self._statistics.misses += 1
+            if self._max_size:
+                self._locators[key] = locator
+                while len(self._locators) > self._max_size:
+                    self._locators.popitem(last=False)
+                    self._statistics.evictions += 1
+        return locator
+
+    def clear(self) -> None:
+        """Removes all compiled locators"""
+        with self._lock:
+            self._locators.clear()
@@ -1,17 +1,94 @@
-from dataclasses import dataclass
+import threading
+from typing import ClassVar, Dict, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from selenium.webdriver.common.by import By
 
 
-@dataclass
 class Locator:
-    """Wrapper for Selenium Locator"""
+    """Wrapper for Selenium Locator.
+    Locator is immutable and interned: equal locators are the same object, so it can be used as a key of caches
+    at the cost of identity hash. String and XPath forms are computed once per locator.
+    """
+
+    __slots__ = ("by", "value", "_hash", "_string", "_xpath", "__weakref__")
+
+    xpath_templates: ClassVar[Dict[str, str]] = {
+        By.ID: "//*[@id='{0}']",
+        By.CLASS_NAME: "//*[contains(@class,'{0}')]",
+        By.NAME: "//*[@name='{0}']",
+        By.TAG_NAME: "//{0}",
+        By.XPATH: "{0}",
+    }
+
+    _interned: ClassVar["WeakValueDictionary[Tuple[str, str], Locator]"] = WeakValueDictionary()
+    _intern_lock: ClassVar[threading.Lock] = threading.Lock()
 
     by: By
     value: str
 
-    def to_string(self):
-        return f"By.{str(self.by).upper().replace(' ', '_')}: {self.value}"
+    def __new__(cls, by: By, value: str) -> "Locator":
+        key = (by, value)
+        with cls._intern_lock:
+            locator = cls._interned.get(key) if cls is Locator else None
+            if locator is None:
+                locator = super().__new__(cls)
+                object.__setattr__(locator, "by", by)
+                object.__setattr__(locator, "value", value)
+                object.__setattr__(locator, "_hash", hash(key))
+                object.__setattr__(locator, "_string", None)
+                object.__setattr__(locator, "_xpath", None)
+                if cls is Locator:
+                    cls._interned[key] = locator
+            return locator
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"Locator is immutable, cannot set '{name}'")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Locator is immutable, cannot delete '{name}'")
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Locator):
+            return NotImplemented
+        # locators of different kinds (e.g. scoped one) differ in hash, so they are never equal
+        if type(self) is not type(other):
+            return False
+        return self.by == other.by and self.value == other.value
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (self.by, self.value)
+
+    def __copy__(self) -> "Locator":
+        return self
+
+    def __deepcopy__(self, memo) -> "Locator":
+        return self
+
+    def to_string(self) -> str:
+        if self._string is None:
+            object.__setattr__(self, "_string", f"By.{str(self.by).upper().replace(' ', '_')}: {self.value}")
+        return self._string
+
+    def to_xpath(self) -> Optional["Locator"]:
+        """Gets equivalent XPath locator
+
+        Returns:
+            XPath locator or None if the locator strategy cannot be expressed by XPath
+        """
+        if self.by == By.XPATH:
+            return self
+        if self._xpath is None:
+            template = self.xpath_templates.get(self.by)
+            if template is None:
+                return None
+            object.__setattr__(self, "_xpath", Locator(By.XPATH, template.format(self.value)))
+        return self._xpath
 
     @staticmethod
     def by_xpath(value: str) -> "Locator":
@@ -0,0 +1,161 @@
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+from selenium.webdriver.common.by import By
+
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.locator.scoped_locator import ScopedLocator
+
+_IDENTIFIER = re.compile(r"^-?[A-Za-z_][\w-]*$")
+_NAME = r"[A-Za-z_][\w-]*"
+_VALUE = r"(?:'([^']*)'|\"([^\"]*)\")"
+_STEP = re.compile(rf"^({_NAME}|\*)((?:\[[^\[\]]+\])*)$")
+_PREDICATE = re.compile(r"\[([^\[\]]+)\]")
+_ATTRIBUTE_EQUALS = re.compile(rf"^\s*@({_NAME})\s*=\s*{_VALUE}\s*$")
+_ATTRIBUTE_EXISTS = re.compile(rf"^\s*@({_NAME})\s*$")
+_ATTRIBUTE_CONTAINS = re.compile(rf"^\s*contains\(\s*@({_NAME})\s*,\s*{_VALUE}\s*\)\s*$")
+_AXIS = re.compile(r"(//|/)")
+
+
+class LocatorCompiler:
+    """Expresses locators by CSS selectors when it is possible, as browsers evaluate CSS faster than XPath.
+    Simple XPaths (tag names, attribute equality, existence and contains conditions) are rewritten to CSS,
+    other XPaths are kept as is. Results are memoized per locator.
+    """
+
+    def optimize(self, locator: Locator) -> Locator:
+        """Gets CSS equivalent of the locator if it exists, otherwise the locator itself
+
+        Args:
+            locator: Locator to optimize
+
+        Returns:
+            CSS selector locator or the given locator
+        """
+        if isinstance(locator, ScopedLocator) or locator.by != By.XPATH:
+            return locator
+        css = _to_css(locator)
+        return locator if css is None else Locator(By.CSS_SELECTOR, css)
+
+    def to_css(self, locator: Locator) -> Optional[str]:
+        """Gets CSS selector equivalent to the locator
+
+        Args:
+            locator: Locator to convert
+
+        Returns:
+            CSS selector or None if the locator cannot be expressed by CSS
+        """
+        if isinstance(locator, ScopedLocator):
+            return None
+        return _to_css(locator)
+
+    def compose_child(self, parent_locator: Locator, child_locator: Locator) -> Optional[Locator]:
+        """Composes CSS locator of the child element relative to the parent
+
+        Args:
+            parent_locator: Locator of the parent element
+            child_locator: Locator of the child element relative to the parent, XPath child locators are treated
+                the same way as by ElementFactory (e.g. "./div" is a direct child, "div" and "//div" are descendants)
+
+        Returns:
+            CSS selector locator or None if any of the locators cannot be expressed by CSS
+        """
+        parent_css = self.to_css(parent_locator)
+        if parent_css is None or "," in parent_css:
+            return None
+        combinator = " "
+        if child_locator.by == By.XPATH:
+            value = child_locator.value[1:] if child_locator.value.startswith("./") else child_locator.value
+            if value.startswith("/") and not value.startswith("//"):
+                combinator = " > "
+                value = f"/{value}"
+            elif not value.startswith("/"):
+                value = f"//{value}"
+            child_css = _to_css(Locator(By.XPATH, value))
+        else:
+            child_css = self.to_css(child_locator)
+        if child_css is None or "," in child_css:
+            return None
+        return Locator(By.CSS_SELECTOR, f"{parent_css}{combinator}{child_css}")
+
+
+@lru_cache(maxsize=4096)
+def _to_css(locator: Locator) -> Optional[str]:
+    if locator.by == By.CSS_SELECTOR:
+        return locator.value
+    if locator.by == By.ID:
+        return _id_selector(locator.value)
+    if locator.by == By.CLASS_NAME:
+        return f".{locator.value}" if _IDENTIFIER.match(locator.value) else None
+    if locator.by == By.TAG_NAME:
+        return locator.value if re.match(rf"^{_NAME}$", locator.value) else None
+    if locator.by == By.NAME:
+        return f'[name="{_escape(locator.value)}"]'
+    if locator.by == By.XPATH:
+        return _xpath_to_css(locator.value)
+    return None
+
+
+def _xpath_to_css(xpath: str) -> Optional[str]:
+    """Converts absolute XPath of descendant and child steps, e.g. //div[@id='x']/span"""
+    if not xpath.startswith("//"):
+        return None
+    parts = [part for part in _AXIS.split(xpath.strip()) if part != ""]
+    selectors: List[str] = []
+    for axis, step in zip(parts[::2], parts[1::2]):
+        if axis not in ("//", "/"):
+            return None
+        step_css = _step_to_css(step)
+        if step_css is None:
+            return None
+        if selectors:
+            selectors.append(" " if axis == "//" else " > ")
+        selectors.append(step_css)
+    if len(parts) % 2 != 0 or not selectors:
+        return None
+    return "".join(selectors)
+
+
+def _step_to_css(step: str) -> Optional[str]:
+    match = _STEP.match(step)
+    if match is None:
+        return None
+    tag, predicates = match.groups()
+    conditions: List[str] = []
+    for predicate in _PREDICATE.findall(predicates):
+        condition = _predicate_to_css(predicate)
+        if condition is None:
+            return None
+        conditions.append(condition)
+    if tag == "*":
+        return "".join(conditions) or "*"
+    return tag + "".join(conditions)
+
+
+def _predicate_to_css(predicate: str) -> Optional[str]:
+    match = _ATTRIBUTE_EQUALS.match(predicate)
+    if match is not None:
+        name, value = match.group(1), _group_value(match)
+        return _id_selector(value) if name == "id" else f'[{name}="{_escape(value)}"]'
+    match = _ATTRIBUTE_CONTAINS.match(predicate)
+    if match is not None:
+        # contains() matches a substring, the same as *= of CSS
+        return f'[{match.group(1)}*="{_escape(_group_value(match))}"]'
+    match = _ATTRIBUTE_EXISTS.match(predicate)
+    if match is not None:
+        return f"[{match.group(1)}]"
+    return None
+
+
+def _group_value(match: "re.Match") -> str:
+    return match.group(2) if match.group(2) is not None else match.group(3)
+
+
+def _id_selector(value: str) -> str:
+    return f"#{value}" if _IDENTIFIER.match(value) else f'[id="{_escape(value)}"]'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
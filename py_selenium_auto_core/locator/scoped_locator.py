@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import List, Optional, TYPE_CHECKING
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from py_selenium_auto_core.locator.locator import Locator
+
+if TYPE_CHECKING:
+    from py_selenium_auto_core.elements.core_element import CoreElement
+
+
+class ScopedLocator(Locator):
+    """Locator of elements searched within the subtree of the parent element instead of the whole document.
+    Any locator strategy is supported (e.g. CSS selector), XPath is evaluated relative to the parent.
+    Scoped locators are not interned as they belong to the parent element.
+    """
+
+    __slots__ = ("parent", "index")
+
+    parent: CoreElement
+    index: Optional[int]
+
+    def __new__(cls, parent: CoreElement, locator: Locator, index: int = None) -> ScopedLocator:
+        """ScopedLocator constructor
+
+        Args:
+            parent: Element to search within
+            locator: Locator of elements relative to the parent
+            index: One-based index of the element among found ones, all found elements are used if it is None
+        """
+        scoped = super().__new__(cls, locator.by, cls._to_relative_xpath(locator))
+        object.__setattr__(scoped, "parent", parent)
+        object.__setattr__(scoped, "index", index)
+        object.__setattr__(scoped, "_hash", hash((scoped.by, scoped.value, id(parent), index)))
+        return scoped
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Locator):
+            return NotImplemented
+        if not isinstance(other, ScopedLocator):
+            return False
+        return (
+            self.by == other.by
+            and self.value == other.value
+            and self.parent is other.parent
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (self.parent, Locator(self.by, self.value), self.index)
+
+    def to_string(self) -> str:
+        if self._string is None:
+            index = "" if self.index is None else f"[{self.index}]"
+            object.__setattr__(self, "_string", f"{self.parent.locator.to_string()} >> {super().to_string()}{index}")
+        return self._string
+
+    def to_xpath(self) -> Optional[Locator]:
+        # relative locator has no absolute XPath form
+        return None
+
+    def with_index(self, index: int) -> ScopedLocator:
+        """Gets locator of the element found by this locator at the index
+
+        Args:
+            index: One-based index of the element among found ones
+        """
+        return ScopedLocator(self.parent, Locator(self.by, self.value), index)
+
+    def find_elements(self) -> List[WebElement]:
+        """Finds elements within the subtree of the parent. The parent is resolved once per search
+
+        Exception:
+            NoSuchElementException: Thrown if the parent is not found
+            StaleElementReferenceException: Thrown if the parent has become stale during the search
+        """
+        found_elements = self.parent.find_web_elements_within(self.by, self.value)
+        if self.index is None:
+            return found_elements
+        return found_elements[self.index - 1:self.index]
+
+    @staticmethod
+    def _to_relative_xpath(locator: Locator) -> str:
+        """XPath child locators keep the meaning they have had when they were joined to the absolute parent XPath"""
+        if locator.by != By.XPATH or locator.value.startswith("."):
+            return locator.value
+        if locator.value.startswith("/"):
+            return f".{locator.value}"
+        return f".//{locator.value}"
@@ -0,0 +1,12 @@
+var by = arguments[0];
+var value = arguments[1];
+
+var candidates = query(by, value);
+var count = 0;
+for (var j = 0; j < candidates.length; j++) {
+    var element = candidates[j];
+    if (__CONDITION__) {
+        count++;
+    }
+}
+return count;
@@ -0,0 +1,13 @@
+var isDisplayedAtom = (__IS_DISPLAYED_ATOM__);
+
+function isDisplayed(element) {
+    return !!isDisplayedAtom(element);
+}
+
+function isEnabled(element) {
+    return !(element.matches && element.matches(':disabled'));
+}
+
+function hasNoDisabledClass(element) {
+    return (element.getAttribute('class') || '').indexOf('disabled') === -1;
+}
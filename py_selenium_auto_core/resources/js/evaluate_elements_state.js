@@ -0,0 +1,7 @@
+var elements = arguments[0];
+var states = [];
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i];
+    states.push(!!(__CONDITION__));
+}
+return states;
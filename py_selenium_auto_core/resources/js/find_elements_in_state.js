@@ -0,0 +1,16 @@
+var by = arguments[0];
+var value = arguments[1];
+var isFirstMatchEnough = arguments[2];
+
+var candidates = query(by, value);
+var matches = [];
+for (var j = 0; j < candidates.length; j++) {
+    var element = candidates[j];
+    if (__CONDITION__) {
+        matches.push(element);
+        if (isFirstMatchEnough) {
+            break;
+        }
+    }
+}
+return [candidates.length, matches];
@@ -0,0 +1,5 @@
+// Marks the document with a random token once, so a new document (navigation, reload) gets a new token
+if (!window.__pyAutoCoreDocumentGeneration) {
+    window.__pyAutoCoreDocumentGeneration = Date.now().toString(36) + Math.random().toString(36).slice(2);
+}
+return window.__pyAutoCoreDocumentGeneration;
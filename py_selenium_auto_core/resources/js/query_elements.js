@@ -0,0 +1,33 @@
+function escapeAttributeValue(text) {
+    return text.replace(/(["\\])/g, '\\$1');
+}
+
+function toArray(nodes) {
+    return Array.prototype.slice.call(nodes);
+}
+
+function query(by, value) {
+    switch (by) {
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                var node = snapshot.snapshotItem(i);
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    nodes.push(node);
+                }
+            }
+            return nodes;
+        case 'css selector':
+            return toArray(document.querySelectorAll(value));
+        case 'id':
+            return toArray(document.querySelectorAll('[id="' + escapeAttributeValue(value) + '"]'));
+        case 'name':
+            return toArray(document.querySelectorAll('[name="' + escapeAttributeValue(value) + '"]'));
+        case 'class name':
+            return toArray(document.querySelectorAll('.' + CSS.escape(value)));
+        case 'tag name':
+            return toArray(document.getElementsByTagName(value));
+    }
+    throw new Error('Locator strategy is not supported: ' + by);
+}
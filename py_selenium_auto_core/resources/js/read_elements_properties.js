@@ -0,0 +1,55 @@
+var elements = arguments[0];
+var kind = arguments[1];
+var names = arguments[2];
+// Atoms shipped with Selenium, so values match WebElement.text and WebElement.get_attribute
+var isDisplayedAtom = (__IS_DISPLAYED_ATOM__);
+var getAttributeAtom = (__GET_ATTRIBUTE_ATOM__);
+
+function readText(element) {
+    // Hidden element has no visible text
+    if (!isDisplayedAtom(element)) {
+        return '';
+    }
+    return (element.innerText || '').replace(/^\s+|\s+$/g, '');
+}
+
+function readAttribute(element, name) {
+    return getAttributeAtom(element, name);
+}
+
+function readRect(element) {
+    var rect = element.getBoundingClientRect();
+    return {
+        x: rect.left + window.pageXOffset,
+        y: rect.top + window.pageYOffset,
+        width: rect.width,
+        height: rect.height
+    };
+}
+
+function readProperties(element) {
+    var properties = {};
+    for (var i = 0; i < names.length; i++) {
+        properties[names[i]] = element[names[i]];
+    }
+    return properties;
+}
+
+var values = [];
+for (var j = 0; j < elements.length; j++) {
+    var element = elements[j];
+    switch (kind) {
+        case 'text':
+            values.push(readText(element));
+            break;
+        case 'attribute':
+            values.push(readAttribute(element, names[0]));
+            break;
+        case 'rect':
+            values.push(readRect(element));
+            break;
+        default:
+            values.push(readProperties(element));
+    }
+}
+return values;
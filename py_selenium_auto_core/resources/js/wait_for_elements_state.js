@@ -0,0 +1,58 @@
+var by = arguments[0];
+var value = arguments[1];
+var isExpected = arguments[2];
+var timeoutMs = arguments[3];
+var callback = arguments[arguments.length - 1];
+
+function isAnyElementInState() {
+    var candidates = query(by, value);
+    for (var i = 0; i < candidates.length; i++) {
+        var element = candidates[i];
+        if (__CONDITION__) {
+            return true;
+        }
+    }
+    return false;
+}
+
+function isSatisfied() {
+    return isAnyElementInState() === isExpected;
+}
+
+if (isSatisfied()) {
+    callback(true);
+} else {
+    var isFinished = false;
+    var observer = null;
+    var checkInterval = null;
+    var timer = null;
+
+    var finish = function (result) {
+        if (isFinished) {
+            return;
+        }
+        isFinished = true;
+        observer.disconnect();
+        clearInterval(checkInterval);
+        clearTimeout(timer);
+        callback(result);
+    };
+    var check = function () {
+        try {
+            if (!isFinished && isSatisfied()) {
+                finish(true);
+            }
+        } catch (e) {
+            // let the next call of the script report the error
+            finish(false);
+        }
+    };
+
+    observer = new MutationObserver(check);
+    observer.observe(document, {attributes: true, characterData: true, childList: true, subtree: true});
+    // visibility could be changed without DOM mutations (e.g. by CSS transitions or media queries)
+    checkInterval = setInterval(check, 100);
+    timer = setTimeout(function () {
+        finish(false);
+    }, timeoutMs);
+}
@@ -17,12 +17,20 @@ class ActionRetrier:
         """
         self._retry_configuration = retry_configuration
 
-    def do_with_retry(self, function: Callable, handled_exceptions: list = None) -> Any:
+    def do_with_retry(
+        self,
+        function: Callable,
+        handled_exceptions: list = None,
+        recover: Callable[[Exception], bool] = None,
+    ) -> Any:
         """Retries the action when one of the handledExceptions occures.
 
         Args:
             function: Action to be applied
             handled_exceptions: Exceptions to be handled
+            recover: Recovers from the handled exception (e.g. drops stale element reference) and returns true
+                if the action can be retried at once. Only the first of consecutive recovered failures is retried
+                without waiting, repeated ones wait polling interval as usual
 
         Returns:
             Condition result which is waiting for.
@@ -33,6 +41,7 @@ class ActionRetrier:
         exceptions_to_handle = handled_exceptions if handled_exceptions is not None else []
         retry_attempts_left = self._retry_configuration.number
         actual_interval = self._retry_configuration.polling_interval
+        is_recovered = False
         result = None
 
         while retry_attempts_left >= 0:
@@ -41,7 +50,10 @@ class ActionRetrier:
                 break
             except Exception as e:
                 if retry_attempts_left != 0 and self._is_ignored_exception(e, exceptions_to_handle):
-                    sleep(actual_interval)
+                    is_retried_at_once = recover is not None and recover(e) and not is_recovered
+                    if not is_retried_at_once:
+                        sleep(actual_interval)
+                    is_recovered = is_recovered or is_retried_at_once
                     retry_attempts_left -= 1
                 else:
                     raise e
@@ -69,5 +81,10 @@ class ElementActionRetrier(ActionRetrier):
             InvalidElementStateException,
         ]
 
-    def do_with_retry(self, function: Callable, handled_exceptions: Optional[list] = None) -> Any:
-        return super().do_with_retry(function, handled_exceptions or self.handled_exceptions)
+    def do_with_retry(
+        self,
+        function: Callable,
+        handled_exceptions: Optional[list] = None,
+        recover: Callable[[Exception], bool] = None,
+    ) -> Any:
+        return super().do_with_retry(function, handled_exceptions or self.handled_exceptions, recover)
@@ -0,0 +1,38 @@
+import enum
+import os
+import pkgutil
+from functools import lru_cache
+
+from py_selenium_auto_core.utilities.file_reader import FileReader
+from py_selenium_auto_core.utilities.root_path_helper import RootPathHelper
+
+
+class JavaScript(enum.Enum):
+    """Scripts from the resources of the library"""
+
+    CountElementsInState = "count_elements_in_state.js"
+    ElementStateHelpers = "element_state_helpers.js"
+    EvaluateElementsState = "evaluate_elements_state.js"
+    FindElementsInState = "find_elements_in_state.js"
+    GetDocumentGeneration = "get_document_generation.js"
+    QueryElements = "query_elements.js"
+    ReadElementsProperties = "read_elements_properties.js"
+    WaitForElementsState = "wait_for_elements_state.js"
+
+    @property
+    def script(self) -> str:
+        """Gets the text of the script"""
+        return _read_script(self.value)
+
+
+@lru_cache(maxsize=None)
+def get_selenium_atom(file_name: str) -> str:
+    """Gets the atom shipped with Selenium (e.g. isDisplayed.js, getAttribute.js),
+    so scripts of the library give the same results as the corresponding WebElement methods
+    """
+    return pkgutil.get_data("selenium.webdriver.remote", file_name).decode("utf8")
+
+
+@lru_cache(maxsize=None)
+def _read_script(file_name: str) -> str:
+    return FileReader.get_resource_file(os.path.join("js", file_name), RootPathHelper.current_root_path(__file__))
@@ -0,0 +1,226 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, List, Union
+
+from selenium.common import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from py_selenium_auto_core.waitings.conditional_wait import _BaseConditionalWait
+from py_selenium_auto_core.waitings.deadline import Deadline
+
+
+class AsyncConditionalWait(_BaseConditionalWait):
+    """This class is used for waiting any conditions within asyncio event loop.
+    Sleeps between checks do not block the loop and driver calls are run in the loop's default executor,
+    so a single loop could run waits across many sessions.
+    """
+
+    @classmethod
+    def of(cls, conditional_wait: _BaseConditionalWait) -> "AsyncConditionalWait":
+        """Creates asynchronous wait with the same configuration as the given wait
+
+        Args:
+            conditional_wait: Wait to take timeout configuration and service provider from
+        """
+        return cls(conditional_wait._timeout_configuration, conditional_wait._service_provider)
+
+    async def wait_for_driver(
+        self,
+        function: Callable[[WebDriver], Any],
+        timeout: float = None,
+        polling_interval: float = None,
+        message: str = None,
+        exceptions_to_ignore: List = None,
+    ) -> Any:
+        """Wait for some object from condition with timeout using Selenium WebDriver.
+
+        Args:
+            function: Predicate for waiting. It is run in the executor
+            timeout: Condition timeout. Default value is TimeoutConfiguration.condition
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
+            message: Part of error message in case of Timeout exception
+            exceptions_to_ignore: Possible exceptions that have to be ignored.
+                Handles StaleElementReferenceException by default.
+
+        Returns:
+            Condition result which is waiting for.
+
+        Exception:
+            WebDriverTimeoutException: Throws when timeout exceeded and condition not satisfied.
+        """
+        # NoSuchElementException is always ignored as it is done by WebDriverWait
+        ignore_exceptions = [*(exceptions_to_ignore or [StaleElementReferenceException]), NoSuchElementException]
+        # getting the application or its driver could start the browser, so it is not done on the loop thread
+        application = await self._run_in_executor(self._service_provider.application)
+        implicit_wait_scope = self._service_provider.implicit_wait_tracker().scope(application, 0)
+        await self._run_in_executor(implicit_wait_scope.__enter__)
+        try:
+            driver = await self._run_in_executor(lambda: application.driver)
+            return await self._wait_for_result(
+                function=lambda: function(driver),
+                timeout=timeout,
+                polling_interval=polling_interval,
+                message=message,
+                exceptions_to_ignore=ignore_exceptions,
+            )
+        finally:
+            await self._run_in_executor(implicit_wait_scope.__exit__, None, None, None)
+
+    async def wait_for_condition(
+        self,
+        function: Callable[[], Union[bool, Awaitable[bool]]],
+        timeout: float = None,
+        polling_interval: float = None,
+        exceptions_to_ignore: list = None,
+    ) -> bool:
+        """Wait for some condition within timeout.
+
+        Args:
+            function: Predicate for waiting. Coroutine functions are awaited, other functions are run in the executor
+            timeout: Condition timeout. Default value is TimeoutConfiguration.condition
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
+            exceptions_to_ignore: Possible exceptions that have to be ignored
+
+        Returns:
+            True if condition satisfied and false otherwise.
+        """
+        try:
+            await self.wait_for_true(
+                function=function,
+                timeout=timeout,
+                polling_interval=polling_interval,
+                exceptions_to_ignore=exceptions_to_ignore,
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    async def wait_for_true(
+        self,
+        function: Callable[[], Union[bool, Awaitable[bool]]],
+        timeout: float = None,
+        polling_interval: float = None,
+        message: str = None,
+        exceptions_to_ignore: list = None,
+    ) -> None:
+        """Wait for some condition within timeout.
+
+        Args:
+            function: Predicate for waiting. Coroutine functions are awaited, other functions are run in the executor
+            timeout: Condition timeout. Default value is TimeoutConfiguration.condition
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
+            message: Part of error message in case of Timeout exception
+            exceptions_to_ignore: Possible exceptions that have to be ignored
+
+        Exception:
+            TimeoutException: Throws exception when timeout exceeded and condition not satisfied
+        """
+        if function is None:
+            raise ValueError("Function cannot be None")
+
+        await self._wait_for_result(
+            function=function,
+            timeout=timeout,
+            polling_interval=polling_interval,
+            message=message,
+            exceptions_to_ignore=exceptions_to_ignore or [],
+        )
+
+    async def wait_for_async_script(
+        self,
+        script: str,
+        args: List = None,
+        timeout: float = None,
+        message: str = None,
+    ) -> Any:
+        """Wait for the asynchronous script to report truthy result.
+        Each slice of the script is run in the executor, see ConditionalWait.wait_for_async_script
+
+        Args:
+            script: Asynchronous script that reacts on the changes in the browser (e.g. using MutationObserver)
+            args: Arguments of the script
+            timeout: Condition timeout. Default value is TimeoutConfiguration.condition
+            message: Part of error message in case of Timeout exception
+
+        Returns:
+            Result reported by the script.
+
+        Exception:
+            TimeoutException: Throws when timeout exceeded and the script has not reported truthy result
+            JavascriptException: Throws when the script has failed while the document has not been changed
+        """
+        wait_timeout = self._resolve_condition_timeout(timeout)
+        driver = await self._run_in_executor(lambda: self._service_provider.application().driver)
+        generation = await self._run_in_executor(self._get_document_generation, driver)
+        with Deadline.scope(wait_timeout) as deadline:
+            while True:
+                try:
+                    result = await self._run_in_executor(
+                        driver.execute_async_script,
+                        script,
+                        *(args or []),
+                        int(min(deadline.remaining, self.async_script_slice) * 1000),
+                    )
+                    if result:
+                        return result
+                except TimeoutException:
+                    # Driver's script timeout is shorter than the slice, run the next slice
+                    pass
+                except JavascriptException:
+                    current_generation = await self._run_in_executor(self._get_document_generation, driver)
+                    if current_generation == generation:
+                        # Script has failed in the same document (e.g. invalid selector), so it is not retried
+                        raise
+                    # Document has been unloaded during the run of the script, the next slice runs in the new one
+                    generation = generation if current_generation is None else current_generation
+                    await asyncio.sleep(min(self._resolve_polling_interval(None), deadline.remaining))
+                if deadline.is_expired:
+                    raise TimeoutException(self._get_timeout_exception_message(wait_timeout, message))
+
+    async def _wait_for_result(
+        self,
+        function: Callable[[], Any],
+        timeout: float,
+        polling_interval: float,
+        message: str,
+        exceptions_to_ignore: List,
+    ) -> Any:
+        """Asynchronous counterpart of ConditionalWait._wait_for_result"""
+        wait_timeout = self._resolve_condition_timeout(timeout)
+        intervals = self._resolve_polling_strategy(polling_interval).intervals()
+        with Deadline.scope(wait_timeout) as deadline:
+            while True:
+                result = await self._is_condition_satisfied_async(function, exceptions_to_ignore)
+                if result:
+                    return result
+                if deadline.is_expired:
+                    raise TimeoutException(self._get_timeout_exception_message(wait_timeout, message))
+                await asyncio.sleep(min(next(intervals), deadline.remaining))
+
+    async def _is_condition_satisfied_async(self, function: Callable[[], Any], exceptions_to_ignore: List) -> Any:
+        try:
+            if inspect.iscoroutinefunction(function):
+                return await function()
+            result = await self._run_in_executor(function)
+            return await result if inspect.isawaitable(result) else result
+        except Exception as ex:
+            if self._is_ignored_exception(ex, exceptions_to_ignore):
+                return False
+            raise ex
+
+    @staticmethod
+    async def _run_in_executor(function: Callable[..., Any], *args) -> Any:
+        """Runs blocking function in the default executor of the running loop.
+        Context is copied, so the deadline of the current wait is visible to the function
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(context.run, function, *args)
+        )
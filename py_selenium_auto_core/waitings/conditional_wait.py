@@ -1,21 +1,31 @@
-import time
 from time import sleep
-from typing import Any, Callable, List, TYPE_CHECKING
+from typing import Any, Callable, List, Optional, TYPE_CHECKING
 
-from selenium.common import StaleElementReferenceException, TimeoutException
+from selenium.common import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.wait import WebDriverWait
 
 from py_selenium_auto_core.configurations.timeout_configuration import (
     TimeoutConfiguration,
 )
+from py_selenium_auto_core.utilities.java_script import JavaScript
+from py_selenium_auto_core.waitings.deadline import Deadline
+from py_selenium_auto_core.waitings.polling_strategy import FixedPollingStrategy, PollingStrategy
 
 if TYPE_CHECKING:
     from py_selenium_auto_core.applications.startup import ServiceProvider
 
 
-class ConditionalWait:
-    """This class is used for waiting any conditions."""
+class _BaseConditionalWait:
+    """Configuration and helpers shared by synchronous and asynchronous waits"""
+
+    # max duration of a single asynchronous script run in seconds, keeps runs below the driver's script timeout
+    async_script_slice: float = 5
 
     def __init__(
         self,
@@ -31,6 +41,40 @@ class ConditionalWait:
         self._timeout_configuration = timeout_configuration
         self._service_provider = service_provider
 
+    @staticmethod
+    def _get_document_generation(driver: WebDriver) -> Optional[str]:
+        try:
+            return driver.execute_script(JavaScript.GetDocumentGeneration.script)
+        except WebDriverException:
+            # the document is being loaded or scripts are not supported
+            return None
+
+    @staticmethod
+    def _get_timeout_exception_message(wait_timeout: float, message: str = None) -> str:
+        exception_message = f"Timed out after {wait_timeout} seconds"
+        if message is not None:
+            exception_message += f": {message}"
+        return exception_message
+
+    def _resolve_condition_timeout(self, timeout: float) -> float:
+        return Deadline.clamp(self._timeout_configuration.condition if timeout is None else timeout)
+
+    def _resolve_polling_interval(self, polling_interval: float) -> float:
+        return self._timeout_configuration.polling_interval if polling_interval is None else polling_interval
+
+    def _resolve_polling_strategy(self, polling_interval: float) -> PollingStrategy:
+        if polling_interval is None:
+            return self._timeout_configuration.polling_strategy
+        return FixedPollingStrategy(polling_interval)
+
+    @staticmethod
+    def _is_ignored_exception(ex: Exception, exceptions_to_ignore: List) -> bool:
+        return any(map(lambda ex_to_ignore: isinstance(ex, ex_to_ignore), exceptions_to_ignore))
+
+
+class ConditionalWait(_BaseConditionalWait):
+    """This class is used for waiting any conditions."""
+
     def wait_for_driver(
         self,
         function: Callable[[WebDriver], Any],
@@ -44,7 +88,7 @@ class ConditionalWait:
         Args:
             function: Predicate for waiting
             timeout: Condition timeout. Default value is TimeoutConfiguration.condition
-            polling_interval: Condition check interval. Default value is TimeoutConfiguration.polling_interval
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
             message: Part of error message in case of Timeout exception
             exceptions_to_ignore: Possible exceptions that have to be ignored.
                 Handles StaleElementReferenceException by default.
@@ -55,21 +99,18 @@ class ConditionalWait:
         Exception:
             WebDriverTimeoutException: Throws when timeout exceeded and condition not satisfied.
         """
-        ignore_exceptions = exceptions_to_ignore or [StaleElementReferenceException]
-        wait_timeout = self._resolve_condition_timeout(timeout)
-        check_interval = self._resolve_polling_interval(polling_interval)
+        # NoSuchElementException is always ignored as it is done by WebDriverWait
+        ignore_exceptions = [*(exceptions_to_ignore or [StaleElementReferenceException]), NoSuchElementException]
         application = self._service_provider.application()
-        application.set_implicit_wait_timeout(0)
-        wait = WebDriverWait(
-            driver=application.driver,
-            timeout=wait_timeout,
-            poll_frequency=check_interval,
-            ignored_exceptions=ignore_exceptions,
-        )
-
-        result = wait.until(function, self.__get_timeout_exception_message(wait_timeout, message))
-        application.set_implicit_wait_timeout(self._timeout_configuration.implicit)
-        return result
+        with self._service_provider.implicit_wait_tracker().scope(application, 0):
+            driver = application.driver
+            return self._wait_for_result(
+                function=lambda: function(driver),
+                timeout=timeout,
+                polling_interval=polling_interval,
+                message=message,
+                exceptions_to_ignore=ignore_exceptions,
+            )
 
     def wait_for_condition(
         self,
@@ -83,7 +124,7 @@ class ConditionalWait:
         Args:
             function: Predicate for waiting
             timeout: Condition timeout. Default value is TimeoutConfiguration.condition
-            polling_interval: Condition check interval. Default value is TimeoutConfiguration.polling_interval
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
             exceptions_to_ignore: Possible exceptions that have to be ignored
 
         Returns:
@@ -117,7 +158,7 @@ class ConditionalWait:
         Args:
             function: Predicate for waiting
             timeout: Condition timeout. Default value is TimeoutConfiguration.condition
-            polling_interval: Condition check interval. Default value is TimeoutConfiguration.polling_interval
+            polling_interval: Condition check interval. Default is defined by TimeoutConfiguration.polling_strategy
             message: Part of error message in case of Timeout exception
             exceptions_to_ignore: Possible exceptions that have to be ignored
 
@@ -127,22 +168,87 @@ class ConditionalWait:
         if function is None:
             raise ValueError("Function cannot be None")
 
+        self._wait_for_result(
+            function=function,
+            timeout=timeout,
+            polling_interval=polling_interval,
+            message=message,
+            exceptions_to_ignore=exceptions_to_ignore or [],
+        )
+
+    def wait_for_async_script(
+        self,
+        script: str,
+        args: List = None,
+        timeout: float = None,
+        message: str = None,
+    ) -> Any:
+        """Wait for the asynchronous script to report truthy result.
+        The script is run in slices: it receives the duration of the slice in milliseconds as the last argument
+        before the callback and has to call the callback with falsy value when the slice is over.
+
+        Args:
+            script: Asynchronous script that reacts on the changes in the browser (e.g. using MutationObserver)
+            args: Arguments of the script
+            timeout: Condition timeout. Default value is TimeoutConfiguration.condition
+            message: Part of error message in case of Timeout exception
+
+        Returns:
+            Result reported by the script.
+
+        Exception:
+            TimeoutException: Throws when timeout exceeded and the script has not reported truthy result
+            JavascriptException: Throws when the script has failed while the document has not been changed
+        """
         wait_timeout = self._resolve_condition_timeout(timeout)
-        check_interval = self._resolve_polling_interval(polling_interval)
-        start_time = time.time()
-        while True:
-            if self._is_condition_satisfied(function, exceptions_to_ignore or []):
-                return
-            if time.time() - start_time > wait_timeout:
-                raise TimeoutException(self.__get_timeout_exception_message(wait_timeout, message))
-            sleep(check_interval)
+        driver = self._service_provider.application().driver
+        generation = self._get_document_generation(driver)
+        with Deadline.scope(wait_timeout) as deadline:
+            while True:
+                try:
+                    result = driver.execute_async_script(
+                        script,
+                        *(args or []),
+                        int(min(deadline.remaining, self.async_script_slice) * 1000),
+                    )
+                    if result:
+                        return result
+                except TimeoutException:
+                    # Driver's script timeout is shorter than the slice, run the next slice
+                    pass
+                except JavascriptException:
+                    current_generation = self._get_document_generation(driver)
+                    if current_generation == generation:
+                        # Script has failed in the same document (e.g. invalid selector), so it is not retried
+                        raise
+                    # Document has been unloaded during the run of the script, the next slice runs in the new one
+                    generation = generation if current_generation is None else current_generation
+                    sleep(min(self._resolve_polling_interval(None), deadline.remaining))
+                if deadline.is_expired:
+                    raise TimeoutException(self._get_timeout_exception_message(wait_timeout, message))
 
-    @staticmethod
-    def __get_timeout_exception_message(wait_timeout: float, message: str = None) -> str:
-        exception_message = f"Timed out after {wait_timeout} seconds"
-        if message is not None:
-            exception_message += f": {message}"
-        return exception_message
+    def _wait_for_result(
+        self,
+        function: Callable[[], Any],
+        timeout: float,
+        polling_interval: float,
+        message: str,
+        exceptions_to_ignore: List,
+    ) -> Any:
+        """Checks the condition according to the polling strategy until it returns truthy result or time is over.
+        The last sleep is clamped to the remaining time, so the condition is checked at the deadline.
+        Waits nested into the condition share the deadline of this wait
+        """
+        wait_timeout = self._resolve_condition_timeout(timeout)
+        intervals = self._resolve_polling_strategy(polling_interval).intervals()
+        with Deadline.scope(wait_timeout) as deadline:
+            while True:
+                result = self._is_condition_satisfied(function, exceptions_to_ignore)
+                if result:
+                    return result
+                if deadline.is_expired:
+                    raise TimeoutException(self._get_timeout_exception_message(wait_timeout, message))
+                sleep(min(next(intervals), deadline.remaining))
 
     @staticmethod
     def _is_condition_satisfied(function: Callable[[], bool], exceptions_to_ignore: List) -> bool:
@@ -152,13 +258,3 @@ class ConditionalWait:
             if ConditionalWait._is_ignored_exception(ex, exceptions_to_ignore):
                 return False
             raise ex
-
-    def _resolve_condition_timeout(self, timeout: float) -> float:
-        return self._timeout_configuration.condition if timeout is None else timeout
-
-    def _resolve_polling_interval(self, polling_interval: float) -> float:
-        return self._timeout_configuration.polling_interval if polling_interval is None else polling_interval
-
-    @staticmethod
-    def _is_ignored_exception(ex: Exception, exceptions_to_ignore: List) -> bool:
-        return any(map(lambda ex_to_ignore: isinstance(ex, ex_to_ignore), exceptions_to_ignore))
@@ -0,0 +1,69 @@
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class Deadline:
+    """Time budget of an operation shared by all waits nested into it.
+    Nested waits are limited by the remaining time of the operation, so they could not re-arm a full timeout
+    """
+
+    _current: ContextVar[Optional["Deadline"]] = ContextVar("deadline", default=None)
+
+    def __init__(self, end_time: float):
+        """Deadline constructor
+
+        Args:
+            end_time: Point of time by monotonic clock when the budget is over
+        """
+        self.end_time = end_time
+
+    @property
+    def remaining(self) -> float:
+        """Gets the remaining time in seconds"""
+        return max(self.end_time - time.monotonic(), 0)
+
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.end_time
+
+    @classmethod
+    def current(cls) -> Optional["Deadline"]:
+        """Gets the deadline of the current operation if any"""
+        return cls._current.get()
+
+    @classmethod
+    def clamp(cls, timeout: float) -> float:
+        """Limits the timeout by the remaining time of the current operation
+
+        Args:
+            timeout: Requested timeout in seconds
+
+        Returns:
+            Timeout that does not exceed the deadline of the current operation
+        """
+        deadline = cls.current()
+        return timeout if deadline is None else min(timeout, deadline.remaining)
+
+    @classmethod
+    @contextmanager
+    def scope(cls, timeout: Optional[float]) -> Iterator["Deadline"]:
+        """Opens the scope of the operation. Scope nested into another one could not extend its deadline
+
+        Args:
+            timeout: Budget of the operation in seconds. Unlimited if None
+
+        Returns:
+            Deadline of the operation
+        """
+        end_time = math.inf if timeout is None else time.monotonic() + timeout
+        outer_deadline = cls.current()
+        if outer_deadline is not None:
+            end_time = min(end_time, outer_deadline.end_time)
+        token = cls._current.set(Deadline(end_time))
+        try:
+            yield cls._current.get()
+        finally:
+            cls._current.reset(token)
@@ -0,0 +1,61 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from weakref import WeakKeyDictionary
+
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.configurations.timeout_configuration import TimeoutConfiguration
+
+
+class _ImplicitWaitState:
+    def __init__(self):
+        self.timeout: Optional[float] = None
+        self.depth = 0
+
+
+class ImplicitWaitTracker:
+    """Tracks implicit wait timeout set to each application, so the driver receives the command
+    only when the timeout really changes. Applications are tracked by weak references,
+    so a restarted application (a new instance) starts with no tracked timeout
+    """
+
+    def __init__(self, timeout_configuration: TimeoutConfiguration):
+        """ImplicitWaitTracker constructor
+
+        Args:
+            timeout_configuration: Timeout configurations
+        """
+        self._timeout_configuration = timeout_configuration
+        self._states: "WeakKeyDictionary[Application, _ImplicitWaitState]" = WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def scope(self, application: Application, timeout: float = 0) -> Iterator[None]:
+        """Sets implicit wait timeout for the duration of the scope.
+        Configured timeout is restored when the outermost scope is left, even if it is left by an exception.
+        In explicit waits only mode the timeout stays 0 for the whole session.
+
+        Args:
+            application: Application to set the timeout to
+            timeout: Timeout within the scope
+        """
+        with self._lock:
+            state = self._states.setdefault(application, _ImplicitWaitState())
+            if self._timeout_configuration.is_explicit_waits_only:
+                self.__set_timeout(application, state, 0)
+            elif state.depth == 0:
+                self.__set_timeout(application, state, timeout)
+            state.depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                state.depth -= 1
+                if state.depth == 0 and not self._timeout_configuration.is_explicit_waits_only:
+                    self.__set_timeout(application, state, self._timeout_configuration.implicit)
+
+    @staticmethod
+    def __set_timeout(application: Application, state: _ImplicitWaitState, timeout: float):
+        if state.timeout != timeout:
+            application.set_implicit_wait_timeout(timeout)
+            state.timeout = timeout
@@ -0,0 +1,65 @@
+import abc
+import random
+from typing import Iterator, Optional
+
+
+class PollingStrategy(abc.ABC):
+    """Defines intervals between checks of the condition during the wait"""
+
+    @abc.abstractmethod
+    def intervals(self) -> Iterator[float]:
+        """Gets intervals (in seconds) for a single wait. Each wait has to request its own iterator"""
+        raise NotImplementedError("Abstract")
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """Checks the condition with the same interval"""
+
+    def __init__(self, interval: float):
+        """FixedPollingStrategy constructor
+
+        Args:
+            interval: Interval between checks in seconds
+        """
+        self._interval = interval
+
+    def intervals(self) -> Iterator[float]:
+        while True:
+            yield self._interval
+
+
+class ExponentialBackoffPollingStrategy(PollingStrategy):
+    """Checks the condition often at the start of the wait and less often the longer the wait lasts"""
+
+    def __init__(
+        self,
+        initial_interval: float,
+        multiplier: float = 2,
+        max_interval: Optional[float] = None,
+        jitter: float = 0,
+    ):
+        """ExponentialBackoffPollingStrategy constructor
+
+        Args:
+            initial_interval: Interval before the second check in seconds
+            multiplier: Factor applied to the interval after each check
+            max_interval: Cap of the interval in seconds. Not limited if None
+            jitter: Max random deviation of the interval as a fraction of it (e.g. 0.1 is +/- 10%)
+        """
+        if initial_interval < 0 or multiplier < 1 or not 0 <= jitter < 1:
+            raise ValueError(
+                f"Incorrect backoff parameters: initial_interval={initial_interval}, "
+                f"multiplier={multiplier}, jitter={jitter}"
+            )
+        self._initial_interval = initial_interval
+        self._multiplier = multiplier
+        self._max_interval = max_interval
+        self._jitter = jitter
+
+    def intervals(self) -> Iterator[float]:
+        interval = self._initial_interval
+        while True:
+            if self._max_interval is not None:
+                interval = min(interval, self._max_interval)
+            yield interval * (1 + random.uniform(-self._jitter, self._jitter)) if self._jitter else interval
+            interval *= self._multiplier
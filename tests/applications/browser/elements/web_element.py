@@ -10,6 +10,7 @@ from py_selenium_auto_core.configurations.logger_configuration import (
 )
 from py_selenium_auto_core.elements.constants.element_state import ElementState
 from py_selenium_auto_core.elements.element_cache_handler import ElementCacheHandler
+from py_selenium_auto_core.elements.element_cache_registry import ElementCacheRegistry
 from py_selenium_auto_core.elements.element_factory import ElementFactory
 from py_selenium_auto_core.elements.element_finder import ElementFinder
 from py_selenium_auto_core.elements.element_state_provider import ElementStateProvider
@@ -38,6 +39,10 @@ class WebElement(CoreElement, abc.ABC):
     def cache_configuration(self) -> ElementCacheConfiguration:
         return BrowserServices.Instance.service_provider.element_cache_configuration()
 
+    @property
+    def element_cache_registry(self) -> ElementCacheRegistry:
+        return BrowserServices.Instance.service_provider.element_cache_registry()
+
     @property
     def conditional_wait(self) -> ConditionalWait:
         return BrowserServices.Instance.service_provider.conditional_wait()
@@ -16,8 +16,13 @@ class TestApplicationNotStarted(TestWithBrowser):
         [
             "logger",
             "element_cache_configuration",
+            "element_search_configuration",
+            "application_pool_configuration",
             "logger_configuration",
             "timeout_configuration",
+            "implicit_wait_tracker",
+            "element_cache_registry",
+            "compiled_locator_cache",
             "retry_configuration",
             "localization_manager",
             "localized_logger",
@@ -25,6 +30,8 @@ class TestApplicationNotStarted(TestWithBrowser):
             "element_action_retrier",
             "conditional_wait",
             "element_finder",
+            "async_conditional_wait",
+            "async_element_finder",
         ],
     )
     def test_not_start_application(self, service):
@@ -0,0 +1,141 @@
+import copy
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common import JavascriptException, StaleElementReferenceException, WebDriverException
+
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.applications.startup import ServiceProvider, Startup
+from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+
+
+class FakeWebElement:
+    def __init__(self, element_id: str, displayed: bool = True, enabled: bool = True, text: str = ""):
+        self.id = element_id
+        self.displayed = displayed
+        self.enabled = enabled
+        self.text = text
+        self.is_displayed_calls = 0
+        self.parent: Optional["FakeDriver"] = None
+        self.elements: Dict[str, List["FakeWebElement"]] = {}
+        self.find_elements_calls = 0
+
+    def is_displayed(self) -> bool:
+        self.is_displayed_calls += 1
+        return self.displayed
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return "" if name == "class" else None
+
+    def find_elements(self, by: str, value: str) -> List["FakeWebElement"]:
+        self.find_elements_calls += 1
+        found_elements = list(self.elements.get(value, []))
+        for element in found_elements:
+            element.parent = self.parent
+        return found_elements
+
+    def __repr__(self):
+        return f"FakeWebElement({self.id})"
+
+
+class StaleWebElement(FakeWebElement):
+    """Element that has been removed from the document: commands sent to it fail as stale"""
+
+    @property
+    def text(self) -> str:
+        raise StaleElementReferenceException("Element is not attached to the page document")
+
+    @text.setter
+    def text(self, value: str):
+        pass
+
+    def is_displayed(self) -> bool:
+        self.is_displayed_calls += 1
+        raise StaleElementReferenceException("Element is not attached to the page document")
+
+    def is_enabled(self) -> bool:
+        raise StaleElementReferenceException("Element is not attached to the page document")
+
+
+class FakeDriver:
+    """Driver stub that returns prepared elements and counts the commands sent to it"""
+
+    def __init__(self):
+        self.elements: Dict[str, List[FakeWebElement]] = {}
+        self.find_elements_calls = 0
+        self.execute_script_calls = 0
+        self.execute_async_script_calls = 0
+        self.implicit_wait_calls = 0
+        self.current_url = "about:blank"
+        self.cookies: Dict[str, str] = {}
+        self.is_quit = False
+        self.on_find_elements: Optional[Callable[[int], None]] = None
+        self.on_execute_script: Optional[Callable[..., Any]] = None
+        self.on_execute_async_script: Optional[Callable[..., Any]] = None
+
+    def find_elements(self, by: str, value: str) -> List[FakeWebElement]:
+        self.find_elements_calls += 1
+        if self.on_find_elements is not None:
+            self.on_find_elements(self.find_elements_calls)
+        found_elements = list(self.elements.get(value, []))
+        for element in found_elements:
+            element.parent = self
+        return found_elements
+
+    def execute_script(self, script: str, *args) -> Any:
+        self.execute_script_calls += 1
+        if self.on_execute_script is None:
+            raise JavascriptException("Scripts are not supported")
+        return self.on_execute_script(script, *args)
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        self.execute_async_script_calls += 1
+        if self.on_execute_async_script is None:
+            raise WebDriverException("Asynchronous scripts are not supported")
+        return self.on_execute_async_script(script, *args)
+
+    def implicitly_wait(self, timeout: float):
+        self.implicit_wait_calls += 1
+
+    def get(self, url: str):
+        self.current_url = url
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def quit(self):
+        self.is_quit = True
+
+
+class FakeApplication(Application):
+    def __init__(self, driver: FakeDriver = None):
+        self._driver = driver or FakeDriver()
+        self.implicit_wait = 0
+
+    @property
+    def driver(self) -> FakeDriver:
+        return self._driver
+
+    @property
+    def is_started(self) -> bool:
+        return not self.driver.is_quit
+
+    def set_implicit_wait_timeout(self, timeout: float):
+        if timeout != self.implicit_wait:
+            self.implicit_wait = timeout
+            self.driver.implicitly_wait(timeout)
+
+
+def get_settings(**nodes: Dict[str, Any]) -> Dict[str, Any]:
+    """Gets default settings with values of the nodes overridden, e.g. get_settings(elementCache={"isEnabled": True})"""
+    settings = copy.deepcopy(Startup.get_settings().setting_json)
+    for node, values in nodes.items():
+        settings[node].update(values)
+    return settings
+
+
+def configure_services(application: FakeApplication, **nodes: Dict[str, Any]) -> ServiceProvider:
+    """Configures services of the fake application with values of the setting nodes overridden"""
+    return Startup.configure_services(lambda: application, JsonSettingsFile(get_settings(**nodes)))
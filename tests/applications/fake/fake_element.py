@@ -0,0 +1,92 @@
+from py_selenium_auto_core.applications.application import Application
+from py_selenium_auto_core.applications.startup import ServiceProvider
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.configurations.element_cache_configuration import (
+    ElementCacheConfiguration,
+)
+from py_selenium_auto_core.elements.core_element import CoreElement
+from py_selenium_auto_core.elements.element_cache_registry import ElementCacheRegistry
+from py_selenium_auto_core.elements.element_factory import ElementFactory
+from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.elements.service_bound_element import ServiceBoundElement
+from py_selenium_auto_core.localization.localization_manager import LocalizationManager
+from py_selenium_auto_core.localization.localized_logger import LocalizedLogger
+from py_selenium_auto_core.utilities.action_retrier import ActionRetrier
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
+from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+
+
+class FakeElement(CoreElement):
+    """Element that resolves its services from the service provider set by the test"""
+
+    service_provider: ServiceProvider = None
+
+    @property
+    def action_retrier(self) -> ActionRetrier:
+        return self.service_provider.element_action_retrier()
+
+    @property
+    def async_conditional_wait(self) -> AsyncConditionalWait:
+        return self.service_provider.async_conditional_wait()
+
+    @property
+    def async_element_finder(self) -> AsyncElementFinder:
+        return self.service_provider.async_element_finder()
+
+    @property
+    def application(self) -> Application:
+        return self.service_provider.application()
+
+    @property
+    def cache_configuration(self) -> ElementCacheConfiguration:
+        return self.service_provider.element_cache_configuration()
+
+    @property
+    def element_cache_registry(self) -> ElementCacheRegistry:
+        return self.service_provider.element_cache_registry()
+
+    @property
+    def conditional_wait(self) -> ConditionalWait:
+        return self.service_provider.conditional_wait()
+
+    @property
+    def element_type(self) -> str:
+        return "Fake element"
+
+    @property
+    def factory(self) -> ElementFactory:
+        return self.service_provider.element_factory()
+
+    @property
+    def finder(self) -> ElementFinder:
+        return self.service_provider.element_finder()
+
+    @property
+    def image_comparator(self):
+        raise NotImplementedError("Abstract")
+
+    @property
+    def localized_logger(self) -> LocalizedLogger:
+        return self.service_provider.localized_logger()
+
+    @property
+    def localization_manager(self) -> LocalizationManager:
+        return self.service_provider.localization_manager()
+
+
+class BoundElement(ServiceBoundElement):
+    """Element that binds its services resolved from the service provider set by the test"""
+
+    provider: ServiceProvider = None
+
+    @property
+    def service_provider(self) -> ServiceProvider:
+        return self.provider
+
+    @property
+    def element_type(self) -> str:
+        return "Bound element"
+
+    @property
+    def image_comparator(self):
+        raise NotImplementedError("Abstract")
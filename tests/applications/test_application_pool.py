@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+from selenium.common import TimeoutException
+
+from py_selenium_auto_core.applications.application_pool import ApplicationPool
+from py_selenium_auto_core.applications.startup import Startup
+from py_selenium_auto_core.configurations.application_pool_configuration import ApplicationPoolConfiguration
+from tests.applications.fake.fake_application import FakeApplication, get_settings
+
+
+class TestApplicationPool:
+    started_applications: list = None
+
+    def setup_method(self):
+        self.started_applications = []
+
+    def _create_pool(self, **pool_settings) -> ApplicationPool:
+        settings = get_settings(applicationPool=pool_settings)
+
+        def _start_application() -> FakeApplication:
+            application = FakeApplication()
+            application.driver.on_execute_script = lambda script, *args: None
+            self.started_applications.append(application)
+            return application
+
+        return ApplicationPool(_start_application, ApplicationPoolConfiguration(settings))
+
+    def test_prestart_applications(self):
+        pool = self._create_pool(size=3)
+        pool.prestart()
+        assert pool.idle_count == 3
+        assert pool.lease() in self.started_applications
+        assert len(self.started_applications) == 3
+
+    def test_reset_application_on_release(self):
+        pool = self._create_pool(size=1)
+        with pool.leased() as application:
+            application.driver.get("https://example.com")
+            application.driver.cookies["session"] = "1"
+        assert application.driver.current_url == "about:blank"
+        assert application.driver.cookies == {}
+        assert pool.lease() is application
+
+    def test_recycle_application_after_max_leases(self):
+        pool = self._create_pool(size=1, maxLeases=2)
+        for _ in range(3):
+            with pool.leased():
+                pass
+        assert len(self.started_applications) == 2
+        assert self.started_applications[0].driver.is_quit
+
+    def test_replace_not_responding_application(self):
+        pool = self._create_pool(size=1)
+        pool.prestart()
+        self.started_applications[0].driver.quit()
+        assert pool.lease() is self.started_applications[1]
+
+    def test_wait_for_released_application(self):
+        pool = self._create_pool(size=1)
+        application = pool.lease()
+        with pytest.raises(TimeoutException):
+            pool.lease(timeout=0.1)
+        threading.Timer(0.1, pool.release, [application]).start()
+        assert pool.lease(timeout=5) is application
+
+    def test_dispose_application_with_dead_driver_on_release(self):
+        pool = self._create_pool(size=1)
+        application = pool.lease()
+
+        def _raise_connection_error(*args):
+            raise ConnectionError("Connection refused")
+
+        for method in ["execute_script", "delete_all_cookies", "get", "quit"]:
+            setattr(application.driver, method, _raise_connection_error)
+        threading.Timer(0.1, pool.release, [application]).start()
+
+        assert pool.lease(timeout=5) is self.started_applications[1]
+        assert pool.size == 1
+
+    def test_measure_memory_growth_on_blank_page(self):
+        pool = self._create_pool(size=1, maxMemoryGrowth=100)
+        application = pool.lease()
+        memory_by_page = {"about:blank": 10 * 1024 * 1024, "https://example.com": 500 * 1024 * 1024}
+        application.driver.on_execute_script = lambda script, *args: memory_by_page.get(application.driver.current_url)
+
+        for _ in range(2):
+            application.driver.get("https://example.com")
+            pool.release(application)
+            assert pool.lease() is application, "Heavy page left by the test should not recycle the application"
+
+        memory_by_page["about:blank"] = 200 * 1024 * 1024
+        pool.release(application)
+        assert application.driver.is_quit
+
+    def test_get_pool_from_service_provider(self):
+        service_provider = Startup.configure_services(lambda: None)
+        assert service_provider.application_pool() is None
+
+        pool = Startup.configure_application_pool(service_provider, lambda service: FakeApplication())
+
+        assert service_provider.application_pool() is pool
+        with pool.leased() as application:
+            assert isinstance(application, FakeApplication)
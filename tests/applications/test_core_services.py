@@ -1,10 +1,15 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 import pytest
+from selenium.common import WebDriverException
 from dependency_injector.providers import Singleton
 
 from py_selenium_auto_core.applications.application import Application
 from py_selenium_auto_core.applications.core_services import CoreServices
+from py_selenium_auto_core.applications.services_scope import ServicesScope
 from py_selenium_auto_core.applications.startup import Startup, ServiceProvider
 from py_selenium_auto_core.configurations.logger_configuration import (
     LoggerConfiguration,
@@ -15,6 +20,7 @@ from py_selenium_auto_core.configurations.timeout_configuration import (
 from py_selenium_auto_core.logging.logger import Logger
 from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
 from py_selenium_auto_core.utilities.root_path_helper import RootPathHelper
+from tests.applications.fake.fake_application import FakeApplication
 
 
 @pytest.fixture
@@ -205,3 +211,88 @@ class CustomSPStartup(Startup):
         settings = JsonSettingsFile("settings.special.json", RootPathHelper.calling_root_path())
         service_provider = super().configure_services(application_provider, settings, CustomServiceProvider())
         return service_provider
+
+
+class TestScopedCoreServices:
+    class ScopedServices(CoreServices):
+        @classmethod
+        def get_application(cls) -> Application:
+            return cls._get_application(lambda service: FakeApplication())
+
+        @classmethod
+        def get_service_provider(cls) -> ServiceProvider:
+            return cls._get_service_provider(lambda service: cls.get_application())
+
+    def _get_in_threads(self, scope: ServicesScope) -> list:
+        services = type("Services", (self.ScopedServices,), {})
+        services._set_services_scope(scope)
+        # Barrier makes each call run in a separate thread at the same time
+        barrier = threading.Barrier(4)
+
+        def _get_services(_):
+            barrier.wait()
+            return services.get_application(), services.get_service_provider()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(_get_services, range(4)))
+
+    def test_share_application_in_process_scope(self):
+        results = self._get_in_threads(ServicesScope.Process)
+        assert len({id(application) for application, _ in results}) == 1
+        assert len({id(service_provider) for _, service_provider in results}) == 1
+
+    def test_separate_application_per_thread(self):
+        results = self._get_in_threads(ServicesScope.Thread)
+        assert len({id(application) for application, _ in results}) == 4
+        assert len({id(service_provider) for _, service_provider in results}) == 4
+
+    def test_separate_application_per_task(self):
+        services = type("Services", (self.ScopedServices,), {})
+        services._set_services_scope(ServicesScope.Context)
+
+        async def _get_application():
+            await asyncio.sleep(0)
+            return services.get_application()
+
+        async def _run_tasks():
+            return await asyncio.gather(*(_get_application() for _ in range(3)))
+
+        applications = asyncio.run(_run_tasks())
+        assert len({id(application) for application in applications}) == 3
+
+
+class TestPrewarmedApplication:
+    def test_start_application_in_background(self):
+        is_start_allowed = threading.Event()
+        started_application = FakeApplication()
+
+        def _start_application(service):
+            is_start_allowed.wait(5)
+            return started_application
+
+        services = type("Services", (CoreServices,), {})
+        application = services._prewarm_application(_start_application)
+
+        assert not application.is_ready
+        assert services._get_application(_start_application) is application, "Application should not start twice"
+        is_start_allowed.set()
+        assert application.driver is started_application.driver
+
+    def test_raise_start_failure_on_first_use(self):
+        def _start_application(service):
+            raise WebDriverException("Browser has not started")
+
+        services = type("Services", (CoreServices,), {})
+        application = services._prewarm_application(_start_application)
+
+        with pytest.raises(WebDriverException):
+            application.driver
+        assert not services._is_application_started()
+
+    def test_return_prewarmed_application_by_service_provider(self):
+        started_application = FakeApplication()
+        service_provider = Startup.configure_services(lambda: None)
+        application = Startup.prewarm(service_provider, lambda service: started_application)
+
+        assert service_provider.application() is application
+        assert application.driver is started_application.driver
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from selenium.common import NoSuchElementException
+
+from py_selenium_auto_core.applications.startup import ServiceProvider, Startup
+from py_selenium_auto_core.elements.async_element_finder import AsyncElementFinder
+from py_selenium_auto_core.elements.async_element_state_provider import AsyncElementStateProvider
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.core_element import CoreElement
+from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.utilities.functional import Timer
+from py_selenium_auto_core.waitings.async_conditional_wait import AsyncConditionalWait
+from py_selenium_auto_core.waitings.conditional_wait import ConditionalWait
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement
+from tests.applications.fake.fake_element import FakeElement
+
+
+class SyncElement(FakeElement):
+    """Element that implements only synchronous services, so asynchronous ones are built by CoreElement"""
+
+    async_conditional_wait = CoreElement.async_conditional_wait
+    async_element_finder = CoreElement.async_element_finder
+
+
+class TestAsyncElementFinder:
+    locator: Locator = Locator.by_xpath("//div")
+    little_timeout: float = 1
+    service_provider: ServiceProvider = None
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.service_provider = Startup.configure_services(lambda: self.application)
+
+    @property
+    def element_finder(self) -> AsyncElementFinder:
+        return self.service_provider.async_element_finder()
+
+    def test_find_elements_shown_during_wait(self):
+        elements = [FakeWebElement(str(index), displayed=False) for index in range(3)]
+        self.application.driver.elements[self.locator.value] = elements
+
+        def _show_elements(call_number: int):
+            if call_number == 3:
+                for element in elements:
+                    element.displayed = True
+
+        self.application.driver.on_find_elements = _show_elements
+        found_elements = asyncio.run(
+            self.element_finder.find_elements(self.locator, ElementState.Displayed, self.little_timeout)
+        )
+        assert found_elements == elements
+
+    def test_throw_no_such_element_if_nothing_found(self):
+        with pytest.raises(NoSuchElementException):
+            asyncio.run(self.element_finder.find_element(self.locator, ElementState.Displayed, timeout=0))
+
+    def test_run_waits_concurrently(self):
+        conditional_wait = self.service_provider.async_conditional_wait()
+
+        async def _run_waits():
+            return await asyncio.gather(
+                *(conditional_wait.wait_for_condition(lambda: False, timeout=0.5) for _ in range(10))
+            )
+
+        with Timer() as timer:
+            results = asyncio.run(_run_waits())
+        assert results == [False] * 10
+        assert timer.elapsed.total_seconds() < 2, "Waits should not block the event loop"
+
+    def test_get_application_outside_of_event_loop_thread(self):
+        threads = []
+
+        def _get_application() -> FakeApplication:
+            threads.append(threading.current_thread())
+            return self.application
+
+        conditional_wait = Startup.configure_services(_get_application).async_conditional_wait()
+
+        assert asyncio.run(conditional_wait.wait_for_driver(lambda driver: driver is self.application.driver))
+        assert threads
+        assert threading.main_thread() not in threads
+
+    def test_wait_for_not_displayed(self):
+        element = FakeWebElement("1")
+        self.application.driver.elements[self.locator.value] = [element]
+        self.application.driver.on_find_elements = lambda call_number: setattr(element, "displayed", call_number < 3)
+        state = AsyncElementStateProvider(
+            self.locator,
+            self.service_provider.async_conditional_wait(),
+            self.element_finder,
+            lambda message_key, state_key: None,
+        )
+
+        assert asyncio.run(state.wait_for_not_displayed(self.little_timeout))
+        assert not asyncio.run(state.wait_for_displayed(0))
+
+    def test_wait_for_count_within_default_timeout(self):
+        start_time = time.monotonic()
+        self.application.driver.on_execute_script = lambda script, by, value: int(time.monotonic() - start_time > 0.5)
+        state = self.service_provider.async_element_state_provider(self.locator, log_element_state=lambda *args: None)
+
+        assert asyncio.run(state.wait_for_count(lambda count: count == 1))
+        assert time.monotonic() - start_time > 0.5
+
+    def test_get_async_state_of_element(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+        FakeElement.service_provider = self.service_provider
+        element = FakeElement(self.locator, "Element", ElementState.ExistsInAnyState)
+
+        assert isinstance(element.async_state, AsyncElementStateProvider)
+        assert asyncio.run(element.async_state.wait_for_displayed(self.little_timeout))
+        state = self.service_provider.async_element_state_provider(self.locator, log_element_state=lambda *args: None)
+        assert asyncio.run(state.is_exist())
+
+    def test_get_async_state_of_element_without_async_services(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+        FakeElement.service_provider = self.service_provider
+        element = SyncElement(self.locator, "Element", ElementState.ExistsInAnyState)
+
+        assert isinstance(element.async_conditional_wait, AsyncConditionalWait)
+        assert isinstance(element.async_element_finder, AsyncElementFinder)
+        assert asyncio.run(element.async_state.wait_for_displayed(self.little_timeout))
+
+    def test_sync_finder_and_wait_are_not_replaced_by_async_ones(self):
+        assert not isinstance(self.element_finder, ElementFinder)
+        assert not isinstance(self.service_provider.async_conditional_wait(), ConditionalWait)
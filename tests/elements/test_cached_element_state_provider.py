@@ -0,0 +1,88 @@
+import pytest
+from selenium.common import NoSuchElementException
+
+from py_selenium_auto_core.elements.cached_element_state_provider import CachedElementStateProvider
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import (
+    FakeApplication,
+    FakeWebElement,
+    StaleWebElement,
+    configure_services,
+)
+from tests.applications.fake.fake_element import FakeElement
+
+
+class TestCachedElementStateProvider:
+    locator: Locator = Locator.by_xpath("//div")
+    application: FakeApplication = None
+    element: FakeElement = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        FakeElement.service_provider = configure_services(self.application, elementCache={"isEnabled": True})
+        self.element = FakeElement(self.locator, "Cached", ElementState.ExistsInAnyState)
+
+    def test_state_is_cached_if_cache_is_enabled(self):
+        assert isinstance(self.element.state, CachedElementStateProvider)
+
+    def test_check_state_by_cached_reference(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+
+        assert self.element.state.is_displayed()
+        assert self.element.state.is_exist()
+        assert self.element.state.is_enabled()
+        assert self.element.state.is_clickable()
+        assert self.element.state.wait_for_displayed(1)
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_check_state_of_kept_reference_by_single_call(self):
+        web_element = FakeWebElement("1")
+        self.application.driver.elements[self.locator.value] = [web_element]
+        self.element.state.is_exist()
+
+        for _ in range(3):
+            assert self.element.state.is_displayed()
+
+        assert web_element.is_displayed_calls == 3
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_not_log_wait_without_timeout(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+        logged_states = []
+        state = CachedElementStateProvider(
+            self.locator,
+            FakeElement.service_provider.conditional_wait(),
+            self.element.cache,
+            lambda message_key, state_key: logged_states.append(state_key),
+        )
+
+        assert state.wait_for_displayed(0)
+        assert not state.wait_for_not_displayed(0)
+        assert logged_states == []
+        assert state.wait_for_displayed(1)
+        assert logged_states == ["loc.el.state.displayed"]
+
+    def test_find_element_again_if_reference_is_stale(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+        self.element.state.is_exist()
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("2", displayed=False)]
+        self.element.cache.bind(StaleWebElement("1"))
+
+        assert not self.element.state.is_displayed()
+        assert self.element.state.is_exist()
+        assert self.element.cache.get_element().id == "2"
+        assert self.application.driver.find_elements_calls == 2
+
+    def test_wait_for_not_exist_if_element_is_removed(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1")]
+        self.element.state.is_exist()
+        self.element.cache.bind(StaleWebElement("1"))
+        self.application.driver.elements[self.locator.value] = []
+
+        assert self.element.state.wait_for_not_exist(1)
+        assert not self.element.state.wait_for_exist(0.1)
+
+    def test_is_enabled_throws_if_element_is_not_found(self):
+        with pytest.raises(NoSuchElementException):
+            self.element.state.is_enabled()
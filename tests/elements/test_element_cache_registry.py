@@ -0,0 +1,156 @@
+import threading
+import time
+
+from selenium.common import JavascriptException
+
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import (
+    FakeApplication,
+    FakeWebElement,
+    StaleWebElement,
+    configure_services,
+)
+from tests.applications.fake.fake_element import FakeElement
+
+
+class TestElementCacheRegistry:
+    locator: Locator = Locator.by_xpath("//div")
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        FakeElement.service_provider = configure_services(
+            self.application, elementCache={"isEnabled": True, "maxSize": 2}
+        )
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1", text="cached")]
+
+    @property
+    def statistics(self):
+        return FakeElement.service_provider.element_cache_registry().get_statistics(self.application)
+
+    def test_share_found_element_between_page_objects(self):
+        first_element = FakeElement(self.locator, "First", ElementState.ExistsInAnyState)
+        second_element = FakeElement(self.locator, "Second", ElementState.ExistsInAnyState)
+
+        assert first_element.text == "cached"
+        assert second_element.text == "cached"
+        assert self.application.driver.find_elements_calls == 1
+        assert (self.statistics.hits, self.statistics.misses) == (1, 1)
+        assert first_element.cache is second_element.cache
+
+    def test_evict_least_recently_used_element(self):
+        elements = [
+            FakeElement(Locator.by_xpath(f"//div[{index}]"), f"Element {index}", ElementState.ExistsInAnyState)
+            for index in range(3)
+        ]
+        for index, element in enumerate(elements):
+            self.application.driver.elements[element.locator.value] = [FakeWebElement(str(index))]
+            element.get_element()
+
+        assert self.statistics.evictions == 1
+        assert elements[2].cache.is_cached
+        assert not elements[0].cache.is_cached
+
+    def test_invalidate_elements_if_document_is_changed(self):
+        element = FakeElement(self.locator, "Element", ElementState.ExistsInAnyState)
+        other_locator = Locator.by_xpath("//span")
+        other_element = FakeElement(other_locator, "Other", ElementState.ExistsInAnyState)
+        self.application.driver.elements[other_locator.value] = [FakeWebElement("2")]
+        element.get_element()
+        other_element.get_element()
+
+        self.application.driver.get("https://example.com/next")
+        element.cache.bind(StaleWebElement("1"))
+        element.state.is_exist()
+
+        assert self.statistics.invalidations == 1
+        assert not other_element.cache.is_cached
+
+
+class TestDocumentGeneration:
+    locator: Locator = Locator.by_xpath("//div")
+    application: FakeApplication = None
+    generation: str = "first"
+    generation_calls: int = 0
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.application.driver.on_execute_script = self._execute_script
+        self.web_element = FakeWebElement("1", text="cached")
+        self.application.driver.elements[self.locator.value] = [self.web_element]
+
+    def _configure(self, freshness_window: float):
+        FakeElement.service_provider = configure_services(
+            self.application, elementCache={"isEnabled": True, "freshnessWindow": freshness_window}
+        )
+        return FakeElement(self.locator, "Element", ElementState.ExistsInAnyState)
+
+    def _execute_script(self, script: str, *args):
+        if "__pyAutoCoreDocumentGeneration" not in script:
+            raise JavascriptException("Scripts are not supported")
+        self.generation_calls += 1
+        return self.generation
+
+    def test_use_element_of_current_document_without_checking(self):
+        element = self._configure(freshness_window=60)
+        element.get_element()
+        element.get_element()
+        is_displayed_calls = self.web_element.is_displayed_calls
+
+        for _ in range(5):
+            assert element.text == "cached"
+
+        assert self.web_element.is_displayed_calls == is_displayed_calls
+        assert self.generation_calls == 1
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_check_each_element_if_freshness_window_is_disabled(self):
+        element = self._configure(freshness_window=0)
+        element.get_element()
+        is_displayed_calls = self.web_element.is_displayed_calls
+
+        element.get_element()
+
+        assert self.web_element.is_displayed_calls == is_displayed_calls + 1
+        assert self.generation_calls == 0
+
+    def test_find_element_again_if_document_generation_is_changed(self):
+        element = self._configure(freshness_window=0.01)
+        element.get_element()
+        element.get_element()
+        time.sleep(0.02)
+        self.generation = "second"
+
+        element.get_element()
+
+        assert self.application.driver.find_elements_calls == 2
+        assert FakeElement.service_provider.element_cache_registry().get_statistics(self.application).invalidations == 1
+
+    def test_not_block_other_sessions_while_document_is_checked(self):
+        element = self._configure(freshness_window=60)
+        element.get_element()
+        script_started, script_released = threading.Event(), threading.Event()
+
+        def _execute_blocking_script(script: str, *args):
+            script_started.set()
+            assert script_released.wait(5)
+            return self._execute_script(script, *args)
+
+        self.application.driver.on_execute_script = _execute_blocking_script
+        thread = threading.Thread(target=element.get_element)
+        thread.start()
+        try:
+            assert script_started.wait(5)
+            other_application = FakeApplication()
+            registry = FakeElement.service_provider.element_cache_registry()
+            handler = registry.get_handler(
+                other_application, self.locator, "Other", ElementState.ExistsInAnyState, element.finder
+            )
+
+            assert not handler.is_cached
+            assert registry.get_statistics(other_application).misses == 1
+        finally:
+            script_released.set()
+            thread.join(5)
+        assert self.generation_calls == 1
@@ -0,0 +1,158 @@
+import pytest
+from selenium.common import TimeoutException
+
+from py_selenium_auto_core.applications.startup import Startup
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.constants.elements_count import ElementsCount
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.utilities.java_script import get_selenium_atom
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement, StaleWebElement
+from tests.applications.fake.fake_element import FakeElement
+
+
+class TestElementFactory:
+    locator: Locator = Locator.by_xpath("//div")
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        FakeElement.service_provider = Startup.configure_services(lambda: self.application)
+
+    def test_reuse_elements_found_by_wait(self):
+        web_elements = [FakeWebElement(str(index), text=f"row {index}") for index in range(500)]
+        self.application.driver.elements[self.locator.value] = web_elements
+
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+
+        assert [element.text for element in elements] == [f"row {index}" for index in range(500)]
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_find_element_by_index_locator_if_reference_is_stale(self):
+        self.application.driver.elements[self.locator.value] = [StaleWebElement("1")]
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+        fresh_element = FakeWebElement("2", text="fresh")
+        self.application.driver.elements[elements[0].locator.value] = [fresh_element]
+
+        assert elements[0].text == "fresh"
+        assert not elements[0].cache.is_bound
+
+    def test_create_elements_lazily(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement(str(index)) for index in range(1000)]
+        CountedElement.created_count = 0
+
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            CountedElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+        first_elements = elements[:3]
+
+        assert len(elements) == 1000
+        assert len(first_elements) == 3
+        assert CountedElement.created_count == 0
+        assert [element.locator.value for element in first_elements] == ["(//div)[1]", "(//div)[2]", "(//div)[3]"]
+        assert elements[-1].locator.value == "(//div)[1000]"
+        assert elements[0] is first_elements[0]
+        assert CountedElement.created_count == 4
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_wait_for_count_by_single_script_per_poll(self):
+        counts = iter([5, 12, 20])
+        self.application.driver.on_execute_script = lambda script, by, value: next(counts)
+
+        count = FakeElement.service_provider.element_factory().wait_for_count(
+            self.locator, lambda found_count: found_count == 20, timeout=5
+        )
+
+        assert count == 20
+        assert self.application.driver.execute_script_calls == 3
+        assert self.application.driver.find_elements_calls == 0
+
+    def test_wait_for_count_with_driver_if_scripts_are_not_supported(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1", displayed=False)]
+
+        assert FakeElement.service_provider.element_finder().count_elements(self.locator, ElementState.Displayed) == 0
+        with pytest.raises(TimeoutException):
+            FakeElement.service_provider.element_factory().wait_for_count(
+                self.locator, lambda found_count: found_count > 0, timeout=0.1, state=ElementState.Displayed
+            )
+
+    def test_check_absence_of_elements_by_count(self):
+        self.application.driver.on_execute_script = lambda script, by, value: 0
+
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.Zero, ElementState.ExistsInAnyState
+        )
+
+        assert len(elements) == 0
+        assert self.application.driver.find_elements_calls == 0
+
+    def test_compare_and_concatenate_elements_as_list(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement(str(index)) for index in range(2)]
+        factory = FakeElement.service_provider.element_factory()
+
+        elements = factory.find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+        absent_elements = factory.find_elements(
+            FakeElement, Locator.by_xpath("//span"), "Absent", ElementsCount.Any, ElementState.ExistsInAnyState
+        )
+
+        assert absent_elements == []
+        assert elements != []
+        assert elements == [elements[0], elements[1]]
+        assert elements[:1] == (elements[0],)
+        assert elements[1:] + [elements[0]] == [elements[1], elements[0]]
+        assert [elements[1]] + elements[:1] == [elements[1], elements[0]]
+
+    def test_read_texts_of_elements_by_single_script(self):
+        web_elements = [FakeWebElement(str(index), text=f"row {index}") for index in range(300)]
+        self.application.driver.elements[self.locator.value] = web_elements
+
+        scripts = []
+
+        def _read_elements_properties(script, elements, kind, names):
+            scripts.append(script)
+            return [element.text if kind == "text" else element.get_attribute(names[0]) for element in elements]
+
+        self.application.driver.on_execute_script = _read_elements_properties
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+
+        assert elements.texts() == [f"row {index}" for index in range(300)]
+        assert elements[10:12].attributes("class") == ["", ""]
+        assert self.application.driver.execute_script_calls == 2
+        # values are read by the same atoms as WebElement.text visibility check and WebElement.get_attribute use
+        assert get_selenium_atom("getAttribute.js") in scripts[0]
+        assert get_selenium_atom("isDisplayed.js") in scripts[0]
+
+    def test_read_texts_element_by_element_if_scripts_are_not_supported(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1", text="first")]
+        elements = FakeElement.service_provider.element_factory().find_elements(
+            FakeElement, self.locator, "Row", ElementsCount.MoreThenZero, ElementState.ExistsInAnyState
+        )
+
+        assert elements.texts() == ["first"]
+        assert elements[1:].texts() == []
+
+    def test_reuse_compiled_child_locators(self):
+        parent = FakeElement(self.locator, "Parent", ElementState.ExistsInAnyState)
+        statistics = FakeElement.service_provider.compiled_locator_cache().statistics
+
+        first_child = parent.find_child_element(FakeElement, Locator.by_class_name("child"))
+        second_child = parent.find_child_element(FakeElement, Locator.by_class_name("child"))
+
+        assert first_child.locator is second_child.locator
+        assert first_child.locator.value == "//div//*[contains(@class,'child')]"
+        assert (statistics.hits, statistics.misses) == (1, 1)
+
+
+class CountedElement(FakeElement):
+    created_count = 0
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        CountedElement.created_count += 1
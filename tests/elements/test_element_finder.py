@@ -0,0 +1,143 @@
+import pytest
+from selenium.common import NoSuchElementException
+
+from py_selenium_auto_core.applications.startup import ServiceProvider, Startup
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.element_finder import ElementFinder
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import (
+    FakeApplication,
+    FakeWebElement,
+    StaleWebElement,
+    configure_services,
+)
+
+
+class TestElementFinder:
+    locator: Locator = Locator.by_xpath("//div")
+    little_timeout: float = 1
+    service_provider: ServiceProvider = None
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.service_provider = Startup.configure_services(lambda: self.application)
+
+    @property
+    def element_finder(self) -> ElementFinder:
+        return self.service_provider.element_finder()
+
+    def test_not_reevaluate_elements_from_previous_polls(self):
+        elements = [FakeWebElement(str(index), displayed=False) for index in range(3)]
+        self.application.driver.elements[self.locator.value] = elements
+
+        def _show_elements(call_number: int):
+            if call_number == 3:
+                for element in elements:
+                    element.displayed = True
+
+        self.application.driver.on_find_elements = _show_elements
+        found_elements = self.element_finder.find_elements(self.locator, ElementState.Displayed, self.little_timeout)
+
+        assert found_elements == elements, "Each poll should return a fresh list of elements"
+        for element in elements:
+            assert element.is_displayed_calls == 3, "Element state should be checked once per poll"
+
+    def test_return_distinct_elements(self):
+        element = FakeWebElement("1")
+        self.application.driver.elements[self.locator.value] = [element, FakeWebElement("1"), element]
+        found_elements = self.element_finder.find_elements(self.locator, ElementState.Displayed, self.little_timeout)
+        assert found_elements == [element]
+
+    def test_stop_on_first_match_for_find_element(self):
+        elements = [FakeWebElement(str(index)) for index in range(5)]
+        self.application.driver.elements[self.locator.value] = elements
+
+        found_element = self.element_finder.find_element(self.locator, ElementState.Displayed, timeout=0)
+
+        assert found_element is elements[0]
+        assert [element.is_displayed_calls for element in elements] == [1, 0, 0, 0, 0]
+
+    def test_throw_no_such_element_if_nothing_found(self):
+        with pytest.raises(NoSuchElementException):
+            self.element_finder.find_element(self.locator, ElementState.Displayed, timeout=0)
+
+    def test_evaluate_built_in_state_by_single_script(self):
+        elements = [FakeWebElement(str(index), displayed=index % 2 == 0) for index in range(200)]
+        self.application.driver.elements[self.locator.value] = elements
+        self.application.driver.on_execute_script = lambda script, candidates: [e.displayed for e in candidates]
+
+        found_elements = self.element_finder.find_elements(self.locator, ElementState.Displayed, self.little_timeout)
+
+        assert found_elements == elements[::2]
+        assert self.application.driver.execute_script_calls == 1
+        assert all(element.is_displayed_calls == 0 for element in elements)
+
+    def test_evaluate_callable_state_element_by_element(self):
+        elements = [FakeWebElement(str(index)) for index in range(3)]
+        self.application.driver.elements[self.locator.value] = elements
+        self.application.driver.on_execute_script = lambda script, candidates: [True for _ in candidates]
+
+        found_elements = self.element_finder.find_elements(
+            self.locator, lambda element: element.id != "1", self.little_timeout
+        )
+
+        assert found_elements == [elements[0], elements[2]]
+        assert self.application.driver.execute_script_calls == 0
+
+    def test_not_send_commands_for_exists_in_any_state(self):
+        elements = [FakeWebElement(str(index)) for index in range(3)]
+        self.application.driver.elements[self.locator.value] = elements
+
+        found_elements = self.element_finder.find_elements(self.locator, ElementState.ExistsInAnyState, 0)
+
+        assert found_elements == elements
+        assert self.application.driver.execute_script_calls == 0
+
+    def test_count_stale_element_as_not_in_state(self):
+        self.application.driver.elements[self.locator.value] = [StaleWebElement("1")]
+
+        assert self.element_finder.count_elements(self.locator, ElementState.Displayed) == 0
+        assert self.element_finder.find_elements(self.locator, ElementState.Displayed, 0) == []
+
+    def test_count_elements_again_if_element_has_become_stale(self):
+        stale_element = StaleWebElement("1")
+        self.application.driver.elements[self.locator.value] = [stale_element, FakeWebElement("2")]
+        self.application.driver.on_find_elements = lambda call_number: (
+            self.application.driver.elements[self.locator.value].remove(stale_element) if call_number == 2 else None
+        )
+
+        assert self.element_finder.count_elements(self.locator, ElementState.Displayed) == 1
+        assert self.application.driver.find_elements_calls == 2
+
+
+class TestCompiledElementFinder:
+    locator: Locator = Locator.by_xpath("//div")
+    little_timeout: float = 1
+    service_provider: ServiceProvider = None
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.service_provider = configure_services(self.application, elementSearch={"compiledSearch": True})
+
+    @property
+    def element_finder(self) -> ElementFinder:
+        return self.service_provider.element_finder()
+
+    def test_find_and_filter_by_single_script(self):
+        elements = [FakeWebElement(str(index), displayed=index % 2 == 0) for index in range(200)]
+
+        def _find_elements_in_state(script, by, value, is_first_match_enough):
+            matches = [element for element in elements if element.displayed]
+            return [len(elements), matches[:1] if is_first_match_enough else matches]
+
+        self.application.driver.on_execute_script = _find_elements_in_state
+
+        found_elements = self.element_finder.find_elements(self.locator, ElementState.Displayed, self.little_timeout)
+        found_element = self.element_finder.find_element(self.locator, ElementState.Displayed, timeout=0)
+
+        assert found_elements == elements[::2]
+        assert found_element is elements[0]
+        assert self.application.driver.execute_script_calls == 2
+        assert self.application.driver.find_elements_calls == 0
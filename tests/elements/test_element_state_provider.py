@@ -0,0 +1,94 @@
+import time
+
+import pytest
+from selenium.common import JavascriptException
+
+from py_selenium_auto_core.applications.startup import ServiceProvider
+from py_selenium_auto_core.elements.element_state_provider import ElementStateProvider
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement, configure_services
+
+
+class TestEventDrivenElementStateProvider:
+    locator: Locator = Locator.by_xpath("//div")
+    little_timeout: float = 1
+    service_provider: ServiceProvider = None
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.service_provider = configure_services(self.application, elementSearch={"eventDrivenWaits": True})
+
+    @property
+    def state(self) -> ElementStateProvider:
+        return ElementStateProvider(
+            self.locator,
+            self.service_provider.conditional_wait(),
+            self.service_provider.element_finder(),
+            lambda message_key, state_key: None,
+        )
+
+    def test_wait_for_state_by_events(self):
+        def _wait_for_elements_state(script, by, value, is_expected, timeout_ms):
+            return self.application.driver.execute_async_script_calls == 2
+
+        self.application.driver.on_execute_async_script = _wait_for_elements_state
+
+        assert self.state.wait_for_displayed(self.little_timeout)
+        assert self.application.driver.execute_async_script_calls == 2
+        assert self.application.driver.find_elements_calls == 0
+
+    def test_check_state_once_after_timed_out_wait_by_events(self):
+        self.application.driver.on_execute_async_script = lambda script, *args: False
+
+        assert not self.state.wait_for_exist(self.little_timeout)
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_poll_state_if_async_scripts_are_not_supported(self):
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1", displayed=False)]
+
+        assert self.state.wait_for_not_displayed(self.little_timeout)
+        assert self.application.driver.execute_async_script_calls == 1
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_wait_for_count(self):
+        counts = iter([0, 3])
+        self.application.driver.on_execute_script = lambda script, by, value: next(counts)
+
+        assert self.state.wait_for_count(lambda count: count == 3, self.little_timeout)
+        assert self.application.driver.find_elements_calls == 0
+
+    def test_wait_for_count_within_default_timeout(self):
+        start_time = time.monotonic()
+        self.application.driver.on_execute_script = lambda script, by, value: int(time.monotonic() - start_time > 0.5)
+
+        assert self.state.wait_for_count(lambda count: count == 1)
+        assert time.monotonic() - start_time > 0.5
+
+    def test_raise_script_error_without_waiting_for_timeout(self):
+        self.application.driver.on_execute_script = lambda script: "document"
+
+        def _fail(script, *args):
+            raise JavascriptException("SyntaxError: not a valid selector")
+
+        self.application.driver.on_execute_async_script = _fail
+        start_time = time.perf_counter()
+
+        with pytest.raises(JavascriptException):
+            self.service_provider.conditional_wait().wait_for_async_script("script", timeout=self.little_timeout)
+        assert time.perf_counter() - start_time < self.little_timeout / 2
+        assert self.application.driver.execute_async_script_calls == 1
+
+    def test_run_script_again_if_document_has_been_unloaded(self):
+        generations = iter(["first", "second"])
+        self.application.driver.on_execute_script = lambda script: next(generations)
+
+        def _wait_in_second_document(script, *args):
+            if self.application.driver.execute_async_script_calls == 1:
+                raise JavascriptException("document unloaded while waiting for result")
+            return True
+
+        self.application.driver.on_execute_async_script = _wait_in_second_document
+
+        assert self.service_provider.conditional_wait().wait_for_async_script("script", timeout=self.little_timeout)
+        assert self.application.driver.execute_async_script_calls == 2
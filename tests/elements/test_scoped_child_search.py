@@ -0,0 +1,101 @@
+from selenium.webdriver.common.by import By
+
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.constants.elements_count import ElementsCount
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.locator.scoped_locator import ScopedLocator
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement, configure_services
+from tests.applications.fake.fake_element import FakeElement
+
+
+class TestScopedChildSearch:
+    locator: Locator = Locator.by_xpath("//form")
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        FakeElement.service_provider = configure_services(self.application, elementSearch={"scopedChildSearch": True})
+        self.form = FakeWebElement("form")
+        self.application.driver.elements[self.locator.value] = [self.form]
+        self.parent = FakeElement(self.locator, "Form", ElementState.ExistsInAnyState)
+
+    def test_find_child_element_by_css_within_parent(self):
+        self.form.elements["input.name"] = [FakeWebElement("name", text="name")]
+
+        child = self.parent.find_child_element(FakeElement, Locator.by_css_selector("input.name"), "Name")
+
+        assert isinstance(child.locator, ScopedLocator)
+        assert child.text == "name"
+        assert self.form.find_elements_calls == 1
+        assert self.application.driver.find_elements_calls == 1
+
+    def test_keep_meaning_of_xpath_child_locators(self):
+        assert ScopedLocator(self.parent, Locator.by_xpath("/input")).value == "./input"
+        assert ScopedLocator(self.parent, Locator.by_xpath("//input")).value == ".//input"
+        assert ScopedLocator(self.parent, Locator.by_xpath("input")).value == ".//input"
+        assert ScopedLocator(self.parent, Locator.by_xpath("./input")).value == "./input"
+        assert ScopedLocator(self.parent, Locator.by_tag_name("input")).value == "input"
+
+    def test_scoped_locator_is_not_equal_to_the_same_document_locator(self):
+        locator = Locator.by_xpath(".//div")
+        scoped_locator = ScopedLocator(self.parent, locator)
+
+        assert locator != scoped_locator
+        assert scoped_locator != locator
+        assert len({locator, scoped_locator}) == 2
+        assert scoped_locator == ScopedLocator(self.parent, locator)
+
+    def test_find_child_elements_within_parent_by_index(self):
+        self.form.elements["input"] = [FakeWebElement(str(index), text=f"input {index}") for index in range(3)]
+
+        children = self.parent.find_child_elements(
+            FakeElement, Locator(By.TAG_NAME, "input"), "Input", ElementsCount.MoreThenZero, ElementState.Displayed
+        )
+        child = children[2]
+        child.cache.invalidate()
+
+        assert child.locator.index == 3
+        assert child.locator.to_string() == "By.XPATH: //form >> By.TAG_NAME: input[3]"
+        assert child.text == "input 2"
+        assert self.application.driver.find_elements_calls == 2
+
+
+class TestCssChildSearch:
+    locator: Locator = Locator.by_id("form")
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        FakeElement.service_provider = configure_services(self.application, elementSearch={"cssLocators": True})
+        self.parent = FakeElement(self.locator, "Form", ElementState.ExistsInAnyState)
+
+    def test_find_child_elements_by_composed_css_selector(self):
+        self.application.driver.elements["#form > input"] = [FakeWebElement(str(index)) for index in range(2)]
+
+        children = self.parent.find_child_elements(
+            FakeElement, Locator.by_xpath("./input"), "Input", ElementsCount.MoreThenZero
+        )
+
+        assert len(children) == 2
+        assert children[1].locator is Locator.by_xpath("(//*[@id='form']/input)[2]")
+
+    def test_index_child_elements_found_by_css_selector(self):
+        self.application.driver.elements["#form input.a"] = [FakeWebElement(str(index)) for index in range(2)]
+        self.application.driver.elements["form"] = [FakeWebElement("form")]
+        self.application.driver.elements["form"][0].elements["input.a"] = [
+            FakeWebElement(str(index), text=f"input {index}") for index in range(2)
+        ]
+
+        children = self.parent.find_child_elements(
+            FakeElement, Locator.by_css_selector("input.a"), "Input", ElementsCount.MoreThenZero
+        )
+
+        assert len(children) == 2
+        assert children[1].locator == ScopedLocator(self.parent, Locator.by_css_selector("input.a"), 2)
+        children[1].cache.invalidate()
+        assert children[1].text == "input 1"
+
+    def test_search_simple_xpath_by_css_selector(self):
+        self.application.driver.elements["form input"] = [FakeWebElement("1")]
+
+        assert len(FakeElement.service_provider.element_finder().find_elements(Locator.by_xpath("//form//input"))) == 1
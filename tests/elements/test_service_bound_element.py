@@ -0,0 +1,36 @@
+from py_selenium_auto_core.applications.startup import Startup
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.service_bound_element import ElementServices
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement
+from tests.applications.fake.fake_element import BoundElement
+
+
+class TestServiceBoundElement:
+    locator: Locator = Locator.by_xpath("//div")
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = FakeApplication()
+        self.application.driver.elements[self.locator.value] = [FakeWebElement("1", text="bound")]
+        BoundElement.provider = Startup.configure_services(lambda: self.application)
+
+    def test_resolve_services_once_per_service_provider(self):
+        first_element = BoundElement(self.locator, "First", ElementState.ExistsInAnyState)
+        second_element = BoundElement(self.locator, "Second", ElementState.ExistsInAnyState)
+
+        assert first_element.text == "bound"
+        assert second_element.text == "bound"
+        assert first_element.finder is second_element.finder
+        assert first_element.conditional_wait is second_element.conditional_wait
+        assert first_element.services is ElementServices.of(BoundElement.provider)
+        assert first_element.application is self.application
+
+    def test_bind_services_again_if_service_provider_is_changed(self):
+        element = BoundElement(self.locator, "Element", ElementState.ExistsInAnyState)
+        finder = element.finder
+
+        BoundElement.provider = Startup.configure_services(lambda: self.application)
+
+        assert element.finder is not finder
+        assert element.text == "bound"
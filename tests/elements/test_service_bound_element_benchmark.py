@@ -0,0 +1,48 @@
+import timeit
+
+from py_selenium_auto_core.applications.startup import Startup
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement
+from tests.applications.fake.fake_element import BoundElement, FakeElement
+
+
+def _resolve_services(element):
+    return (
+        element.action_retrier,
+        element.finder,
+        element.conditional_wait,
+        element.localized_logger,
+        element.localization_manager,
+        element.cache_configuration,
+    )
+
+
+def _measure(statement, number: int) -> float:
+    """Best time of a single run, so the comparison is not affected by other processes running tests in parallel"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+class TestServiceBoundElementBenchmark:
+    locator: Locator = Locator.by_xpath("//div")
+
+    def setup_method(self):
+        application = FakeApplication()
+        application.driver.elements[self.locator.value] = [FakeWebElement("1", text="bound")]
+        service_provider = Startup.configure_services(lambda: application)
+        FakeElement.service_provider = service_provider
+        BoundElement.provider = service_provider
+        self.fake_element = FakeElement(self.locator, "Fake", ElementState.ExistsInAnyState)
+        self.bound_element = BoundElement(self.locator, "Bound", ElementState.ExistsInAnyState)
+
+    def test_resolve_services_faster_than_through_service_provider(self):
+        fake_time = _measure(lambda: _resolve_services(self.fake_element), 2000)
+        bound_time = _measure(lambda: _resolve_services(self.bound_element), 2000)
+
+        assert bound_time * 2 < fake_time, f"Bound services took {bound_time:.2e} s, provider ones {fake_time:.2e} s"
+
+    def test_read_text_not_slower_than_through_service_provider(self):
+        fake_time = _measure(lambda: self.fake_element.text, 200)
+        bound_time = _measure(lambda: self.bound_element.text, 200)
+
+        assert bound_time < fake_time * 1.5, f"Bound element took {bound_time:.2e} s, provider one {fake_time:.2e} s"
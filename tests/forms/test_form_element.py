@@ -0,0 +1,76 @@
+import pytest
+
+from py_selenium_auto_core.applications.startup import ServiceProvider, Startup
+from py_selenium_auto_core.elements.constants.element_state import ElementState
+from py_selenium_auto_core.elements.service_bound_element import ServiceBoundElement
+from py_selenium_auto_core.forms.core_form import CoreForm
+from py_selenium_auto_core.forms.form_element import FormElement
+from py_selenium_auto_core.locator.locator import Locator
+from tests.applications.fake.fake_application import FakeApplication, FakeWebElement
+
+
+class SlottedElement(ServiceBoundElement):
+    __slots__ = ()
+
+    provider: ServiceProvider = None
+
+    @property
+    def service_provider(self) -> ServiceProvider:
+        return self.provider
+
+    @property
+    def element_type(self) -> str:
+        return "Slotted element"
+
+    @property
+    def image_comparator(self):
+        raise NotImplementedError("Abstract")
+
+
+class LoginForm(CoreForm):
+    user_name = FormElement(SlottedElement, Locator.by_id("user"), "User name")
+    password = FormElement(SlottedElement, Locator.by_id("password"), state=ElementState.ExistsInAnyState)
+
+    @property
+    def name(self) -> str:
+        return "Login"
+
+    @property
+    def _localized_logger(self):
+        return SlottedElement.provider.localized_logger()
+
+
+class TestFormElement:
+    def setup_method(self):
+        application = FakeApplication()
+        application.driver.elements["user"] = [FakeWebElement("1", text="user")]
+        SlottedElement.provider = Startup.configure_services(lambda: application)
+
+    def test_create_element_on_first_access(self):
+        form = LoginForm()
+
+        assert "user_name" not in form.__dict__
+        element = form.user_name
+
+        assert isinstance(element, SlottedElement)
+        assert form.user_name is element
+        assert element.locator is Locator.by_id("user")
+        assert element.name == "User name"
+        assert element.text == "user"
+        assert "password" not in form.__dict__
+
+    def test_share_declaration_between_forms(self):
+        first_form, second_form = LoginForm(), LoginForm()
+
+        assert first_form.password is not second_form.password
+        assert first_form.password.locator is second_form.password.locator
+        assert first_form.password.name == "password"
+        assert first_form.password._element_state == ElementState.ExistsInAnyState
+        assert isinstance(LoginForm.password, FormElement)
+
+    def test_slotted_element_has_no_dict(self):
+        element = LoginForm().user_name
+
+        assert not hasattr(element, "__dict__")
+        with pytest.raises(AttributeError):
+            element.unknown = "value"
@@ -0,0 +1,52 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from py_selenium_auto_core.locator.locator import Locator
+from py_selenium_auto_core.locator.locator_compiler import LocatorCompiler
+
+
+class TestLocatorCompiler:
+    compiler = LocatorCompiler()
+
+    @pytest.mark.parametrize(
+        argnames=("xpath", "css"),
+        argvalues=[
+            pytest.param("//*[@id='x']", "#x"),
+            pytest.param("//*[@id='1 x']", '[id="1 x"]'),
+            pytest.param("//div", "div"),
+            pytest.param("//div//span", "div span"),
+            pytest.param("//form/input[@name='login']", 'form > input[name="login"]'),
+            pytest.param("//*[contains(@class,'btn')]", '[class*="btn"]'),
+            pytest.param("//button[@disabled]", "button[disabled]"),
+        ],
+    )
+    def test_rewrite_simple_xpath_to_css(self, xpath: str, css: str):
+        assert self.compiler.optimize(Locator.by_xpath(xpath)) is Locator.by_css_selector(css)
+
+    @pytest.mark.parametrize(
+        argnames="xpath",
+        argvalues=["//div[1]", "(//div)[2]", "//div[text()='x']", "/html/body", "//a[@href='/x']", "./div"],
+    )
+    def test_keep_xpath_that_cannot_be_expressed_by_css(self, xpath: str):
+        locator = Locator.by_xpath(xpath)
+        assert self.compiler.optimize(locator) is locator
+
+    @pytest.mark.parametrize(
+        argnames=("child_locator", "css"),
+        argvalues=[
+            pytest.param(Locator.by_xpath("./div"), "#root > div"),
+            pytest.param(Locator.by_xpath("/div/span"), "#root > div > span"),
+            pytest.param(Locator.by_xpath(".//div"), "#root div"),
+            pytest.param(Locator.by_xpath("div[@id]"), "#root div[id]"),
+            pytest.param(Locator.by_class_name("btn"), "#root .btn"),
+            pytest.param(Locator.by_tag_name("span"), "#root span"),
+            pytest.param(Locator.by_css_selector("ul > li.active"), "#root ul > li.active"),
+        ],
+    )
+    def test_compose_child_locator_in_css(self, child_locator: Locator, css: str):
+        assert self.compiler.compose_child(Locator.by_id("root"), child_locator) is Locator(By.CSS_SELECTOR, css)
+
+    def test_not_compose_child_locator_if_it_cannot_be_expressed_by_css(self):
+        assert self.compiler.compose_child(Locator.by_id("root"), Locator.by_xpath("div[text()='x']")) is None
+        assert self.compiler.compose_child(Locator.by_xpath("(//div)[1]"), Locator.by_tag_name("span")) is None
+        assert self.compiler.compose_child(Locator.by_css_selector("a, b"), Locator.by_tag_name("span")) is None
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from typing import Callable
 
 import pytest
@@ -23,3 +25,37 @@ class TestLocators:
     def test_generate_locator(self, method: Callable, by: By):
         selector = "temp"
         assert method(selector) == Locator(by, selector)
+
+    def test_locator_is_interned(self):
+        locator = Locator.by_xpath("//div[@id='interned']")
+
+        assert Locator(By.XPATH, "//div[@id='interned']") is locator
+        assert {locator: "value"}[Locator.by_xpath("//div[@id='interned']")] == "value"
+
+    def test_locator_is_immutable(self):
+        locator = Locator.by_id("immutable")
+
+        with pytest.raises(AttributeError):
+            locator.value = "changed"
+        assert copy.deepcopy(locator) is locator
+        assert pickle.loads(pickle.dumps(locator)) is locator
+
+    @pytest.mark.parametrize(
+        argnames=("locator", "xpath"),
+        argvalues=[
+            pytest.param(Locator.by_id("temp"), "//*[@id='temp']"),
+            pytest.param(Locator.by_class_name("temp"), "//*[contains(@class,'temp')]"),
+            pytest.param(Locator.by_name("temp"), "//*[@name='temp']"),
+            pytest.param(Locator.by_tag_name("temp"), "//temp"),
+            pytest.param(Locator.by_xpath("//temp"), "//temp"),
+        ],
+    )
+    def test_convert_locator_to_xpath(self, locator: Locator, xpath: str):
+        assert locator.to_xpath() is Locator.by_xpath(xpath)
+        assert locator.to_xpath() is locator.to_xpath()
+
+    def test_convert_unsupported_locator_to_xpath(self):
+        assert Locator.by_css_selector("div").to_xpath() is None
+
+    def test_locator_to_string(self):
+        assert Locator.by_css_selector("div > span").to_string() == "By.CSS_SELECTOR: div > span"
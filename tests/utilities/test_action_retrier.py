@@ -1,5 +1,8 @@
+from py_selenium_auto_core.configurations.retry_configuration import RetryConfiguration
+from py_selenium_auto_core.utilities import action_retrier
 from py_selenium_auto_core.utilities.action_retrier import ActionRetrier
 from tests.applications.browser.browser_services import BrowserServices
+from tests.applications.fake.fake_application import get_settings
 from tests.utilities.test_retrier import TestRetrier
 
 
@@ -66,3 +69,48 @@ class TestActionRetrier(TestRetrier):
             actual_attempts,
             lambda: self.action_retrier.do_with_retry(_predicate, self.handled_exceptions),
         )
+
+    def test_retrier_should_retry_recovered_failure_at_once(self):
+        attempts = [0]
+
+        def _predicate():
+            attempts[0] += 1
+            if attempts[0] == 1:
+                raise ValueError
+            return True
+
+        self.retrier_should_work_once(
+            lambda: self.action_retrier.do_with_retry(_predicate, self.handled_exceptions, recover=lambda e: True)
+        )
+        assert attempts[0] == 2
+
+    def test_retrier_should_wait_polling_interval_if_failure_is_repeated(self):
+        attempts = [0]
+
+        def _predicate():
+            attempts[0] += 1
+            if attempts[0] <= 2:
+                raise ValueError
+            return True
+
+        self.retrier_should_wait_polling_interval(
+            lambda: self.action_retrier.do_with_retry(_predicate, self.handled_exceptions, recover=lambda e: True)
+        )
+        assert attempts[0] == 3
+
+    def test_retrier_should_wait_for_every_repeated_recovered_failure(self, monkeypatch):
+        attempts = [0]
+        sleeps = []
+        monkeypatch.setattr(action_retrier, "sleep", sleeps.append)
+
+        def _predicate():
+            attempts[0] += 1
+            if attempts[0] <= 4:
+                raise ValueError
+            return True
+
+        retrier = ActionRetrier(RetryConfiguration(get_settings(retry={"number": 4, "pollingInterval": 0.1})))
+
+        assert retrier.do_with_retry(_predicate, self.handled_exceptions, recover=lambda e: True)
+        assert attempts[0] == 5
+        assert sleeps == [0.1, 0.1, 0.1]
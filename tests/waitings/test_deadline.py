@@ -0,0 +1,43 @@
+import time
+
+from py_selenium_auto_core.utilities.functional import Timer
+from py_selenium_auto_core.waitings.deadline import Deadline
+from tests.test_without_application import TestWithoutApplication
+
+
+class TestDeadline:
+    def test_no_deadline_outside_of_scope(self):
+        assert Deadline.current() is None
+        assert Deadline.clamp(5) == 5
+
+    def test_nested_scope_does_not_extend_deadline(self):
+        with Deadline.scope(0.5) as outer_deadline:
+            with Deadline.scope(10) as inner_deadline:
+                assert inner_deadline.end_time == outer_deadline.end_time
+                assert Deadline.clamp(10) <= 0.5
+            with Deadline.scope(0.1) as inner_deadline:
+                assert inner_deadline.end_time < outer_deadline.end_time
+            assert Deadline.current() is outer_deadline
+        assert Deadline.current() is None
+
+    def test_unlimited_scope_inherits_deadline(self):
+        with Deadline.scope(0.5) as outer_deadline:
+            with Deadline.scope(None) as inner_deadline:
+                assert inner_deadline.end_time == outer_deadline.end_time
+
+    def test_expired_deadline(self):
+        with Deadline.scope(0) as deadline:
+            time.sleep(0.01)
+            assert deadline.is_expired
+            assert deadline.remaining == 0
+
+
+class TestConditionalWaitDeadline(TestWithoutApplication):
+    def test_nested_wait_does_not_overrun_outer_timeout(self):
+        conditional_wait = self.service_provider.conditional_wait()
+        with Timer() as timer:
+            result = conditional_wait.wait_for_condition(
+                lambda: conditional_wait.wait_for_condition(lambda: False, timeout=5), timeout=0.5
+            )
+        assert not result
+        assert timer.elapsed.total_seconds() < 1, "Nested wait should share the budget of outer one"
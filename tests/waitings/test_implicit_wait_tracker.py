@@ -0,0 +1,54 @@
+import pytest
+from selenium.common import TimeoutException
+
+from py_selenium_auto_core.applications.startup import ServiceProvider
+from tests.applications.fake.fake_application import FakeApplication, configure_services
+
+
+class UntrackedFakeApplication(FakeApplication):
+    """Sends every implicit wait command to the driver, so the commands are deduplicated only by the tracker"""
+
+    def set_implicit_wait_timeout(self, timeout: float):
+        self.implicit_wait = timeout
+        self.driver.implicitly_wait(timeout)
+
+
+class TestImplicitWaitTracker:
+    implicit_timeout: float = 5
+    service_provider: ServiceProvider = None
+    application: FakeApplication = None
+
+    def setup_method(self):
+        self.application = UntrackedFakeApplication()
+        self.service_provider = self._configure_services(explicit_waits_only=False)
+
+    def _configure_services(self, explicit_waits_only: bool) -> ServiceProvider:
+        return configure_services(
+            self.application,
+            timeouts={"timeoutImplicit": self.implicit_timeout, "explicitWaitsOnly": explicit_waits_only},
+        )
+
+    def test_restore_implicit_wait_on_timeout(self):
+        with pytest.raises(TimeoutException):
+            self.service_provider.conditional_wait().wait_for_driver(lambda driver: False, timeout=0)
+        assert self.application.implicit_wait == self.implicit_timeout
+
+    def test_not_toggle_implicit_wait_in_nested_waits(self):
+        conditional_wait = self.service_provider.conditional_wait()
+
+        def _nested_wait(driver):
+            assert self.application.implicit_wait == 0
+            return conditional_wait.wait_for_driver(lambda d: True, timeout=0)
+
+        conditional_wait.wait_for_driver(_nested_wait, timeout=0)
+        assert self.application.driver.implicit_wait_calls == 2, "Only the outermost wait should set and restore it"
+        assert self.application.implicit_wait == self.implicit_timeout
+
+    def test_pin_implicit_wait_in_explicit_waits_only_mode(self):
+        self.service_provider = self._configure_services(explicit_waits_only=True)
+        conditional_wait = self.service_provider.conditional_wait()
+        for _ in range(3):
+            conditional_wait.wait_for_driver(lambda driver: True, timeout=0)
+        assert self.application.implicit_wait == 0
+        assert self.application.driver.implicit_wait_calls == 1, "Timeout should be set once for the whole session"
+        assert self.service_provider.timeout_configuration().implicit == 0
@@ -0,0 +1,78 @@
+import asyncio
+import itertools
+import time
+
+import pytest
+from selenium.common import NoSuchElementException, StaleElementReferenceException, TimeoutException
+
+from py_selenium_auto_core.applications.startup import Startup
+from py_selenium_auto_core.utilities.json_settings_file import JsonSettingsFile
+from py_selenium_auto_core.utilities.functional import Timer
+from py_selenium_auto_core.waitings.polling_strategy import (
+    ExponentialBackoffPollingStrategy,
+    FixedPollingStrategy,
+)
+from tests.applications.fake.fake_application import FakeApplication, configure_services, get_settings
+from tests.test_without_application import TestWithoutApplication
+
+
+class TestPollingStrategy:
+    def test_fixed_strategy_returns_same_interval(self):
+        assert list(itertools.islice(FixedPollingStrategy(0.3).intervals(), 3)) == [0.3, 0.3, 0.3]
+
+    def test_backoff_strategy_grows_up_to_max_interval(self):
+        strategy = ExponentialBackoffPollingStrategy(0.05, multiplier=2, max_interval=0.3)
+        assert list(itertools.islice(strategy.intervals(), 5)) == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+    def test_backoff_strategy_applies_jitter(self):
+        strategy = ExponentialBackoffPollingStrategy(1, multiplier=1, jitter=0.1)
+        assert all(0.9 <= interval <= 1.1 for interval in itertools.islice(strategy.intervals(), 100))
+
+    @pytest.mark.parametrize(
+        argnames=("initial_interval", "multiplier", "jitter"),
+        argvalues=[(-1, 2, 0), (0.05, 0.5, 0), (0.05, 2, 1)],
+    )
+    def test_backoff_strategy_rejects_incorrect_parameters(self, initial_interval, multiplier, jitter):
+        with pytest.raises(ValueError):
+            ExponentialBackoffPollingStrategy(initial_interval, multiplier, jitter=jitter)
+
+
+class TestConditionalWaitPolling(TestWithoutApplication):
+    def test_use_fixed_polling_strategy_by_default(self):
+        assert isinstance(self.service_provider.timeout_configuration().polling_strategy, FixedPollingStrategy)
+
+    def test_return_soon_after_condition_is_satisfied_with_backoff(self):
+        backoff = {"type": "exponentialBackoff", "initialInterval": 0.01, "multiplier": 2, "maxInterval": 0.3}
+        settings = JsonSettingsFile(get_settings(timeouts={"pollingStrategy": backoff}))
+        service_provider = Startup.configure_services(lambda: None, settings)
+        start_time = time.monotonic()
+        with Timer() as timer:
+            service_provider.conditional_wait().wait_for_true(lambda: time.monotonic() - start_time > 0.05, 1)
+        assert timer.elapsed.total_seconds() < 0.2
+
+    def test_clamp_last_interval_to_deadline(self):
+        with Timer() as timer:
+            with pytest.raises(TimeoutException):
+                self.service_provider.conditional_wait().wait_for_true(lambda: False, 0.5, polling_interval=10)
+        assert 0.5 <= timer.elapsed.total_seconds() < 1
+
+    def test_ignore_exceptions_passed_as_tuple(self):
+        service_provider = configure_services(FakeApplication())
+        errors = iter([StaleElementReferenceException(), NoSuchElementException()])
+
+        def _function(driver):
+            error = next(errors, None)
+            if error is not None:
+                raise error
+            return True
+
+        exceptions_to_ignore = (StaleElementReferenceException,)
+        assert service_provider.conditional_wait().wait_for_driver(
+            _function, 1, polling_interval=0.01, exceptions_to_ignore=exceptions_to_ignore
+        )
+        errors = iter([StaleElementReferenceException()])
+        assert asyncio.run(
+            service_provider.async_conditional_wait().wait_for_driver(
+                _function, 1, polling_interval=0.01, exceptions_to_ignore=exceptions_to_ignore
+            )
+        )